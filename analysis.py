@@ -0,0 +1,289 @@
+"""The computations behind main.py's notebook walkthrough, as pipeline stages.
+
+main.py trains six Random Forests: one per target on the full encoded
+dataset, and one per target on a class-balanced sample. Each of them goes
+through the same chain of stages,
+
+    <experiment>.preprocessor -> .features -> .scaled -> .split -> .model -> .evaluation
+
+fed by the shared ``dataset`` -> ``categorized`` stages, or for the balanced
+experiments by their own ``.sample`` stage. The ``.preprocessor`` stage is the
+experiment's fitted preprocessing.Preprocessor (encoding, min-max scaling and
+feature selection); it is fitted once and cached next to the model, and every
+later stage only applies it.
+Outputs are cached on disk by pipeline.py, so a rerun of main.py only
+recomputes the stages downstream of whatever changed (the CSV, a parameter in
+EXPERIMENTS or a stage function). Any edit to this module or to the modules
+its stages call (CODE_MODULES), or a new pandas, NumPy or scikit-learn,
+invalidates every stage.
+
+Stage outputs are shared between reruns; copy them before modifying.
+
+The same numbers can be produced without Streamlit: ``python main.py
+--headless`` (or ``python analysis.py``) evaluates every experiment as plain
+Python, skips the tables and charts, and writes a JSON bundle of metrics,
+feature importances and stage timings (see results_bundle()).
+
+    python analysis.py                           # print timings and accuracies
+    python analysis.py --output results.json     # also write the results bundle
+    python analysis.py --output - --cold         # bundle to stdout, nothing cached
+"""
+import argparse
+import json
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+import sklearn
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.metrics import accuracy_score, classification_report
+from sklearn.model_selection import train_test_split
+
+import atomic_io
+import data_store
+import dataset_resolver
+import pipeline
+import preprocessing
+import sampling
+import vocabularies
+
+# Modules whose code the stages run; part of every stage key
+CODE_MODULES = [sys.modules[__name__], data_store, dataset_resolver, preprocessing, sampling, vocabularies]
+
+RESULTS_FORMAT_VERSION = 1
+RANDOM_STATE = 42
+
+# Columns re-encoded on each balanced sample
+BALANCED_ENCODED_COLUMNS = {
+    'Job_encoded': 'Job_Title',
+    'Industry_encoded': 'Industry',
+    'Location_encoded': 'Location',
+    'Skills_encoded': 'Required_Skills',
+}
+
+EXPERIMENTS = {
+    'automation': {
+        'target': 'Automation_Risk',
+        'label': 'Automation_encoded',
+        'features': ['Job_encoded', 'Industry_encoded', 'Size_encoded', 'Location_encoded', 'AI_Adoption_encoded', 'Skills_encoded', 'Remote_encoded', 'Growth_encoded', 'Salary_USD'],
+        'test_size': 0.1,
+    },
+    'automation_balanced': {
+        'target': 'Automation_Risk',
+        'classes': ['Medium', 'High'],
+        'per_class': 169,
+        'label': 'Automation_Risk_encoded',
+        'features': ['Salary_USD', 'Industry_encoded', 'Job_encoded', 'Location_encoded', 'Skills_encoded'],
+        'test_size': 0.1,
+    },
+    'growth': {
+        'target': 'Job_Growth_Projection',
+        'label': 'Growth_encoded',
+        'features': ['Job_encoded', 'Industry_encoded', 'Size_encoded', 'Location_encoded', 'AI_Adoption_encoded', 'Skills_encoded', 'Remote_encoded', 'Salary_USD', 'Automation_encoded'],
+        'test_size': 0.1,
+    },
+    'growth_balanced': {
+        'target': 'Job_Growth_Projection',
+        'classes': ['Growth', 'Decline'],
+        'per_class': 169,
+        'label': 'Growth_encoded',
+        'features': ['Salary_USD', 'Industry_encoded', 'Job_encoded', 'Location_encoded', 'Skills_encoded'],
+        'test_size': 0.3,
+    },
+    'salary': {
+        'target': 'Salary_Category',
+        'label': 'Salary_encoded',
+        'features': ['Job_encoded', 'Industry_encoded', 'Size_encoded', 'Location_encoded', 'AI_Adoption_encoded', 'Skills_encoded', 'Remote_encoded', 'Automation_encoded', 'Growth_encoded'],
+        'test_size': 0.3,
+    },
+    'salary_balanced': {
+        'target': 'Salary_Category',
+        'classes': ['Mid Level', 'Senior Level'],
+        'per_class': 172,
+        'label': 'Salary_encoded',
+        'features': ['Job_encoded', 'Industry_encoded', 'Location_encoded', 'Skills_encoded'],
+        'test_size': 0.3,
+    },
+}
+
+
+# Stage functions
+
+def load(path, version):
+    # ``version`` is only part of the stage key, so a changed CSV is reloaded
+    return dataset_resolver.load_dataframe(path)
+
+
+def categorize(df):
+    df = df.copy()
+    # Same bins as the dashboard; plain strings, like the other columns here
+    df['Salary_Category'] = data_store.categorize_salary(df['Salary_USD']).astype(object)
+    return df
+
+
+def encode(df):
+    """Label-encode every categorical column, plus Salary_Category (df_data)."""
+    columns = [*vocabularies.ENCODED_COLUMNS.values(), 'Salary_USD']
+    return preprocessing.Preprocessor.fit(df, columns).encode(df)
+
+
+def balance(df, target, classes, per_class, random_state):
+    """``per_class`` rows of each of ``classes``, in order of decreasing class frequency."""
+    return sampling.stratified_sample(df, target, per_class, classes, random_state)
+
+
+def fit_preprocessor(df, features, target, label):
+    return preprocessing.Preprocessor.fit(df, features, target, label=label, scale=True)
+
+
+def encode_sample(preprocessor, df):
+    """The balanced sample with its target and features encoded by the experiment's preprocessor."""
+    data = df.copy()
+    data[preprocessor.label] = preprocessor.encode_target(df)
+    data[preprocessor.features] = preprocessor.encode(df)
+    return data
+
+
+def select(preprocessor, df):
+    return preprocessor.encode(df), preprocessor.encode_target(df)
+
+
+def scale(preprocessor, selected):
+    X, Y = selected
+    return preprocessor.scale_encoded(X), Y
+
+
+def split(scaled, test_size, random_state):
+    X, Y = scaled
+    return tuple(train_test_split(X, Y, test_size=test_size, random_state=random_state))
+
+
+def fit(split_data, random_state):
+    X_train, X_test, Y_train, Y_test = split_data
+    clf = RandomForestClassifier(random_state=random_state)
+    clf.fit(X_train, Y_train)
+    return clf
+
+
+def evaluate(clf, split_data, preprocessor):
+    X_train, X_test, Y_train, Y_test = split_data
+    Y_pred = clf.predict(X_test)
+    importance_df = pd.DataFrame({
+        'Feature': X_train.columns,
+        'Importance': clf.feature_importances_
+    })
+    return {
+        'Y_pred': Y_pred,
+        'accuracy': accuracy_score(Y_test, Y_pred),
+        'classification_report': classification_report(Y_test, Y_pred, target_names=preprocessor.target_classes),
+        'report': classification_report(Y_test, Y_pred, target_names=preprocessor.target_classes, output_dict=True),
+        'importance_df': importance_df.sort_values(by='Importance', ascending=False).reset_index(drop=True),
+    }
+
+
+def build_pipeline(path=None):
+    """The stages of every experiment in EXPERIMENTS, reading the resolved dataset."""
+    path = dataset_resolver.resolve(path)
+    stages = [
+        pipeline.Stage('dataset', load, params={'path': path, 'version': data_store.data_version(path)}),
+        pipeline.Stage('categorized', categorize, ['dataset']),
+        pipeline.Stage('encoded', encode, ['categorized']),
+    ]
+    for name, spec in EXPERIMENTS.items():
+        source = 'categorized'
+        preprocessor = f"{name}.preprocessor"
+        if 'classes' in spec:
+            source = f"{name}.sample"
+            stages.append(pipeline.Stage(source, balance, ['categorized'], {'target': spec['target'], 'classes': spec['classes'], 'per_class': spec['per_class'], 'random_state': RANDOM_STATE}))
+        stages.append(pipeline.Stage(preprocessor, fit_preprocessor, [source], {'features': spec['features'], 'target': spec['target'], 'label': spec['label']}))
+        if 'classes' in spec:
+            stages.append(pipeline.Stage(f"{name}.encoded", encode_sample, [preprocessor, source]))
+        stages += [
+            pipeline.Stage(f"{name}.features", select, [preprocessor, source]),
+            pipeline.Stage(f"{name}.scaled", scale, [preprocessor, f"{name}.features"]),
+            pipeline.Stage(f"{name}.split", split, [f"{name}.scaled"], {'test_size': spec['test_size'], 'random_state': RANDOM_STATE}),
+            pipeline.Stage(f"{name}.model", fit, [f"{name}.split"], {'random_state': RANDOM_STATE}),
+            pipeline.Stage(f"{name}.evaluation", evaluate, [f"{name}.model", f"{name}.split", preprocessor]),
+        ]
+    version = pipeline.code_version(CODE_MODULES, [np.__version__, pd.__version__, sklearn.__version__])
+    return pipeline.Pipeline(stages, version=version)
+
+
+def results_bundle(analysis):
+    """Metrics, feature importances and stage timings of every experiment, as plain JSON types.
+
+    Only the stages an evaluation needs are looked up; the display-only
+    stages main.py draws (``encoded``, ``<experiment>.encoded``) are skipped.
+    """
+    experiments = {}
+    for name, spec in EXPERIMENTS.items():
+        evaluation = analysis.get(f"{name}.evaluation")
+        X_train, X_test, Y_train, Y_test = analysis.get(f"{name}.split")
+        experiments[name] = {
+            'target': spec['target'],
+            'features': spec['features'],
+            'test_size': spec['test_size'],
+            'rows_train': len(X_train),
+            'rows_test': len(X_test),
+            'accuracy': float(evaluation['accuracy']),
+            'classification_report': evaluation['report'],
+            'feature_importances': [
+                {'Feature': row.Feature, 'Importance': float(row.Importance)}
+                for row in evaluation['importance_df'].itertuples()
+            ],
+        }
+
+    dataset = analysis.stages['dataset'].params
+    return {
+        'format_version': RESULTS_FORMAT_VERSION,
+        'generated_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'dataset': {'path': dataset['path'], 'data_version': dataset['version']},
+        'random_state': RANDOM_STATE,
+        'sklearn_version': sklearn.__version__,
+        'experiments': experiments,
+        'timings': {'stages': analysis.timing_summary()},
+    }
+
+
+def write_bundle(bundle, path):
+    if path == '-':
+        json.dump(bundle, sys.stdout, indent=2)
+        sys.stdout.write('\n')
+        return
+    atomic_io.write_json(path, bundle, indent=2)
+
+
+def main(argv=None):
+    """Evaluate every experiment headlessly; used by ``python analysis.py`` and ``python main.py --headless``."""
+    parser = argparse.ArgumentParser(description="Run main.py's stages without Streamlit and report the results.")
+    parser.add_argument('--csv', default=None, help='dataset CSV (default: resolved by dataset_resolver)')
+    parser.add_argument('--output', default=None, help="write the JSON results bundle to this file ('-' for stdout)")
+    parser.add_argument('--cold', action='store_true', help='ignore the stage cache and recompute everything')
+    parser.add_argument('--headless', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    with tempfile.TemporaryDirectory() as cold_dir:
+        analysis = build_pipeline(args.csv)
+        if args.cold:
+            pipeline.clear_memory()
+            analysis.cache_dir = cold_dir
+        bundle = results_bundle(analysis)
+    bundle['timings']['total_seconds'] = round(time.perf_counter() - start, 4)
+
+    if args.output is not None:
+        write_bundle(bundle, args.output)
+    if args.output != '-':
+        with pd.option_context('display.max_rows', None):
+            print(pd.DataFrame(bundle['timings']['stages']).to_string(index=False))
+        for name, result in bundle['experiments'].items():
+            print(f"{name}: accuracy {result['accuracy'] * 100:.2f}%")
+        print(f"Total: {bundle['timings']['total_seconds']:.2f}s")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,67 @@
+"""Atomic writes for the files and directories the project generates.
+
+Snapshots, models, vocabularies, lookup tables, images and tile pyramids are
+all read by other processes (the dashboard, batch workers) while they may be
+rebuilt. Each is written under a process-unique temporary name next to its
+final path and then renamed into place with os.replace, so a reader sees
+either the old version or the new one, never a partial write. A write that
+fails leaves the previous version alone and removes its temporary file.
+"""
+import contextlib
+import json
+import os
+import shutil
+
+
+def temporary_path(path, suffix='tmp'):
+    return f"{path}.{os.getpid()}.{suffix}"
+
+
+@contextlib.contextmanager
+def atomic_path(path):
+    """Yield a temporary path to write; it replaces ``path`` when the block succeeds."""
+    tmp_path = temporary_path(path)
+    try:
+        yield tmp_path
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(tmp_path)
+        raise
+
+
+@contextlib.contextmanager
+def atomic_open(path, mode='w'):
+    """Like open(path, mode) for writing, but ``path`` only changes once the file is closed."""
+    with atomic_path(path) as tmp_path:
+        with open(tmp_path, mode) as f:
+            yield f
+
+
+def write_json(path, payload, **kwargs):
+    with atomic_open(path) as f:
+        json.dump(payload, f, **kwargs)
+
+
+@contextlib.contextmanager
+def atomic_directory(path):
+    """Yield an empty temporary directory that replaces the directory ``path`` as a whole.
+
+    A reader never sees a mix of files from two versions.
+    """
+    tmp_path = temporary_path(path)
+    shutil.rmtree(tmp_path, ignore_errors=True)
+    os.makedirs(tmp_path)
+    try:
+        yield tmp_path
+    except BaseException:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        raise
+
+    if os.path.exists(path):
+        old_path = temporary_path(path, 'old')
+        os.replace(path, old_path)
+        os.replace(tmp_path, path)
+        shutil.rmtree(old_path)
+    else:
+        os.replace(tmp_path, path)
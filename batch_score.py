@@ -0,0 +1,77 @@
+"""Score a large CSV of job postings from the command line.
+
+The input is streamed in chunks and the chunks are scored by a pool of worker
+processes. Results are written in input order with the predicted label and the
+probability of every class for each model, and throughput is reported at the end.
+
+    python batch_score.py postings.csv predictions.csv --workers 8
+
+On platforms that fork, the models are loaded once in the parent and the
+workers share those pages copy-on-write (see model_registry.pool_context).
+Elsewhere every worker loads its own copy of each model.
+"""
+import argparse
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import model_registry
+import scoring
+
+
+def _init_worker(models):
+    for name in models:
+        model_registry.get_model(name)
+
+
+def _score_chunk(chunk, models):
+    return scoring.score_frame(chunk, models, probabilities=True)
+
+
+def _write(scored, output, first):
+    scored.to_csv(output, mode='w' if first else 'a', header=first, index=False)
+    return len(scored)
+
+
+def score_file(input_path, output_path, models=tuple(scoring.PREDICTION_COLUMNS), chunksize=scoring.CHUNK_ROWS, workers=None):
+    """Score ``input_path`` into ``output_path`` and return (rows, seconds)."""
+    workers = workers or os.cpu_count() or 1
+    start = time.perf_counter()
+    chunks = scoring.read_chunks(input_path, chunksize)
+    rows = 0
+
+    if workers == 1:
+        for scored in scoring.score_chunks(chunks, models, probabilities=True):
+            rows += _write(scored, output_path, rows == 0)
+        return rows, time.perf_counter() - start
+
+    context = model_registry.pool_context(models)
+    with ProcessPoolExecutor(workers, mp_context=context, initializer=_init_worker, initargs=(models,)) as pool:
+        # Bound the chunks in flight so the whole file is never held in memory
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(_score_chunk, chunk, models))
+            if len(pending) >= workers * 2:
+                rows += _write(pending.popleft().result(), output_path, rows == 0)
+        while pending:
+            rows += _write(pending.popleft().result(), output_path, rows == 0)
+
+    return rows, time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Score a CSV of job postings with the trained Random Forest models.')
+    parser.add_argument('input', help='CSV in the data/AI.csv schema')
+    parser.add_argument('output', help='where to write the scored CSV')
+    parser.add_argument('--models', nargs='+', default=list(scoring.PREDICTION_COLUMNS), choices=list(scoring.PREDICTION_COLUMNS))
+    parser.add_argument('--chunksize', type=int, default=scoring.CHUNK_ROWS, help='rows per chunk')
+    parser.add_argument('--workers', type=int, default=None, help='worker processes (default: all cores)')
+    args = parser.parse_args()
+
+    try:
+        rows, seconds = score_file(args.input, args.output, tuple(args.models), args.chunksize, args.workers)
+    except ValueError as e:
+        sys.exit(f"error: {e}")
+    print(f"Scored {rows:,} rows in {seconds:.2f}s ({rows / seconds if seconds else 0:,.0f} rows/s) -> {args.output}")
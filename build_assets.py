@@ -0,0 +1,217 @@
+"""Regenerate the forest and single-tree images in assets/ from the trained models.
+
+Each model has two images: a 10x10 grid of all of its trees
+(assets/<prefix>Tree.png) and its first tree on its own
+(assets/<prefix>SingleTree.png). The grid is drawn at TILE_DPI and also cut
+into a zoomable tile pyramid under assets/tiles/<prefix>/ (see tiles.py); the
+PNG is a downscaled copy of it. assets/manifest.json (and each pyramid's
+meta.json) records the SHA-256 of the model file every image was drawn from,
+so only images whose model has changed since are redrawn. The tiles are a
+local build product and are not checked in.
+
+The trees of a grid are drawn one per task on a process pool and stitched
+together in the parent, and every image is written to a temporary file and
+renamed into place.
+
+    python build_assets.py                 # redraw stale images
+    python build_assets.py growth --force  # redraw one model's images
+"""
+import argparse
+import io
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from PIL import Image
+from sklearn.tree import plot_tree
+
+import atomic_io
+import data_store
+import model_registry
+import tiles
+
+ASSET_DIR = os.path.join(model_registry.BASE_DIR, 'assets')
+TILE_DIR = os.path.join(ASSET_DIR, 'tiles')
+MANIFEST_PATH = os.path.join(ASSET_DIR, 'manifest.json')
+
+# Model name -> file name prefix of its images
+ASSET_PREFIXES = {
+    'automation': 'automationRisk',
+    'growth': 'jobGrowth',
+    'salary': 'salary',
+    'salary2nd': 'salary2nd',
+}
+
+# The forest grid: GRID_SIZE x GRID_SIZE trees of CELL_INCHES at GRID_DPI, as in the notebook
+GRID_SIZE = 10
+CELL_INCHES = 2.0
+GRID_DPI = 50
+
+# Resolution the grid is actually drawn at, which is the deepest zoom level of its tiles.
+# Drawing time is dominated by text layout, so this costs little over GRID_DPI.
+TILE_DPI = 200
+
+SINGLE_TREE_FIGSIZE = (20, 10)
+SINGLE_TREE_DPI = 80
+
+
+def model_hash(name):
+    return data_store.file_hash(model_registry.model_path(name))
+
+
+def asset_paths(name):
+    prefix = ASSET_PREFIXES[name]
+    return {
+        'forest': os.path.join(ASSET_DIR, f"{prefix}Tree.png"),
+        'single': os.path.join(ASSET_DIR, f"{prefix}SingleTree.png"),
+    }
+
+
+def tile_path(name):
+    return os.path.join(TILE_DIR, ASSET_PREFIXES[name])
+
+
+def _manifest_key(path):
+    return os.path.relpath(path, ASSET_DIR).replace(os.sep, '/')
+
+
+def load_manifest():
+    if not os.path.exists(MANIFEST_PATH):
+        return {}
+    with open(MANIFEST_PATH) as f:
+        return json.load(f)
+
+
+def write_manifest(manifest):
+    atomic_io.write_json(MANIFEST_PATH, manifest, indent=2, sort_keys=True)
+
+
+def stale_assets(names=tuple(ASSET_PREFIXES), manifest=None):
+    """(model, kind) pairs whose image is missing or was drawn from another model file."""
+    manifest = load_manifest() if manifest is None else manifest
+    stale = []
+    for name in names:
+        digest = model_hash(name)
+        for kind, path in asset_paths(name).items():
+            if not os.path.exists(path) or manifest.get(_manifest_key(path)) != digest:
+                stale.append((name, kind))
+            elif kind == 'forest' and (tiles.read_meta(tile_path(name)) or {}).get('model_hash') != digest:
+                # The tiles are cut from the same drawing as the grid PNG
+                stale.append((name, kind))
+    return stale
+
+
+def _figure_pixels(figure):
+    canvas = figure.canvas
+    canvas.draw()
+    return np.asarray(canvas.buffer_rgba()).copy()
+
+
+def render_cell(name, index):
+    """One tree of the forest grid, as an RGBA array."""
+    clf = model_registry.get_model(name)
+    figure = Figure(figsize=(CELL_INCHES, CELL_INCHES), dpi=TILE_DPI)
+    FigureCanvasAgg(figure)
+    ax = figure.add_subplot()
+    plot_tree(clf.estimators_[index], feature_names=list(clf.feature_names_in_), filled=True, rounded=True, ax=ax)
+    ax.set_title(f"Tree {index + 1}", fontsize=6)
+    ax.axis('off')  # Turn off axis to reduce clutter
+    figure.tight_layout()
+    return index, _figure_pixels(figure)
+
+
+def render_single_tree(name, index=0):
+    """A single tree drawn large, as PNG bytes."""
+    clf = model_registry.get_model(name)
+    figure = Figure(figsize=SINGLE_TREE_FIGSIZE, dpi=SINGLE_TREE_DPI)
+    FigureCanvasAgg(figure)
+    ax = figure.add_subplot()
+    plot_tree(clf.estimators_[index], feature_names=list(clf.feature_names_in_), filled=True, rounded=True, ax=ax)
+    buffer = io.BytesIO()
+    figure.savefig(buffer, format='png')
+    return buffer.getvalue()
+
+
+def stitch(cells, n_trees):
+    """Lay the per-tree arrays out in the forest grid."""
+    height, width, channels = cells[0].shape
+    grid = np.full((GRID_SIZE * height, GRID_SIZE * width, channels), 255, dtype=np.uint8)
+    for index in range(min(n_trees, GRID_SIZE * GRID_SIZE)):
+        row, col = divmod(index, GRID_SIZE)
+        grid[row * height:(row + 1) * height, col * width:(col + 1) * width] = cells[index]
+    return Image.fromarray(grid, 'RGBA')
+
+
+def save_png(image_or_bytes, path):
+    with atomic_io.atomic_path(path) as tmp_path:
+        if isinstance(image_or_bytes, bytes):
+            with open(tmp_path, 'wb') as f:
+                f.write(image_or_bytes)
+        else:
+            image_or_bytes.save(tmp_path, format='PNG', optimize=True)
+
+
+def build(names=tuple(ASSET_PREFIXES), force=False, workers=None):
+    """Redraw the stale images of ``names`` and return the paths written."""
+    manifest = load_manifest()
+    todo = [(name, kind) for name in names for kind in asset_paths(name)] if force else stale_assets(names, manifest)
+    if not todo:
+        return []
+
+    workers = workers or os.cpu_count() or 1
+    models = sorted({name for name, _ in todo})
+
+    context = model_registry.pool_context(models)
+
+    written = []
+    with ProcessPoolExecutor(workers, mp_context=context) as pool:
+        # Submit every tree of every stale image at once so the pool stays busy
+        singles = {name: pool.submit(render_single_tree, name) for name, kind in todo if kind == 'single'}
+        forests = {}
+        for name, kind in todo:
+            if kind == 'forest':
+                n_trees = min(len(model_registry.get_model(name).estimators_), GRID_SIZE * GRID_SIZE)
+                forests[name] = [pool.submit(render_cell, name, index) for index in range(n_trees)]
+
+        for name, futures in forests.items():
+            cells = dict(future.result() for future in futures)
+            grid = stitch(cells, len(cells))
+            digest = model_hash(name)
+            tiles.write_pyramid(grid, tile_path(name), {'model_hash': digest})
+            written.append(tile_path(name))
+
+            path = asset_paths(name)['forest']
+            scale = GRID_DPI / TILE_DPI
+            save_png(grid.resize((round(grid.width * scale), round(grid.height * scale)), Image.LANCZOS), path)
+            manifest[_manifest_key(path)] = digest
+            written.append(path)
+        for name, future in singles.items():
+            path = asset_paths(name)['single']
+            save_png(future.result(), path)
+            manifest[_manifest_key(path)] = model_hash(name)
+            written.append(path)
+
+    write_manifest(manifest)
+    return written
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Redraw the tree images in assets/ for models that changed.')
+    parser.add_argument('models', nargs='*', help=f"models to check (default: all of {', '.join(ASSET_PREFIXES)})")
+    parser.add_argument('--force', action='store_true', help='redraw even if the images are up to date')
+    parser.add_argument('--workers', type=int, default=None, help='worker processes (default: all cores)')
+    args = parser.parse_args()
+
+    unknown = [name for name in args.models if name not in ASSET_PREFIXES]
+    if unknown:
+        parser.error(f"unknown model(s): {', '.join(unknown)}")
+
+    start = time.perf_counter()
+    written = build(tuple(args.models) or tuple(ASSET_PREFIXES), args.force, args.workers)
+    for path in written:
+        print(f"Wrote {os.path.relpath(path, model_registry.BASE_DIR)}")
+    print(f"{len(written)} asset(s) written in {time.perf_counter() - start:.1f}s" if written else "All images are up to date.")
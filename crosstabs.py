@@ -0,0 +1,90 @@
+"""Target x attribute crosstabs of the dataset for the EDA page.
+
+Every categorical column (and Salary_USD, cut into fixed-width bands) is
+turned into integer codes once, and each target x attribute table is then a
+single np.bincount over the combined codes. The tables are cached per data
+version, so the charts built from them carry one cell per category pair
+instead of one point per row.
+"""
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+
+import data_store
+
+TARGET_COLUMNS = ['Automation_Risk', 'Job_Growth_Projection', 'Salary_Category']
+ATTRIBUTE_COLUMNS = data_store.CATEGORICAL_COLUMNS + ['Salary_USD']
+
+# Width of the Salary_USD bands used as categories
+SALARY_BAND_USD = 20000
+
+_tables = {}
+_lock = threading.Lock()
+
+
+def salary_bands(salary_usd, width=SALARY_BAND_USD):
+    # Bands are closed on the left, so the top edge lies a band above the maximum's band start
+    low = np.floor(salary_usd.min() / width) * width
+    high = np.floor(salary_usd.max() / width) * width + width
+    edges = low + width * np.arange(round((high - low) / width) + 1)
+    labels = [f"${start / 1000:,.0f}k–${stop / 1000:,.0f}k" for start, stop in zip(edges[:-1], edges[1:])]
+    return pd.cut(salary_usd, bins=edges, labels=labels, right=False, include_lowest=True)
+
+
+def column_codes(df, column):
+    """Integer codes and category labels of ``column``; -1 marks missing values."""
+    values = salary_bands(df[column]) if column == 'Salary_USD' else df[column].astype('category')
+    return values.cat.codes.to_numpy(), list(values.cat.categories)
+
+
+def build_crosstabs(df, targets=TARGET_COLUMNS, attributes=ATTRIBUTE_COLUMNS):
+    """Count tables for every (target, attribute) pair, indexed by attribute and target category."""
+    codes = {column: column_codes(df, column) for column in dict.fromkeys(targets + attributes)}
+    tables = {}
+    for target in targets:
+        target_codes, target_labels = codes[target]
+        for attribute in attributes:
+            if attribute == target:
+                continue
+            attribute_codes, attribute_labels = codes[attribute]
+            valid = (target_codes >= 0) & (attribute_codes >= 0)
+            cells = attribute_codes[valid].astype(np.int64) * len(target_labels) + target_codes[valid]
+            counts = np.bincount(cells, minlength=len(attribute_labels) * len(target_labels))
+            tables[(target, attribute)] = pd.DataFrame(
+                counts.reshape(len(attribute_labels), len(target_labels)),
+                index=pd.Index(attribute_labels, name=attribute),
+                columns=pd.Index(target_labels, name=target),
+            )
+    return tables
+
+
+def crosstabs(csv_path=data_store.CSV_PATH):
+    """Return all crosstabs of the dataset, computed once per data version."""
+    version = data_store.data_version(csv_path)
+    key = (os.path.abspath(csv_path), version)
+    tables = _tables.get(key)
+    if tables is not None:
+        return tables
+
+    df = data_store.load_dataset(csv_path)
+    with _lock:
+        tables = _tables.get(key)
+        if tables is None:
+            tables = build_crosstabs(df)
+            _tables.clear()
+            _tables[key] = tables
+    return tables
+
+
+def crosstab(target, attribute, percent=False, csv_path=data_store.CSV_PATH):
+    """Counts of ``target`` classes per ``attribute`` category.
+
+    With ``percent`` each attribute category's row is shown as percentages of its total.
+    """
+    table = crosstabs(csv_path)[(target, attribute)]
+    if percent:
+        totals = table.sum(axis=1).replace(0, 1)
+        table = table.div(totals, axis=0) * 100
+    return table
@@ -0,0 +1,176 @@
+"""Columnar snapshot of the AI-Powered Job Market Insights CSV.
+
+The CSV is parsed once into a Parquet file with categorical dtypes for every
+string column and a precomputed Salary_Category. Snapshots are named after the
+CSV's content hash, so editing the CSV produces a new snapshot and the old one
+is discarded. Within a process the loaded frame is kept in memory as well,
+together with an index of the rows belonging to each class of the target
+columns.
+
+Run ``python data_store.py`` to build the snapshot ahead of time.
+"""
+import hashlib
+import os
+import sys
+import threading
+
+import numpy as np
+import pandas as pd
+
+import atomic_io
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CSV_PATH = os.path.join(BASE_DIR, 'data', 'AI.csv')
+SNAPSHOT_DIR = os.path.join(BASE_DIR, 'data', 'snapshots')
+
+CATEGORICAL_COLUMNS = [
+    'Job_Title',
+    'Industry',
+    'Company_Size',
+    'Location',
+    'AI_Adoption_Level',
+    'Automation_Risk',
+    'Required_Skills',
+    'Remote_Friendly',
+    'Job_Growth_Projection',
+]
+
+SALARY_BINS = [-np.inf, 50000, 100000, 200000]
+SALARY_LABELS = ['Entry Level', 'Mid Level', 'Senior Level']
+
+# Columns whose classes the dashboard lists rows for
+INDEXED_COLUMNS = ['Automation_Risk', 'Job_Growth_Projection', 'Salary_Category']
+
+_hashes = {}
+_frames = {}
+_indexes = {}
+_lock = threading.Lock()
+
+
+def categorize_salary(salary_usd):
+    # Vectorized version of the original per-row categorize_salary
+    return pd.cut(salary_usd, bins=SALARY_BINS, labels=SALARY_LABELS, right=False)
+
+
+def file_hash(path=CSV_PATH):
+    """SHA-256 of the file contents, recomputed only when the file changes."""
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+    digest = _hashes.get(key)
+    if digest is None:
+        sha = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                sha.update(block)
+        digest = sha.hexdigest()
+        _hashes[key] = digest
+    return digest
+
+
+def data_version(csv_path=CSV_PATH):
+    return file_hash(csv_path)[:16]
+
+
+def snapshot_path(csv_path=CSV_PATH):
+    stem = os.path.splitext(os.path.basename(csv_path))[0]
+    return os.path.join(SNAPSHOT_DIR, f"{stem}-{data_version(csv_path)}.parquet")
+
+
+def read_csv_typed(csv_path=CSV_PATH):
+    df = pd.read_csv(csv_path, dtype={col: 'category' for col in CATEGORICAL_COLUMNS})
+    df['Salary_Category'] = categorize_salary(df['Salary_USD'])
+    return df
+
+
+def build_snapshot(csv_path=CSV_PATH):
+    """Write the snapshot for ``csv_path`` if it does not exist yet and return its path."""
+    path = snapshot_path(csv_path)
+    if os.path.exists(path):
+        return path
+
+    os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+    df = read_csv_typed(csv_path)
+
+    # Write to a temporary file first so readers never see a partial snapshot
+    with atomic_io.atomic_path(path) as tmp_path:
+        df.to_parquet(tmp_path, index=False)
+
+    # Drop snapshots of older versions of the same CSV
+    prefix = os.path.basename(path).rsplit('-', 1)[0] + '-'
+    for name in os.listdir(SNAPSHOT_DIR):
+        old = os.path.join(SNAPSHOT_DIR, name)
+        if name.startswith(prefix) and name.endswith('.parquet') and old != path:
+            os.remove(old)
+    return path
+
+
+def load_dataset(csv_path=CSV_PATH):
+    """Return the typed dataset, building the snapshot if the CSV changed.
+
+    The frame is shared by every caller in the process, so treat it as
+    read-only and copy it before adding or modifying columns.
+    """
+    version = data_version(csv_path)
+    key = (os.path.abspath(csv_path), version)
+    df = _frames.get(key)
+    if df is not None:
+        return df
+
+    with _lock:
+        df = _frames.get(key)
+        if df is None:
+            df = pd.read_parquet(build_snapshot(csv_path))
+            _frames.clear()
+            _frames[key] = df
+    return df
+
+
+def build_category_index(df, columns=INDEXED_COLUMNS):
+    """Map every (column, category) to the ascending row positions holding it."""
+    index = {}
+    for column in columns:
+        values = df[column].astype('category')
+        codes = values.cat.codes.to_numpy()
+        # One stable sort groups the positions of each category, still in row order
+        order = np.argsort(codes, kind='stable')
+        counts = np.bincount(codes[codes >= 0], minlength=len(values.cat.categories))
+        bounds = np.cumsum(counts)
+        start = len(codes) - bounds[-1] if len(bounds) else len(codes)  # skip missing values (-1)
+        for category, stop in zip(values.cat.categories, bounds + start):
+            index[(column, category)] = order[start:stop]
+            start = stop
+    return index
+
+
+def category_index(csv_path=CSV_PATH):
+    """Return the category index of the dataset, built once per data version."""
+    version = data_version(csv_path)
+    key = (os.path.abspath(csv_path), version)
+    index = _indexes.get(key)
+    if index is not None:
+        return index
+
+    df = load_dataset(csv_path)
+    with _lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = build_category_index(df)
+            _indexes.clear()
+            _indexes[key] = index
+    return index
+
+
+def class_rows(column, category, n=None, csv_path=CSV_PATH):
+    """Rows of the dataset where ``column`` equals ``category``, optionally only the first ``n``."""
+    positions = category_index(csv_path).get((column, category), np.empty(0, dtype=np.intp))
+    return load_dataset(csv_path).iloc[positions[:n]]
+
+
+if __name__ == '__main__':
+    csv_path = sys.argv[1] if len(sys.argv) > 1 else CSV_PATH
+    path = build_snapshot(csv_path)
+    df = load_dataset(csv_path)
+    csv_mb = pd.read_csv(csv_path).memory_usage(deep=True).sum() / 1024 ** 2
+    snapshot_mb = df.memory_usage(deep=True).sum() / 1024 ** 2
+    print(f"Snapshot: {path}")
+    print(f"Rows: {len(df)}  In-memory size: {snapshot_mb:.2f} MB (plain CSV frame: {csv_mb:.2f} MB)")
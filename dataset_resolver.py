@@ -0,0 +1,116 @@
+"""Find the job market CSV for main.py without going to the network.
+
+main.py used to call kagglehub.dataset_download on every start. The dataset is
+now resolved locally, in this order:
+
+1. a path passed to resolve() or set in the JOB_MARKET_CSV environment variable;
+2. the local cache, data/AI.csv.
+
+The cached copy is checked against data/AI.csv.sha256 (``sha256sum -c``
+format), so a truncated or replaced file is refused instead of being analysed.
+Kaggle is only contacted when a download is asked for explicitly, with
+``allow_download=True`` or JOB_MARKET_DOWNLOAD=1, and only if there is no
+cached copy; the downloaded file is verified and copied into the cache.
+
+    python dataset_resolver.py                    # check the local copy
+    python dataset_resolver.py --download         # fetch from Kaggle if missing
+    python dataset_resolver.py --update-checksum  # accept the current data/AI.csv
+"""
+import argparse
+import os
+import shutil
+
+import atomic_io
+import data_store
+
+KAGGLE_DATASET = 'uom190346a/ai-powered-job-market-insights'
+KAGGLE_FILE = 'ai_job_market_insights.csv'
+
+CACHE_PATH = data_store.CSV_PATH
+CHECKSUM_PATH = f"{CACHE_PATH}.sha256"
+
+
+def expected_hash(checksum_path=CHECKSUM_PATH):
+    if not os.path.exists(checksum_path):
+        return None
+    with open(checksum_path) as f:
+        return f.read().split()[0]
+
+
+def write_checksum(csv_path=CACHE_PATH, checksum_path=CHECKSUM_PATH):
+    with atomic_io.atomic_open(checksum_path) as f:
+        f.write(f"{data_store.file_hash(csv_path)}  {os.path.basename(csv_path)}\n")
+
+
+def verify(csv_path=CACHE_PATH, checksum_path=CHECKSUM_PATH):
+    """Raise ValueError if ``csv_path`` does not match its recorded checksum."""
+    expected = expected_hash(checksum_path)
+    if expected is not None and data_store.file_hash(csv_path) != expected:
+        raise ValueError(
+            f"{csv_path} does not match {os.path.basename(checksum_path)}. "
+            "Restore the file, or run `python dataset_resolver.py --update-checksum` if the change is intended."
+        )
+
+
+def download():
+    """Fetch the dataset from Kaggle into the local cache and return the cached path."""
+    import kagglehub  # Only needed for an explicit download
+
+    source = os.path.join(kagglehub.dataset_download(KAGGLE_DATASET), KAGGLE_FILE)
+    verify(source)
+
+    os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+    with atomic_io.atomic_path(CACHE_PATH) as tmp_path:
+        shutil.copyfile(source, tmp_path)
+    if expected_hash() is None:
+        write_checksum()
+    return CACHE_PATH
+
+
+def resolve(path=None, allow_download=None):
+    """Return the path of the dataset CSV, never touching the network unless allowed.
+
+    An explicitly configured ``path`` (or JOB_MARKET_CSV) is used as is; the
+    cached copy is verified against its checksum first.
+    """
+    path = path or os.environ.get('JOB_MARKET_CSV')
+    if path:
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Dataset not found at {path} (set by JOB_MARKET_CSV or the caller)")
+        return path
+
+    if os.path.exists(CACHE_PATH):
+        verify(CACHE_PATH)
+        return CACHE_PATH
+
+    if allow_download is None:
+        allow_download = os.environ.get('JOB_MARKET_DOWNLOAD') == '1'
+    if not allow_download:
+        raise FileNotFoundError(
+            f"No local copy of the dataset at {CACHE_PATH}. Copy the CSV there, point JOB_MARKET_CSV at it, "
+            "or run `python dataset_resolver.py --download` on a machine with network access."
+        )
+    return download()
+
+
+def load_dataframe(path=None, allow_download=None):
+    """The resolved dataset as main.py expects it: the CSV's own columns, with plain object dtypes.
+
+    The frame comes from data_store's columnar snapshot, the same one the
+    dashboard reads, and is a private copy the caller may modify.
+    """
+    df = data_store.load_dataset(resolve(path, allow_download))
+    return df.drop(columns='Salary_Category').astype({column: object for column in data_store.CATEGORICAL_COLUMNS})
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Check or fetch the local copy of the job market dataset.')
+    parser.add_argument('--download', action='store_true', help='download from Kaggle if there is no local copy')
+    parser.add_argument('--update-checksum', action='store_true', help=f"record the hash of the current {os.path.relpath(CACHE_PATH, data_store.BASE_DIR)}")
+    args = parser.parse_args()
+
+    if args.update_checksum:
+        write_checksum()
+    path = resolve(allow_download=args.download)
+    print(f"Dataset: {path}")
+    print(f"SHA-256: {data_store.file_hash(path)}")
@@ -0,0 +1,62 @@
+"""Process-wide store of serialized Plotly figures.
+
+Building a figure with plotly.express is the slowest part of drawing the EDA
+and Machine Learning pages, and the result only changes with the data or the
+model behind it. Figures are stored as JSON keyed by (chart kind, column,
+target) together with the version of their source, and rebuilt only when that
+version changes. JSON keeps the shared copies immutable: every caller gets
+its own Figure object back.
+"""
+import threading
+
+import plotly.io as pio
+
+_figures = {}
+_lock = threading.Lock()
+_counters = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+
+def get_figure(kind, column, target, version, build):
+    """Return the figure for the key, calling ``build()`` only if it is missing or stale.
+
+    ``version`` identifies the data or model the figure is drawn from.
+    """
+    key = (kind, column, target)
+    with _lock:
+        entry = _figures.get(key)
+        if entry is not None and entry[0] == version:
+            _counters['hits'] += 1
+            figure_json = entry[1]
+        else:
+            _counters['misses'] += 1
+            figure_json = None
+
+    if figure_json is None:
+        figure_json = pio.to_json(build(), validate=False)
+        with _lock:
+            entry = _figures.get(key)
+            if entry is not None and entry[0] != version:
+                _counters['evictions'] += 1
+            _figures[key] = (version, figure_json)
+
+    return pio.from_json(figure_json)
+
+
+def clear():
+    with _lock:
+        _figures.clear()
+        for name in _counters:
+            _counters[name] = 0
+
+
+def stats():
+    with _lock:
+        lookups = _counters['hits'] + _counters['misses']
+        return {
+            'Hits': _counters['hits'],
+            'Misses': _counters['misses'],
+            'Hit Ratio': round(_counters['hits'] / lookups, 3) if lookups else 0.0,
+            'Entries': len(_figures),
+            'Evictions': _counters['evictions'],
+            'Size (KB)': round(sum(len(figure_json) for _, figure_json in _figures.values()) / 1024, 1),
+        }
@@ -0,0 +1,244 @@
+"""Flattened NumPy representation of the trained Random Forest models.
+
+Every tree of a forest is concatenated into one set of contiguous node arrays
+(split feature, threshold, left/right child and normalized leaf class counts)
+with the root offset of each tree kept separately. A batch is then scored by
+walking all rows through all trees at once, one tree level per step.
+
+The arrays are stored as .npy files under models/flat/<model>/ and opened with
+memory-mapping, so processes scoring in parallel share a single copy through
+the page cache. They are re-exported whenever the model file changes, and each
+export is checked to reproduce sklearn's predict_proba exactly.
+
+This avoids sklearn's per-estimator dispatch, which dominates small batches
+such as the Prediction page's single rows. For batches of more than a few
+hundred rows sklearn's compiled traversal is faster, which the benchmark
+printed by this script shows.
+
+Run ``python flat_forest.py`` to export and verify all four models.
+"""
+import json
+import os
+import sys
+import threading
+import time
+
+import numpy as np
+
+import atomic_io
+import model_registry
+import vocabularies
+
+FLAT_DIR = os.path.join(model_registry.MODEL_DIR, 'flat')
+FLAT_FORMAT_VERSION = 1
+ARRAYS = ('feature', 'threshold', 'left', 'right', 'value', 'roots')
+
+# Rows scored per block, which bounds the (rows x trees) working arrays
+BLOCK_ROWS = 10000
+
+_forests = {}
+_lock = threading.Lock()
+
+
+class FlatForest:
+    """A forest held as contiguous node arrays, scored without sklearn."""
+
+    def __init__(self, arrays, meta):
+        # Plain ndarray views; indexing np.memmap objects directly is slower
+        self.feature = np.asarray(arrays['feature'])
+        self.threshold = np.asarray(arrays['threshold'])
+        self.left = np.asarray(arrays['left'])
+        self.right = np.asarray(arrays['right'])
+        self.value = np.asarray(arrays['value'])
+        self.roots = np.asarray(arrays['roots'])
+        self.meta = meta
+        self.classes_ = np.asarray(meta['classes'])
+        self.feature_names = meta['feature_names']
+
+    @classmethod
+    def from_sklearn(cls, clf, model_version=None):
+        features, thresholds, lefts, rights, values, roots = [], [], [], [], [], []
+        offset = 0
+        max_depth = 0
+        for estimator in clf.estimators_:
+            tree = estimator.tree_
+            leaf = tree.children_left == -1
+            roots.append(offset)
+            features.append(np.where(leaf, -1, tree.feature))
+            thresholds.append(tree.threshold)
+            lefts.append(np.where(leaf, -1, tree.children_left + offset))
+            rights.append(np.where(leaf, -1, tree.children_right + offset))
+
+            # Normalize exactly the way DecisionTreeClassifier.predict_proba does
+            value = tree.value[:, 0, :clf.n_classes_].astype(np.float64)
+            normalizer = value.sum(axis=1)[:, np.newaxis]
+            normalizer[normalizer == 0.0] = 1.0
+            values.append(value / normalizer)
+
+            offset += tree.node_count
+            max_depth = max(max_depth, tree.max_depth)
+
+        arrays = {
+            'feature': np.concatenate(features).astype(np.int32),
+            'threshold': np.concatenate(thresholds).astype(np.float64),
+            'left': np.concatenate(lefts).astype(np.int32),
+            'right': np.concatenate(rights).astype(np.int32),
+            'value': np.ascontiguousarray(np.concatenate(values)),
+            'roots': np.asarray(roots, dtype=np.int32),
+        }
+        feature_names = getattr(clf, 'feature_names_in_', None)
+        meta = {
+            'format_version': FLAT_FORMAT_VERSION,
+            'model_version': model_version,
+            'classes': clf.classes_.tolist(),
+            'feature_names': feature_names.tolist() if feature_names is not None else None,
+            'n_trees': len(clf.estimators_),
+            'n_nodes': int(offset),
+            'max_depth': int(max_depth),
+        }
+        return cls(arrays, meta)
+
+    @property
+    def nbytes(self):
+        return sum(getattr(self, name).nbytes for name in ARRAYS)
+
+    def _as_matrix(self, X):
+        if hasattr(X, 'columns') and self.feature_names is not None:
+            X = X[self.feature_names]
+        # sklearn evaluates trees on float32 inputs
+        return np.asarray(X, dtype=np.float32)
+
+    def _leaves(self, X):
+        # Leaf reached by every row in every tree, shape (rows, trees). All
+        # (row, tree) pairs advance one level per step and pairs that reached
+        # a leaf are dropped from the working arrays.
+        n_rows, n_features = X.shape
+        n_trees = len(self.roots)
+        values = X.ravel()
+        nodes = np.tile(self.roots, n_rows)
+        offsets = np.repeat(np.arange(n_rows, dtype=np.int64) * n_features, n_trees)
+        positions = np.arange(n_rows * n_trees)
+        leaves = np.empty(n_rows * n_trees, dtype=np.int32)
+        while positions.size:
+            feature = self.feature[nodes]
+            done = feature < 0
+            if done.any():
+                leaves[positions[done]] = nodes[done]
+                active = ~done
+                positions, nodes, offsets, feature = positions[active], nodes[active], offsets[active], feature[active]
+                if not positions.size:
+                    break
+            go_left = values[offsets + feature] <= self.threshold[nodes]
+            nodes = np.where(go_left, self.left[nodes], self.right[nodes])
+        return leaves.reshape(n_rows, n_trees)
+
+    def predict_proba(self, X, block_rows=BLOCK_ROWS):
+        X = self._as_matrix(X)
+        proba = np.zeros((len(X), len(self.classes_)), dtype=np.float64)
+        for start in range(0, len(X), block_rows):
+            stop = start + block_rows
+            leaves = self._leaves(X[start:stop])
+            block = proba[start:stop]
+            # Accumulate tree by tree in estimator order, as sklearn does
+            for t in range(leaves.shape[1]):
+                block += self.value[leaves[:, t]]
+        proba /= len(self.roots)
+        return proba
+
+    def predict(self, X, block_rows=BLOCK_ROWS):
+        return self.classes_[self.predict_proba(X, block_rows).argmax(axis=1)]
+
+
+def flat_path(name):
+    return os.path.join(FLAT_DIR, name)
+
+
+def save_flat_forest(forest, path):
+    with atomic_io.atomic_directory(path) as tmp_path:
+        for array_name in ARRAYS:
+            np.save(os.path.join(tmp_path, f"{array_name}.npy"), getattr(forest, array_name))
+        with open(os.path.join(tmp_path, 'meta.json'), 'w') as f:
+            json.dump(forest.meta, f, indent=2)
+
+
+def read_flat_forest(path, mmap_mode='r'):
+    with open(os.path.join(path, 'meta.json')) as f:
+        meta = json.load(f)
+    arrays = {name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode=mmap_mode) for name in ARRAYS}
+    return FlatForest(arrays, meta)
+
+
+def verify(forest, clf, X):
+    """Raise if ``forest`` does not reproduce ``clf.predict_proba(X)`` exactly."""
+    expected = clf.predict_proba(X)
+    actual = forest.predict_proba(X)
+    if not np.array_equal(expected, actual):
+        diff = np.abs(expected - actual).max()
+        raise AssertionError(f"Flattened forest differs from sklearn (max abs difference {diff:g})")
+
+
+def verification_rows(name, clf):
+    # Every row of the dataset, encoded the same way as for training
+    return vocabularies.encoded_frame()[list(clf.feature_names_in_)]
+
+
+def export(name):
+    """Flatten the current model file for ``name``, verify it and save it."""
+    version = model_registry.model_version(name)
+    clf = model_registry.get_model(name)
+    forest = FlatForest.from_sklearn(clf, version)
+    verify(forest, clf, verification_rows(name, clf))
+    os.makedirs(FLAT_DIR, exist_ok=True)
+    save_flat_forest(forest, flat_path(name))
+    return read_flat_forest(flat_path(name))
+
+
+def get_flat_forest(name):
+    """Return the memory-mapped flat forest for ``name``, exporting it if stale."""
+    version = model_registry.model_version(name)
+    forest = _forests.get(name)
+    if forest is not None and forest.meta['model_version'] == version:
+        return forest
+
+    with _lock:
+        forest = _forests.get(name)
+        if forest is not None and forest.meta['model_version'] == version:
+            return forest
+
+        path = flat_path(name)
+        forest = None
+        if os.path.exists(os.path.join(path, 'meta.json')):
+            forest = read_flat_forest(path)
+            if forest.meta.get('format_version') != FLAT_FORMAT_VERSION or forest.meta['model_version'] != version:
+                forest = None
+        if forest is None:
+            forest = export(name)
+        _forests[name] = forest
+        return forest
+
+
+def benchmark(forest, clf, X, batch_sizes=(1, 10, 100, 1000, 10000), repeats=5):
+    """Seconds per predict_proba call for sklearn and the flat forest."""
+    results = []
+    for batch_size in batch_sizes:
+        batch = X.iloc[np.arange(batch_size) % len(X)]
+        row = {'rows': batch_size}
+        for engine, predict_proba in (('sklearn', clf.predict_proba), ('flat', forest.predict_proba)):
+            predict_proba(batch)
+            start = time.perf_counter()
+            for _ in range(repeats):
+                predict_proba(batch)
+            row[engine] = (time.perf_counter() - start) / repeats
+        results.append(row)
+    return results
+
+
+if __name__ == '__main__':
+    names = sys.argv[1:] or list(model_registry.MODEL_FILES)
+    for name in names:
+        forest = export(name)
+        clf = model_registry.get_model(name)
+        print(f"{name}: {forest.meta['n_trees']} trees, {forest.meta['n_nodes']:,} nodes, "
+              f"{forest.nbytes / 1024 ** 2:.2f} MB, exact match with sklearn")
+        for row in benchmark(forest, clf, verification_rows(name, clf)):
+            print(f"  {row['rows']:>6} rows: sklearn {row['sklearn'] * 1000:8.2f} ms  flat {row['flat'] * 1000:8.2f} ms")
@@ -0,0 +1,149 @@
+"""Structure statistics of the Random Forest models, read from the trees' arrays.
+
+Node counts, depths, leaf depths, memory per tree and how often each feature
+is used for a split are computed from the ``tree_`` arrays of all estimators
+at once: the per-tree arrays are concatenated with node offsets and every
+step after that is a numpy operation over the whole forest. Results are cached
+per model version, and train.py stores the summary in models/metadata.json so
+forest growth can be compared across retrains.
+
+    python forest_stats.py             # summary of every model
+    python forest_stats.py growth      # one model
+"""
+import argparse
+import threading
+
+import numpy as np
+import pandas as pd
+
+import model_registry
+
+_stats = {}
+_lock = threading.Lock()
+
+
+def forest_arrays(clf):
+    """Concatenated child and feature arrays of every tree, with child ids shifted to forest-wide node ids.
+
+    Also returns the index of the first node of every tree and each tree's size in bytes.
+    """
+    trees = [estimator.tree_ for estimator in clf.estimators_]
+    counts = np.array([tree.node_count for tree in trees], dtype=np.int64)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    offsets = np.repeat(starts, counts)
+
+    left = np.concatenate([tree.children_left for tree in trees]).astype(np.int64)
+    right = np.concatenate([tree.children_right for tree in trees]).astype(np.int64)
+    internal = left != -1
+    left[internal] += offsets[internal]
+    right[internal] += offsets[internal]
+
+    feature = np.concatenate([tree.feature for tree in trees])
+    nbytes = np.array([state['nodes'].nbytes + state['values'].nbytes for state in (tree.__getstate__() for tree in trees)], dtype=np.int64)
+    return left, right, feature, starts, nbytes
+
+
+def node_depths(left, right):
+    """Depth of every node, filling in one level of the whole forest per step.
+
+    sklearn numbers a node's children after the node itself, so each step only
+    has to copy parent depths forward until nothing changes.
+    """
+    depth = np.zeros(len(left), dtype=np.int64)
+    parents = np.flatnonzero(left != -1)
+    children_left, children_right = left[parents], right[parents]
+    while True:
+        child_depth = depth[parents] + 1
+        if np.array_equal(depth[children_left], child_depth) and np.array_equal(depth[children_right], child_depth):
+            return depth
+        depth[children_left] = child_depth
+        depth[children_right] = child_depth
+
+
+def compute_stats(clf):
+    left, right, feature, starts, nbytes = forest_arrays(clf)
+    n_trees = len(starts)
+    tree_of_node = np.repeat(np.arange(n_trees), np.diff(np.append(starts, len(left))))
+    leaf = left == -1
+    depth = node_depths(left, right)
+
+    nodes = np.bincount(tree_of_node, minlength=n_trees)
+    leaves = np.bincount(tree_of_node[leaf], minlength=n_trees)
+    max_depth = np.zeros(n_trees, dtype=np.int64)
+    np.maximum.at(max_depth, tree_of_node, depth)
+    trees = pd.DataFrame({
+        'Tree': np.arange(n_trees),
+        'Nodes': nodes,
+        'Leaves': leaves,
+        'Depth': max_depth,
+        'Mean Leaf Depth': np.bincount(tree_of_node[leaf], weights=depth[leaf], minlength=n_trees) / np.maximum(leaves, 1),
+        'Bytes': nbytes,
+    })
+
+    feature_names = list(clf.feature_names_in_)
+    splits = np.bincount(feature[~leaf], minlength=len(feature_names))
+    feature_usage = pd.DataFrame({
+        'Feature': feature_names,
+        'Splits': splits,
+        'Share': splits / max(splits.sum(), 1),
+        'Trees Using': np.bincount(np.unique(tree_of_node[~leaf] * len(feature_names) + feature[~leaf]) % len(feature_names), minlength=len(feature_names)),
+    }).sort_values('Splits', ascending=False, ignore_index=True)
+
+    leaf_depths = np.bincount(depth[leaf])
+    depth_distribution = pd.DataFrame({'Depth': np.arange(len(leaf_depths)), 'Leaves': leaf_depths})
+
+    summary = {
+        'trees': n_trees,
+        'nodes': int(nodes.sum()),
+        'leaves': int(leaves.sum()),
+        'mean_nodes_per_tree': round(float(nodes.mean()), 1),
+        'mean_depth': round(float(max_depth.mean()), 2),
+        'max_depth': int(max_depth.max()),
+        'mean_leaf_depth': round(float(depth[leaf].mean()), 2),
+        'bytes': int(nbytes.sum()),
+        'mean_bytes_per_tree': int(nbytes.mean()),
+        'top_split_feature': feature_usage['Feature'].iloc[0],
+    }
+    return {'summary': summary, 'trees': trees, 'feature_usage': feature_usage, 'leaf_depths': depth_distribution}
+
+
+def forest_stats(name):
+    """Statistics of model ``name``, computed once per model version.
+
+    Returns a dict with a ``summary`` dict and ``trees``, ``feature_usage`` and
+    ``leaf_depths`` DataFrames. Callers must treat the result as read-only.
+    """
+    version = model_registry.model_version(name)
+    entry = _stats.get(name)
+    if entry is not None and entry[0] == version:
+        return entry[1]
+
+    clf = model_registry.get_model(name)
+    with _lock:
+        entry = _stats.get(name)
+        if entry is None or entry[0] != version:
+            entry = (version, compute_stats(clf))
+            _stats[name] = entry
+    return entry[1]
+
+
+def summary(name):
+    return forest_stats(name)['summary']
+
+
+def summaries(names=tuple(model_registry.MODEL_FILES)):
+    """One row per model, for comparing forests with each other or across retrains."""
+    return pd.DataFrame([{'model': name, **summary(name)} for name in names])
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Print structure statistics of the trained forests.')
+    parser.add_argument('models', nargs='*', help=f"models to describe (default: all of {', '.join(model_registry.MODEL_FILES)})")
+    args = parser.parse_args()
+
+    unknown = [name for name in args.models if name not in model_registry.MODEL_FILES]
+    if unknown:
+        parser.error(f"unknown model(s): {', '.join(unknown)}")
+
+    with pd.option_context('display.width', 200, 'display.max_columns', None):
+        print(summaries(tuple(args.models) or tuple(model_registry.MODEL_FILES)).to_string(index=False))
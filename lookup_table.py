@@ -0,0 +1,143 @@
+"""Precomputed class probabilities for models with only categorical inputs.
+
+The second Salary Category model only uses Job_encoded, Industry_encoded,
+Location_encoded and Skills_encoded, so its whole input space is the product
+of four small vocabularies. Every combination is scored once and the class
+probabilities are stored in an array indexed by the four codes, which turns a
+prediction into a single array lookup.
+
+Tables live under models/lut/<model>/ and are rebuilt whenever the model file
+or the vocabularies change. Run ``python lookup_table.py`` to build them.
+"""
+import json
+import os
+import sys
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+import atomic_io
+import model_registry
+import vocabularies
+
+LUT_DIR = os.path.join(model_registry.MODEL_DIR, 'lut')
+LUT_FORMAT_VERSION = 1
+LUT_MODELS = ('salary2nd',)
+
+_tables = {}
+_lock = threading.Lock()
+
+
+class LookupTable:
+    """Class probabilities for every combination of the model's input codes."""
+
+    def __init__(self, table, meta):
+        self.table = table
+        self.meta = meta
+        self.classes_ = np.asarray(meta['classes'])
+        self.feature_names = meta['feature_names']
+
+    @classmethod
+    def from_model(cls, clf, vocab, version):
+        feature_names = list(clf.feature_names_in_)
+        sizes = [len(vocab.classes[vocabularies.SOURCE_COLUMNS[feature]]) for feature in feature_names]
+
+        # Every code combination, in C order so the rows reshape into the table
+        grid = np.indices(sizes).reshape(len(sizes), -1).T
+        proba = clf.predict_proba(pd.DataFrame(grid, columns=feature_names))
+        table = np.ascontiguousarray(proba.reshape(*sizes, len(clf.classes_)))
+
+        meta = {
+            'format_version': LUT_FORMAT_VERSION,
+            'version': version,
+            'classes': clf.classes_.tolist(),
+            'feature_names': feature_names,
+            'shape': list(table.shape),
+        }
+        return cls(table, meta)
+
+    def predict_proba(self, X):
+        if hasattr(X, 'columns'):
+            X = X[self.feature_names]
+        codes = np.asarray(X, dtype=np.intp)
+        return self.table[tuple(codes.T)]
+
+    def predict(self, X):
+        return self.classes_[self.predict_proba(X).argmax(axis=1)]
+
+
+def lut_path(name):
+    return os.path.join(LUT_DIR, name)
+
+
+def table_version(name):
+    # Depends on both the model file and the vocabularies that size the axes
+    vocab_stat = os.stat(vocabularies.VOCAB_PATH)
+    return f"{model_registry.model_version(name)}-{vocab_stat.st_mtime_ns:x}"
+
+
+def save_table(lut, path):
+    os.makedirs(path, exist_ok=True)
+    with atomic_io.atomic_open(os.path.join(path, 'table.npy'), 'wb') as f:
+        np.save(f, lut.table)
+    atomic_io.write_json(os.path.join(path, 'meta.json'), lut.meta, indent=2)
+
+
+def read_table(path):
+    with open(os.path.join(path, 'meta.json')) as f:
+        meta = json.load(f)
+    return LookupTable(np.load(os.path.join(path, 'table.npy')), meta)
+
+
+def build(name):
+    """Score every input combination for ``name`` and save the table."""
+    version = table_version(name)
+    lut = LookupTable.from_model(model_registry.get_model(name), vocabularies.load_vocabularies(), version)
+    save_table(lut, lut_path(name))
+    return lut
+
+
+def get_lookup_table(name):
+    """Return the lookup table for ``name``, rebuilding it if it is stale.
+
+    Returns None for models that take continuous inputs.
+    """
+    if name not in LUT_MODELS:
+        return None
+
+    version = table_version(name)
+    lut = _tables.get(name)
+    if lut is not None and lut.meta['version'] == version:
+        return lut
+
+    with _lock:
+        lut = _tables.get(name)
+        if lut is not None and lut.meta['version'] == version:
+            return lut
+
+        path = lut_path(name)
+        lut = None
+        if os.path.exists(os.path.join(path, 'meta.json')):
+            lut = read_table(path)
+            if lut.meta.get('format_version') != LUT_FORMAT_VERSION or lut.meta['version'] != version:
+                lut = None
+        if lut is None:
+            lut = build(name)
+        _tables[name] = lut
+        return lut
+
+
+if __name__ == '__main__':
+    for name in sys.argv[1:] or LUT_MODELS:
+        start = time.perf_counter()
+        lut = build(name)
+        seconds = time.perf_counter() - start
+
+        # Check the table against the model on the real dataset
+        clf = model_registry.get_model(name)
+        X = vocabularies.encoded_frame()[lut.feature_names]
+        if not np.array_equal(lut.predict_proba(X), clf.predict_proba(X)):
+            sys.exit(f"{name}: lookup table does not match the model")
+        print(f"{name}: table {tuple(lut.meta['shape'])}, {lut.table.nbytes / 1024:.0f} KB, built in {seconds:.2f}s, matches the model")
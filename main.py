@@ -1,40 +1,44 @@
+import sys
+
+# `python main.py --headless [--output results.json]` runs the same stages as
+# plain Python, without Streamlit or any drawing (see analysis.main)
+if __name__ == '__main__' and '--headless' in sys.argv[1:]:
+    import analysis
+    sys.exit(analysis.main(sys.argv[1:]))
+
 import streamlit as st
 from io import StringIO 
 import pandas as pd
 import numpy as np
-from sklearn.model_selection import train_test_split
 from sklearn.tree import DecisionTreeClassifier
-from sklearn.metrics import accuracy_score
 from sklearn import tree
 import matplotlib.pyplot as plt
-from sklearn.preprocessing import LabelEncoder
 
-# Downloading Dataset from Kaggle
-import kagglehub
-import os
+# Large frames are shown one page at a time
+import paged_table
 
-# Min-Max Scaling
-from sklearn.preprocessing import MinMaxScaler
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.metrics import accuracy_score, classification_report
-from sklearn.cluster import KMeans
-from sklearn.semi_supervised import LabelPropagation
+# Local, checksummed copy of the Kaggle dataset (no download at import)
+import dataset_resolver
 
-# Download latest version
-path = kagglehub.dataset_download("uom190346a/ai-powered-job-market-insights")
+# Every computation below is a cached pipeline stage
+import analysis
 
-print("Path to dataset files:", path)
+from sklearn.cluster import KMeans
+from sklearn.semi_supervised import LabelPropagation
 
-#List the files in the downloaded dataset directory
-files = os.listdir(path)
-print("Files in the downloaded dataset directory:", files)
+# Resolve the dataset locally; set JOB_MARKET_DOWNLOAD=1 to allow fetching it from Kaggle
+file_path = dataset_resolver.resolve()
+print("Dataset file:", file_path)
 
-# Load the dataset (make sure to replace 'weather_data.csv' with the actual file name)
-file_name = 'ai_job_market_insights.csv'  # Adjust as necessary
-file_path = os.path.join(path, file_name)
+# Encoding, scaling, splitting and training are stages of analysis_pipeline.
+# Each experiment's encoding, scaling and feature selection is one fitted
+# preprocessing.Preprocessor (the '<experiment>.preprocessor' stage) that the
+# later stages only apply. Outputs are cached on disk by input hash, so a rerun
+# only recomputes what changed. Stage outputs are shared, so copy before modifying.
+analysis_pipeline = analysis.build_pipeline(file_path)
 
-# Read the CSV file
-df = pd.read_csv(file_path)
+# Read the dataset from the same columnar snapshot the dashboard uses
+df = analysis_pipeline.get('dataset').copy()
 
 st.title("Job Market Insights")
 
@@ -73,7 +77,7 @@ st.subheader("Duplicate Rows")
 st.write(f"Number of duplicate rows: {df.duplicated().sum()}")  
 
 duplicates = df[df.duplicated(keep=False)]
-st.dataframe(duplicates)
+paged_table.paged_dataframe(duplicates, key='duplicates')
 
 st.write("### **Observation**")
 st.write("There are no duplicate rows found on the dataframe.")
@@ -107,28 +111,8 @@ for col in num_col:
 st.write("### **Observation**")
 st.write("We used df[cat_col].nunique() to identify how many unique data in each categorized columns. Since there is only one numerical which is Salary_USD and we identified that all categorical columns are properly intialized with the use of .unique().")
 
-df_data = pd.DataFrame()
-
-job_encoder = LabelEncoder()
-industry_encoder = LabelEncoder()
-size_encoder = LabelEncoder()
-location_encoder = LabelEncoder()
-ai_adoption_encoder = LabelEncoder()
-automation_encoder = LabelEncoder()
-skills_encoder = LabelEncoder()
-remote_encoder = LabelEncoder()
-growth_encoder = LabelEncoder()
-
-df_data['Job_encoded'] = job_encoder.fit_transform(df['Job_Title'])
-df_data['Industry_encoded'] = industry_encoder.fit_transform(df['Industry'])
-df_data['Size_encoded'] = size_encoder.fit_transform(df['Company_Size'])
-df_data['Location_encoded'] = location_encoder.fit_transform(df['Location'])
-df_data['AI_Adoption_encoded'] = ai_adoption_encoder.fit_transform(df['AI_Adoption_Level'])
-df_data['Automation_encoded'] = automation_encoder.fit_transform(df['Automation_Risk'])
-df_data['Skills_encoded'] = skills_encoder.fit_transform(df['Required_Skills'])
-df_data['Remote_encoded'] = remote_encoder.fit_transform(df['Remote_Friendly'])
-df_data['Growth_encoded'] = growth_encoder.fit_transform(df['Job_Growth_Projection'])
-df_data['Salary_USD'] = df['Salary_USD']
+# Label-encoded columns (the 'encoded' stage)
+df_data = analysis_pipeline.get('encoded').drop(columns=['Salary_encoded'])
 
 st.subheader('Encoding Process:')
 st.code("""
@@ -159,39 +143,26 @@ st.write(" We encoded all object datatypes for RandomForestClassifier.", "We als
 
 st.write("# Automation Risk Prediction")
 
-features = ['Job_encoded', 'Industry_encoded', 'Size_encoded', 'Location_encoded', 'AI_Adoption_encoded','Skills_encoded', 'Remote_encoded', 'Growth_encoded','Salary_USD']
-X1 = df_data[features]
-Y1 = df_data['Automation_encoded']
+features = analysis.EXPERIMENTS['automation']['features']
+X1, Y1 = analysis_pipeline.get('automation.features')
 
 st.subheader('Features (X1):')
-st.write(X1)
+paged_table.paged_dataframe(X1, key='X1')
 
 st.subheader('Target Variable (Y1):')
-st.write(Y1)
+paged_table.paged_dataframe(Y1, key='Y1')
 
 st.write("### **Observation**")
 st.write(" To prepare for machine learning we categorized the needed datatype for predicition inside X. While we put the data will be predicted to Y which is Automation_Risk.")
 
 # Min-Max Scaling (Normalization)
-
-scaler = MinMaxScaler(feature_range=(0, 1))
-
-num_col_ = [col for col in X1.columns if X1[col].dtype != 'object']
-X1 = X1
-
-X1[num_col_] = scaler.fit_transform(X1[num_col_])
-X1.head()
+X1, Y1 = analysis_pipeline.get('automation.scaled')
 
 st.subheader('Min-Max Scaling (Normalization)')
 
-scaler = MinMaxScaler(feature_range=(0, 1))
-
-num_col_ = [col for col in X1.columns if X1[col].dtype != 'object']
-X1[num_col_] = scaler.fit_transform(X1[num_col_])
-
 
 st.write('Scaled Features (X1):')
-st.dataframe(X1)
+paged_table.paged_dataframe(X1, key='X1_2')
 
 st.write("### **Observation**")
 st.write(" We used Min-Max scaling for standardization to help the machine learning. Since, standardization makes the data more suitable for algorithms that assume a Gaussian distributuion or require features to have zero mean and unit variance. As we can see now, the Salary_USD was converted to a decimal from a whole number.")
@@ -213,21 +184,21 @@ pie_chart_AutomationRisk()
 st.write("### **Observation**")
 st.write("We created a piechart for our Automation Risk (our first Y) and we can see that it is almost evenly distributed. Which is good for our machine learning to not have any biases.")
 
-X1_train, X1_test, Y1_train, Y1_test = train_test_split(X1, Y1, test_size=0.1, random_state=42)
+X1_train, X1_test, Y1_train, Y1_test = analysis_pipeline.get('automation.split')
 
 st.code("""X1_train, X1_test, Y1_train, Y1_test = train_test_split(X1, Y1, test_size=0.1, random_state=42)""")
 
 st.write('Training Features (X1_train):')
-st.dataframe(X1_train)
+paged_table.paged_dataframe(X1_train, key='X1_train')
 
 st.write('Testing Features (X1_test):')
-st.dataframe(X1_test)
+paged_table.paged_dataframe(X1_test, key='X1_test')
 
 st.write('Training Target Variable (Y1_train):')
-st.dataframe(Y1_train)
+paged_table.paged_dataframe(Y1_train, key='Y1_train')
 
 st.write('Testing Target Variable (Y1_test):')
-st.dataframe(Y1_test)
+paged_table.paged_dataframe(Y1_test, key='Y1_test')
 
 st.write("### **Observation**")
 st.markdown("""
@@ -238,8 +209,8 @@ st.markdown("""
  As you can see, the test shape has a lower number than the training shape. Since we should always allot more data to training for the machine learning model to practice.
 """)
 
-clf = RandomForestClassifier(random_state=42)
-clf.fit(X1_train, Y1_train)
+clf = analysis_pipeline.get('automation.model')
+evaluation = analysis_pipeline.get('automation.evaluation')
 
 st.code("""
 * clf = RandomForestClassifier(random_state=42)
@@ -252,18 +223,17 @@ st.write(" We used RandomForest Classifier algorithm for our supervised learning
 
 st.markdown("#### **Model Evaluation**")
 
-Y1_pred = clf.predict(X1_test) #Prediction
+Y1_pred = evaluation['Y_pred'] #Prediction
 
 st.code("""Y1_pred = clf.predict(X1_test) #Prediction""")
 
 # Performance evaluation
-accuracy = accuracy_score(Y1_test, Y1_pred)
-classification_rep = classification_report(Y1_test, Y1_pred, target_names=automation_encoder.classes_)
+accuracy = evaluation['accuracy']
+classification_rep = evaluation['classification_report']
 
 st.write("### Classification Report")
 st.text(classification_rep)
 
-accuracy = accuracy_score(Y1_test, Y1_pred)
 st.write("### Accuracy:")
 st.markdown(f'{accuracy * 100:.2f}%')
 
@@ -275,13 +245,8 @@ st.code("""feature_importance = clf.feature_importances_""")
 st.write("### feature_importance:")
 st.write(feature_importance)
 
-importance_df = pd.DataFrame({
-    'Feature': X1.columns,
-    'Importance': feature_importance
-})
-
-# Sort the DataFrame by importance for better readability
-importance_df = importance_df.sort_values(by='Importance', ascending=False).reset_index(drop=True)
+# Sorted by importance for better readability
+importance_df = evaluation['importance_df']
 st.code("""importance_df = importance_df.sort_values(by='Importance', ascending=False).reset_index(drop=True)""")
 # Display the resulting DataFrame
 st.write("### importance_df:")
@@ -351,18 +316,11 @@ st.code("""AutomationRisk_counts = new_df_filtered['Automation_Risk'].value_coun
 st.write(AutomationRisk_counts)
 
 
-balanced_new_df = pd.DataFrame()
 st.write("#### Initialize an empty dataframe to store balanced data")
 st.code("balanced_new_df = pd.DataFrame()")
 
 
-for Automation_Risk in AutomationRisk_counts.index:
-    if Automation_Risk == 'Low':
-        sampled_df = new_df_filtered[new_df_filtered['Automation_Risk'] == Automation_Risk]
-    else:
-        sampled_df = new_df_filtered[new_df_filtered['Automation_Risk'] == Automation_Risk].sample(169, random_state=42)
-        
-    balanced_new_df = pd.concat([balanced_new_df, sampled_df])
+balanced_new_df = analysis_pipeline.get('automation_balanced.sample').copy()
     
 st.write("#### Loop through each category and sample: ")
 st.code("""
@@ -383,7 +341,8 @@ st.code("balanced_new_df.reset_index(drop=True, inplace=True)")
 st.write("#### Value count of Automation_risk: ")
 st.write((balanced_new_df['Automation_Risk'].value_counts()))
 
-balanced_new_df['Automation_Risk_encoded'] = automation_encoder.fit_transform(balanced_new_df['Automation_Risk'])
+balanced_encoded = analysis_pipeline.get('automation_balanced.encoded')
+balanced_new_df['Automation_Risk_encoded'] = balanced_encoded['Automation_Risk_encoded']
 
 st.code("balanced_new_df['Automation_Risk_encoded'] = automation_encoder.fit_transform(balanced_new_df['Automation_Risk'])")
 st.write(balanced_new_df.head())
@@ -425,11 +384,8 @@ st.write("### Automation Risk Mapping DataFrame")
 st.dataframe(balanced_automationRisk_mapping_df)
 
 
-balanced_new_df['Job_encoded'] = job_encoder.fit_transform(balanced_new_df['Job_Title'])
-balanced_new_df['Industry_encoded'] = industry_encoder.fit_transform(balanced_new_df['Industry'])
-balanced_new_df['Location_encoded'] = location_encoder.fit_transform(balanced_new_df['Location'])
-balanced_new_df['Skills_encoded'] = skills_encoder.fit_transform(balanced_new_df['Required_Skills'])
-balanced_new_df['Salary_USD'] = balanced_new_df['Salary_USD']
+encoded_columns = list(analysis.BALANCED_ENCODED_COLUMNS)
+balanced_new_df[encoded_columns] = balanced_encoded[encoded_columns]
 
 st.write("### Code for Encoding Categorical Columns and Converting Salary to USD")
 st.code("""
@@ -441,9 +397,8 @@ balanced_new_df['Salary_USD'] = balanced_new_df['Salary_USD']
 """)
 
 # Select features and target variable
-features = [ 'Salary_USD','Industry_encoded', 'Job_encoded', 'Location_encoded', 'Skills_encoded']
-X1 = balanced_new_df[features]
-Y1 = balanced_new_df['Automation_Risk_encoded']
+features = analysis.EXPERIMENTS['automation_balanced']['features']
+X1, Y1 = analysis_pipeline.get('automation_balanced.features')
 
 st.write("### Code for Selecting Features and Target Variable")
 st.code("""
@@ -453,10 +408,7 @@ X1 = balanced_new_df[features]
 Y1 = balanced_new_df['Automation_Risk_encoded']
 """)
 
-scaler = MinMaxScaler(feature_range=(0, 1))
-num_col_ = [col for col in X1.columns if X1[col].dtype != 'object']
-X1 = X1
-X1[num_col_] = scaler.fit_transform(X1[num_col_])
+X1, Y1 = analysis_pipeline.get('automation_balanced.scaled')
 
 st.write("### Code for Min-Max Scaling (Normalization)")
 st.code("""
@@ -474,12 +426,12 @@ X1[num_col_] = scaler.fit_transform(X1[num_col_])
 st.write(X1.head())
 
 st.write("### X1: ")
-st.write(X1)
+paged_table.paged_dataframe(X1, key='X1_3')
 
 st.write("### Y1: ")
-st.write(Y1)
+paged_table.paged_dataframe(Y1, key='Y1_2')
 
-X1_train, X1_test, Y1_train, Y1_test = train_test_split(X1, Y1, test_size=0.1, random_state=42)
+X1_train, X1_test, Y1_train, Y1_test = analysis_pipeline.get('automation_balanced.split')
 
 st.write("### Code for Splitting Data into Training and Testing Sets")
 st.code("""
@@ -490,16 +442,16 @@ st.write("### **Observation**")
 st.write("We do this so that we can split the new dataframe to Train and Test set.")
 
 st.write('### Training Features (X1_train):')
-st.dataframe(X1_train)
+paged_table.paged_dataframe(X1_train, key='X1_train_2')
 
 st.write('### Testing Features (X1_test):')
-st.dataframe(X1_test)
+paged_table.paged_dataframe(X1_test, key='X1_test_2')
 
 st.write('### Training Target Variable (Y1_train):')
-st.dataframe(Y1_train)
+paged_table.paged_dataframe(Y1_train, key='Y1_train_2')
 
 st.write('### Testing Target Variable (Y1_test):')
-st.dataframe(Y1_test)
+paged_table.paged_dataframe(Y1_test, key='Y1_test_2')
 
 st.markdown("""
 *  We used `.head()` to give us a preview of the `X1_test` and `X1_train` data.
@@ -509,8 +461,8 @@ st.markdown("""
  As you can see, the test shape has a lower number than the training shape. Since we should always allot more data to training for the machine learning model to practice.
 """)
 
-clf = RandomForestClassifier(random_state=42)
-clf.fit(X1_train, Y1_train)
+clf = analysis_pipeline.get('automation_balanced.model')
+evaluation = analysis_pipeline.get('automation_balanced.evaluation')
 
 st.code("""
 * clf = RandomForestClassifier(random_state=42)
@@ -537,8 +489,8 @@ st.write('### Converting the .unique results to a list')
 st.write(balanced_AutomationRisk_list)
 
 
-Y1_pred = clf.predict(X1_test)
-accuracy = accuracy_score(Y1_test, Y1_pred)
+Y1_pred = evaluation['Y_pred']
+accuracy = evaluation['accuracy']
 
 st.write('### Y1_pred and accuracy:')
 st.code("""
@@ -553,11 +505,8 @@ st.write("### Feature_importance")
 st.code("feature_importance = clf.feature_importances_")
 st.write(feature_importance)
 
-importance_df = pd.DataFrame({
-    'Feature': X1.columns,
-    'Importance': feature_importance
-})
-importance_df = importance_df.sort_values(by='Importance', ascending=False).reset_index(drop=True)
+# Sorted by importance for better readability
+importance_df = evaluation['importance_df']
 
 st.code("""
         importance_df = pd.DataFrame({
@@ -586,32 +535,26 @@ st.write("We have shown the treeplot for the second training.")
 #Growth Prediction
 st.write("# Growth Prediction")
 
-features = ['Job_encoded', 'Industry_encoded', 'Size_encoded', 'Location_encoded', 'AI_Adoption_encoded','Skills_encoded', 'Remote_encoded', 'Salary_USD', 'Automation_encoded']
-X2 = df_data[features]
-Y2 = df_data['Growth_encoded']
+features = analysis.EXPERIMENTS['growth']['features']
+X2, Y2 = analysis_pipeline.get('growth.features')
 
 st.subheader('Features (X2):')
-st.write(X2)
+paged_table.paged_dataframe(X2, key='X2')
 
 st.subheader('Target Variable (Y2):')
-st.write(Y2)
+paged_table.paged_dataframe(Y2, key='Y2')
 
 st.write("### **Observation**")
 st.write(" To prepare for machine learning we categorized the needed datatype for predicition inside X. While we put the data will be predicted to Y which is Job_Growth_Projection.")
 
 # Min-Max Scaling (Normalization)
 
-scaler = MinMaxScaler(feature_range=(0, 1))
-
-num_col_ = [col for col in X2.columns if X2[col].dtype != 'object']
-X2 = X2
-
-X2[num_col_] = scaler.fit_transform(X2[num_col_])
+X2, Y2 = analysis_pipeline.get('growth.scaled')
 
 st.subheader('Min-Max Scaling (Normalization)')
 
 st.write('Scaled Features (X2):')
-st.dataframe(X2)
+paged_table.paged_dataframe(X2, key='X2_2')
 
 st.write("### **Observation**")
 st.write(" The Min-Max scaling normalizes the numerical columns in X2 to a range of 0–1, making features comparable for machine learning models. The SettingWithCopyWarning suggests using .loc to ensure that the transformation applies directly to X2 without creating a copy.")
@@ -644,21 +587,21 @@ bar_chart_JobGrowth()
 st.write("### **Observation**")
 st.write("We created a bar chart for our Growth prediction (our second Y) and we can see that it is almost evenly distributed. Which is good for our machine learning to not have any biases.")
 
-X2_train, X2_test, Y2_train, Y2_test = train_test_split(X2, Y2, test_size=0.1, random_state=42)
+X2_train, X2_test, Y2_train, Y2_test = analysis_pipeline.get('growth.split')
 
 st.code("""X2_train, X2_test, Y2_train, Y2_test = train_test_split(X2, Y2, test_size=0.1, random_state=42)""")
 
 st.write('Training Features (X2_train):')
-st.dataframe(X2_train)
+paged_table.paged_dataframe(X2_train, key='X2_train')
 
 st.write('Testing Features (X2_test):')
-st.dataframe(X2_test)
+paged_table.paged_dataframe(X2_test, key='X2_test')
 
 st.write('Training Target Variable (Y2_train):')
-st.dataframe(Y2_train)
+paged_table.paged_dataframe(Y2_train, key='Y2_train')
 
 st.write('Testing Target Variable (Y2_test):')
-st.dataframe(Y2_test)
+paged_table.paged_dataframe(Y2_test, key='Y2_test')
 
 st.write("### **Observation**")
 st.markdown("""
@@ -669,8 +612,8 @@ st.markdown("""
  As you can see, the test shape has a lower number than the training shape. Since we should always allot more data to training for the machine learning model to practice.
 """)
 
-clf = RandomForestClassifier(random_state=42)
-clf.fit(X2_train, Y2_train)
+clf = analysis_pipeline.get('growth.model')
+evaluation = analysis_pipeline.get('growth.evaluation')
 
 st.code("""
 * clf = RandomForestClassifier(random_state=42)
@@ -683,18 +626,17 @@ st.write(" We used RandomForest Classifier algorithm for our supervised learning
 
 st.markdown("#### **Model Evaluation**")
 
-Y2_pred = clf.predict(X2_test) #Prediction
+Y2_pred = evaluation['Y_pred'] #Prediction
 
 st.code("""Y2_pred = clf.predict(X2_test) #Prediction""")
 
 # Performance evaluation
-accuracy = accuracy_score(Y2_test, Y2_pred)
-classification_rep = classification_report(Y2_test, Y2_pred, target_names=growth_encoder.classes_)
+accuracy = evaluation['accuracy']
+classification_rep = evaluation['classification_report']
 
 st.write("### Classification Report")
 st.text(classification_rep)
 
-accuracy = accuracy_score(Y2_test, Y2_pred)
 st.write("### Accuracy:")
 st.markdown(f'{accuracy * 100:.2f}%')
 
@@ -706,13 +648,8 @@ st.code("""feature_importance = clf.feature_importances_""")
 st.write("### feature_importance:")
 st.write(feature_importance)
 
-importance_df = pd.DataFrame({
-    'Feature': X2.columns,
-    'Importance': feature_importance
-})
-
-# Sort the DataFrame by importance for better readability
-importance_df = importance_df.sort_values(by='Importance', ascending=False).reset_index(drop=True)
+# Sorted by importance for better readability
+importance_df = evaluation['importance_df']
 st.code("""importance_df = importance_df.sort_values(by='Importance', ascending=False).reset_index(drop=True)""")
 # Display the resulting DataFrame
 st.write("### importance_df:")
@@ -781,19 +718,11 @@ st.code("""jobGrowth_counts = new_df_filtered['Job_Growth_Projection'].value_cou
 st.write(jobGrowth_counts)
 
 
-balanced_new_df = pd.DataFrame()
 st.write("#### Initialize an empty dataframe to store balanced data")
 st.code("balanced_new_df = pd.DataFrame()")
 
 
-for Job_Growth_Projection in jobGrowth_counts.index:
-    if Job_Growth_Projection == 'Stable':
-        sampled_df = new_df_filtered[new_df_filtered['Job_Growth_Projection'] == Job_Growth_Projection]
-    else:
-        sampled_df = new_df_filtered[new_df_filtered['Job_Growth_Projection'] == Job_Growth_Projection].sample(169, random_state=42)
-
-    
-    balanced_new_df = pd.concat([balanced_new_df, sampled_df])
+balanced_new_df = analysis_pipeline.get('growth_balanced.sample').copy()
     
 st.write("#### Loop through each category and sample: ")
 st.code("""
@@ -815,7 +744,8 @@ st.code("balanced_new_df.reset_index(drop=True, inplace=True)")
 st.write("#### Value count of Job Growth: ")
 st.write((balanced_new_df['Job_Growth_Projection'].value_counts()))
 
-balanced_new_df['Growth_encoded'] = growth_encoder.fit_transform(balanced_new_df['Job_Growth_Projection'])
+balanced_encoded = analysis_pipeline.get('growth_balanced.encoded')
+balanced_new_df['Growth_encoded'] = balanced_encoded['Growth_encoded']
 
 st.code("balanced_new_df['Growth_encoded'] = growth_encoder.fit_transform(balanced_new_df['Job_Growth_Projection'])")
 st.write(balanced_new_df.head())
@@ -825,7 +755,7 @@ balanced_new_df['Growth_encoded'].unique()
 
 st.write("#### Categories of Growth Prediction: ")
 st.code("balanced_unique_jobGrowth = balanced_new_df['Job_Growth_Projection'].unique()")
-st.write(balanced_unique_jobGrowth = balanced_new_df['Job_Growth_Projection'].unique())
+st.write(balanced_new_df['Job_Growth_Projection'].unique())
 
 st.write("#### Categories of Growth_encoded: ")
 st.code("balanced_new_df['Growth_encoded'].unique()")
@@ -855,11 +785,8 @@ st.write("### Growth prediction Mapping DataFrame")
 st.dataframe(balanced_jobGrowth_mapping_df)
 
 
-balanced_new_df['Job_encoded'] = job_encoder.fit_transform(balanced_new_df['Job_Title'])
-balanced_new_df['Industry_encoded'] = industry_encoder.fit_transform(balanced_new_df['Industry'])
-balanced_new_df['Location_encoded'] = location_encoder.fit_transform(balanced_new_df['Location'])
-balanced_new_df['Skills_encoded'] = skills_encoder.fit_transform(balanced_new_df['Required_Skills'])
-balanced_new_df['Salary_USD'] = balanced_new_df['Salary_USD']
+encoded_columns = list(analysis.BALANCED_ENCODED_COLUMNS)
+balanced_new_df[encoded_columns] = balanced_encoded[encoded_columns]
 
 st.write("### Code for Encoding Categorical Columns and Converting Salary to USD")
 st.code("""
@@ -871,9 +798,8 @@ balanced_new_df['Salary_USD'] = balanced_new_df['Salary_USD']
 """)
 
 # Select features and target variable
-features = [ 'Salary_USD', 'Industry_encoded', 'Job_encoded', 'Location_encoded', 'Skills_encoded']
-X2 = balanced_new_df[features]
-Y2 = balanced_new_df['Growth_encoded']
+features = analysis.EXPERIMENTS['growth_balanced']['features']
+X2, Y2 = analysis_pipeline.get('growth_balanced.features')
 
 st.write("### Code for Selecting Features and Target Variable")
 st.code("""
@@ -883,10 +809,7 @@ X2 = balanced_new_df[features]
 Y2 = balanced_new_df['Growth_encoded']
 """)
 
-scaler = MinMaxScaler(feature_range=(0, 1))
-num_col_ = [col for col in X2.columns if X2[col].dtype != 'object']
-X2 = X2
-X2[num_col_] = scaler.fit_transform(X2[num_col_])
+X2, Y2 = analysis_pipeline.get('growth_balanced.scaled')
 
 st.write("### Code for Min-Max Scaling (Normalization)")
 st.code("""
@@ -904,12 +827,12 @@ X2[num_col_] = scaler.fit_transform(X2[num_col_])
 st.write(X2.head())
 
 st.write("### X2: ")
-st.write(X2)
+paged_table.paged_dataframe(X2, key='X2_3')
 
 st.write("### Y2: ")
-st.write(Y2)
+paged_table.paged_dataframe(Y2, key='Y2_2')
 
-X2_train, X2_test, Y2_train, Y2_test = train_test_split(X2, Y2, test_size=0.3, random_state=42)
+X2_train, X2_test, Y2_train, Y2_test = analysis_pipeline.get('growth_balanced.split')
 
 st.write("### Code for Splitting Data into Training and Testing Sets")
 st.code("""
@@ -920,16 +843,16 @@ st.write("### **Observation**")
 st.write("We do this so that we can split the new dataframe to Train and Test set.")
 
 st.write('### Training Features (X2_train):')
-st.dataframe(X2_train)
+paged_table.paged_dataframe(X2_train, key='X2_train_2')
 
 st.write('### Testing Features (X2_test):')
-st.dataframe(X2_test)
+paged_table.paged_dataframe(X2_test, key='X2_test_2')
 
 st.write('### Training Target Variable (Y2_train):')
-st.dataframe(Y2_train)
+paged_table.paged_dataframe(Y2_train, key='Y2_train_2')
 
 st.write('### Testing Target Variable (Y2_test):')
-st.dataframe(Y2_test)
+paged_table.paged_dataframe(Y2_test, key='Y2_test_2')
 
 st.markdown("""
 *  We used `.head()` to give us a preview of the `X2_test` and `X2_train` data.
@@ -939,8 +862,8 @@ st.markdown("""
  As you can see, the test shape has a lower number than the training shape. Since we should always allot more data to training for the machine learning model to practice.
 """)
 
-clf = RandomForestClassifier(random_state=42)
-clf.fit(X2_train, Y2_train)
+clf = analysis_pipeline.get('growth_balanced.model')
+evaluation = analysis_pipeline.get('growth_balanced.evaluation')
 
 st.code("""
 * clf = RandomForestClassifier(random_state=42)
@@ -967,8 +890,8 @@ st.write('### Converting the .unique results to a list')
 st.write(balanced_jobGrowth_list)
 
 
-Y2_pred = clf.predict(X2_test)
-accuracy = accuracy_score(Y2_test, Y2_pred)
+Y2_pred = evaluation['Y_pred']
+accuracy = evaluation['accuracy']
 
 st.write('### Y2_pred and accuracy:')
 st.code("""
@@ -983,11 +906,8 @@ st.write("### Feature_importance")
 st.code("feature_importance = clf.feature_importances_")
 st.write(feature_importance)
 
-importance_df = pd.DataFrame({
-    'Feature': X2.columns,
-    'Importance': feature_importance
-})
-importance_df = importance_df.sort_values(by='Importance', ascending=False).reset_index(drop=True)
+# Sorted by importance for better readability
+importance_df = evaluation['importance_df']
 
 st.code("""
         importance_df = pd.DataFrame({
@@ -1016,15 +936,8 @@ st.write("We have shown the treeplot for the second training.")
 #Salary Prediction
 st.write("# Salary Prediction")
 
-def categorize_salary(salary):
-    if salary < 50000:
-        return 'Entry Level'
-    elif salary < 100000:
-        return 'Mid Level'
-    elif salary < 200000:
-        return 'Senior Level'
-
-df['Salary_Category'] = df['Salary_USD'].apply(categorize_salary)
+# Salary_Category comes from the 'categorized' stage (data_store.categorize_salary)
+df['Salary_Category'] = analysis_pipeline.get('categorized')['Salary_Category']
 
 st.code("""def categorize_salary(salary):
     if salary < 50000:
@@ -1048,8 +961,7 @@ df_data = df_data.drop(columns=['Salary_USD'])""")
 st.write("### **Observation**")
 st.write("We remove the column Salary_USD from df and df_data.")
 
-salary_encoder = LabelEncoder()
-df_data['Salary_encoded'] = salary_encoder.fit_transform(df['Salary_Category'])
+df_data['Salary_encoded'] = analysis_pipeline.get('encoded')['Salary_encoded']
 
 st.code("""salary_encoder = LabelEncoder()
 df_data['Salary_encoded'] = salary_encoder.fit_transform(df['Salary_Category'])""")
@@ -1057,32 +969,26 @@ df_data['Salary_encoded'] = salary_encoder.fit_transform(df['Salary_Category'])"
 st.write("### **Observation**")
 st.write("Encoded the Salary_Category..")
 
-features = ['Job_encoded', 'Industry_encoded', 'Size_encoded', 'Location_encoded', 'AI_Adoption_encoded','Skills_encoded', 'Remote_encoded', 'Automation_encoded', 'Growth_encoded']
-X4 = df_data[features]
-Y4 = df_data['Salary_encoded']
+features = analysis.EXPERIMENTS['salary']['features']
+X4, Y4 = analysis_pipeline.get('salary.features')
 
 st.subheader('Features (X4):')
-st.write(X4)
+paged_table.paged_dataframe(X4, key='X4')
 
 st.subheader('Target Variable (Y4):')
-st.write(Y4)
+paged_table.paged_dataframe(Y4, key='Y4')
 
 st.write("### **Observation**")
 st.write(" To prepare for machine learning we categorized the needed datatype for predicition inside X. While we put the data will be predicted to Y which is Salary_Category")
 
 # Min-Max Scaling (Normalization)
 
-scaler = MinMaxScaler(feature_range=(0, 1))
-
-num_col_ = [col for col in X4.columns if X4[col].dtype != 'object']
-X4 = X4
-
-X4[num_col_] = scaler.fit_transform(X4[num_col_])
+X4, Y4 = analysis_pipeline.get('salary.scaled')
 
 st.subheader('Min-Max Scaling (Normalization)')
 
 st.write('Scaled Features (X4):')
-st.dataframe(X4)
+paged_table.paged_dataframe(X4, key='X4_2')
 
 st.write("### **Observation**")
 st.write(" All numerical values were rescaled to a 0–1 range using min-max scaling, which made sure that no feature was overpowered by scale discrepancies. This increases the effectiveness of model training and produces predictions that are more trustworthy.")
@@ -1108,21 +1014,21 @@ st.pyplot(plt)
 st.write("### **Observation**")
 st.write("The chart shows that Mid Level has the highest count, followed by the Senior Leve, and Entry level being the lowest. This shows that there is a significant distribution between the data.")
 
-X4_train, X4_test, Y4_train, Y4_test = train_test_split(X4, Y4, test_size=0.3, random_state=42)
+X4_train, X4_test, Y4_train, Y4_test = analysis_pipeline.get('salary.split')
 
 st.code("""X4_train, X4_test, Y4_train, Y4_test = train_test_split(X4, Y4, test_size=0.3, random_state=42)""")
 
 st.write('Training Features (X4_train):')
-st.dataframe(X4_train)
+paged_table.paged_dataframe(X4_train, key='X4_train')
 
 st.write('Testing Features (X4_test):')
-st.dataframe(X4_test)
+paged_table.paged_dataframe(X4_test, key='X4_test')
 
 st.write('Training Target Variable (Y4_train):')
-st.dataframe(Y4_train)
+paged_table.paged_dataframe(Y4_train, key='Y4_train')
 
 st.write('Testing Target Variable (Y4_test):')
-st.dataframe(Y4_test)
+paged_table.paged_dataframe(Y4_test, key='Y4_test')
 
 st.write("### **Observation**")
 st.markdown("""
@@ -1133,8 +1039,8 @@ st.markdown("""
  As you can see, the test shape has a lower number than the training shape. Since we should always allot more data to training for the machine learning model to practice.
 """)
 
-clf = RandomForestClassifier(random_state=42)
-clf.fit(X4_train, Y4_train)
+clf = analysis_pipeline.get('salary.model')
+evaluation = analysis_pipeline.get('salary.evaluation')
 
 st.code("""
 * clf = RandomForestClassifier(random_state=42)
@@ -1147,18 +1053,17 @@ st.write(" We used RandomForest Classifier algorithm for our supervised learning
 
 st.markdown("#### **Model Evaluation**")
 
-Y4_pred = clf.predict(X4_test) #Prediction
+Y4_pred = evaluation['Y_pred'] #Prediction
 
 st.code("""Y4_pred = clf.predict(X4_test) #Prediction""")
 
 # Performance evaluation
-accuracy = accuracy_score(Y4_test, Y4_pred)
-classification_rep = classification_report(Y4_test, Y4_pred, target_names=salary_encoder.classes_)
+accuracy = evaluation['accuracy']
+classification_rep = evaluation['classification_report']
 
 st.write("### Classification Report")
 st.text(classification_rep)
 
-accuracy = accuracy_score(Y4_test, Y4_pred)
 st.write("### Accuracy:")
 st.markdown(f'{accuracy * 100:.2f}%')
 
@@ -1170,13 +1075,8 @@ st.code("""feature_importance = clf.feature_importances_""")
 st.write("### feature_importance:")
 st.write(feature_importance)
 
-importance_df = pd.DataFrame({
-    'Feature': X4.columns,
-    'Importance': feature_importance
-})
-
-# Sort the DataFrame by importance for better readability
-importance_df = importance_df.sort_values(by='Importance', ascending=False).reset_index(drop=True)
+# Sorted by importance for better readability
+importance_df = evaluation['importance_df']
 st.code("""importance_df = importance_df.sort_values(by='Importance', ascending=False).reset_index(drop=True)""")
 # Display the resulting DataFrame
 st.write("### importance_df:")
@@ -1244,18 +1144,11 @@ st.code("""salaryCategory_counts = new_df['Salary_Category'].value_counts()""")
 st.write(salaryCategory_counts)
 
 
-balanced_new_df = pd.DataFrame()
 st.write("#### Initialize an empty dataframe to store balanced data")
 st.code("balanced_new_df = pd.DataFrame()")
 
 
-for Salary_Category in salaryCategory_counts.index:
-    if Salary_Category  == 'Entry Level':
-        sampled_df = new_df_filtered[new_df_filtered['Salary_Category'] == Salary_Category ]
-    else:
-        sampled_df = new_df_filtered[new_df_filtered['Salary_Category'] == Salary_Category ].sample(172, random_state=42)
-
-    balanced_new_df = pd.concat([balanced_new_df, sampled_df])
+balanced_new_df = analysis_pipeline.get('salary_balanced.sample').copy()
     
 st.write("#### Loop through each category and sample: ")
 st.code("""
@@ -1276,7 +1169,8 @@ st.code("balanced_new_df.reset_index(drop=True, inplace=True)")
 st.write("#### Value count of Job Growth: ")
 st.write((balanced_new_df['Salary_Category'].value_counts()))
 
-balanced_new_df['Salary_encoded'] = salary_encoder.fit_transform(balanced_new_df['Salary_Category'])
+balanced_encoded = analysis_pipeline.get('salary_balanced.encoded')
+balanced_new_df['Salary_encoded'] = balanced_encoded['Salary_encoded']
 
 st.code("balanced_new_df['Salary_encoded'] = growth_encoder.fit_transform(balanced_new_df['Salary_Category'])")
 st.write(balanced_new_df.head())
@@ -1286,7 +1180,7 @@ balanced_new_df['Salary_encoded'].unique()
 
 st.write("#### Categories of Salary Category Prediction: ")
 st.code("balanced_unique_salaryCategory = balanced_new_df['Salary_Category'].unique()")
-st.write(balanced_unique_salaryCategory = balanced_new_df['Salary_Category'].unique())
+st.write(balanced_new_df['Salary_Category'].unique())
 
 st.write("#### Categories of Growth_encoded: ")
 st.code("balanced_new_df['Salary_encoded'].unique()")
@@ -1313,10 +1207,8 @@ balanced_salaryCategory_mapping_df = pd.DataFrame({'Summary': balanced_unique_sa
 st.write("### Salary Category prediction Mapping DataFrame")
 st.dataframe(balanced_salaryCategory_mapping_df)
 
-balanced_new_df['Job_encoded'] = job_encoder.fit_transform(balanced_new_df['Job_Title'])
-balanced_new_df['Industry_encoded'] = industry_encoder.fit_transform(balanced_new_df['Industry'])
-balanced_new_df['Location_encoded'] = location_encoder.fit_transform(balanced_new_df['Location'])
-balanced_new_df['Skills_encoded'] = skills_encoder.fit_transform(balanced_new_df['Required_Skills'])
+encoded_columns = list(analysis.BALANCED_ENCODED_COLUMNS)
+balanced_new_df[encoded_columns] = balanced_encoded[encoded_columns]
 
 st.write("### Code for Encoding Categorical Columns")
 st.code("""
@@ -1327,9 +1219,8 @@ balanced_new_df['Skills_encoded'] = skills_encoder.fit_transform(balanced_new_df
 """)
 
 # Select features and target variable
-features = ['Job_encoded', 'Industry_encoded', 'Location_encoded', 'Skills_encoded']
-X4 = balanced_new_df[features]
-Y4 = balanced_new_df['Salary_encoded']
+features = analysis.EXPERIMENTS['salary_balanced']['features']
+X4, Y4 = analysis_pipeline.get('salary_balanced.features')
 
 st.write("### Code for Selecting Features and Target Variable")
 st.code("""
@@ -1339,10 +1230,7 @@ X4 = balanced_new_df[features]
 Y4 = balanced_new_df['Salary_encoded']
 """)
 
-scaler = MinMaxScaler(feature_range=(0, 1))
-num_col_ = [col for col in X4.columns if X4[col].dtype != 'object']
-X4 = X4
-X4[num_col_] = scaler.fit_transform(X4[num_col_])
+X4, Y4 = analysis_pipeline.get('salary_balanced.scaled')
 
 st.write("### Code for Min-Max Scaling (Normalization)")
 st.code("""
@@ -1360,12 +1248,12 @@ X4[num_col_] = scaler.fit_transform(X4[num_col_])
 st.write(X4.head())
 
 st.write("### X4: ")
-st.write(X4)
+paged_table.paged_dataframe(X4, key='X4_3')
 
 st.write("### Y2: ")
-st.write(Y4)
+paged_table.paged_dataframe(Y4, key='Y4_2')
 
-X4_train, X4_test, Y4_train, Y4_test = train_test_split(X4, Y4, test_size=0.3, random_state=42)
+X4_train, X4_test, Y4_train, Y4_test = analysis_pipeline.get('salary_balanced.split')
 
 st.write("### Code for Splitting Data into Training and Testing Sets")
 st.code("""
@@ -1376,24 +1264,24 @@ st.write("### **Observation**")
 st.write("We do this so that we can split the new dataframe to Train and Test set.")
 
 st.write('### Training Features (X4_train):')
-st.dataframe(X4_train)
+paged_table.paged_dataframe(X4_train, key='X4_train_2')
 
 st.write('### Testing Features (X4_test):')
-st.dataframe(X4_test)
+paged_table.paged_dataframe(X4_test, key='X4_test_2')
 
 st.write('### Training Target Variable (Y4_train):')
-st.dataframe(Y4_train)
+paged_table.paged_dataframe(Y4_train, key='Y4_train_2')
 
 st.write('### Testing Target Variable (Y4_test):')
-st.dataframe(Y4_test)
+paged_table.paged_dataframe(Y4_test, key='Y4_test_2')
 
 st.markdown("""
 *  Both datasets show a systematic approach to data preparation for machine learning, with encoded representations of job type, industry, location, and necessary abilities. Effective training and evaluation of models depend on this consistent feature set, which guarantees that the models can generalize well to new data.
 *  The binary values for both target variables are encoded wage categories, with '1' most likely denoting a certain salary level (such as "Mid Level" or "Senior Level") and '0' denoting another level (such as "Entry Level"). Effective model training and evaluation are made possible by this binary encoding, which also makes classification problems involving the prediction of wage categories based on the features in X4_train and X4_test easier.
 """)
 
-clf = RandomForestClassifier(random_state=42)
-clf.fit(X4_train, Y4_train)
+clf = analysis_pipeline.get('salary_balanced.model')
+evaluation = analysis_pipeline.get('salary_balanced.evaluation')
 
 st.code("""
 * clf = RandomForestClassifier(random_state=42)
@@ -1420,8 +1308,8 @@ st.write('### Converting the .unique results to a list')
 st.write(balanced_salaryCategory_list)
 
 
-Y4_pred = clf.predict(X4_test)
-accuracy = accuracy_score(Y4_test, Y4_pred)
+Y4_pred = evaluation['Y_pred']
+accuracy = evaluation['accuracy']
 
 st.write('### Y4_pred and accuracy:')
 st.code("""
@@ -1436,11 +1324,8 @@ st.write("### Feature_importance")
 st.code("feature_importance = clf.feature_importances_")
 st.write(feature_importance)
 
-importance_df = pd.DataFrame({
-    'Feature': X4.columns,
-    'Importance': feature_importance
-})
-importance_df = importance_df.sort_values(by='Importance', ascending=False).reset_index(drop=True)
+# Sorted by importance for better readability
+importance_df = evaluation['importance_df']
 
 st.code("""
         importance_df = pd.DataFrame({
@@ -1462,4 +1347,7 @@ tree.plot_tree(clf.estimators_[0], filled=True, feature_names=features, class_na
 st.pyplot(plt)
 
 st.write("### **Observation**")
-st.write("By doing the second training we were able to increase the accuracy of the program. This was possible by adding an importance analysis, by doing this it was able to focus on what was the most important aspect and was able to predict better. Adding the Visual Analysis also allows the program to refine the features and adjust the model parameters.")
\ No newline at end of file
+st.write("By doing the second training we were able to increase the accuracy of the program. This was possible by adding an importance analysis, by doing this it was able to focus on what was the most important aspect and was able to predict better. Adding the Visual Analysis also allows the program to refine the features and adjust the model parameters.")
+st.subheader("Pipeline Stages")
+st.dataframe(pd.DataFrame(analysis_pipeline.timing_summary()), use_container_width=True, hide_index=True)
+st.write("Every computation on this page is a stage in `analysis.py`. 'computed' stages ran on this run, 'disk' stages were loaded from `data/pipeline/`, and 'memory' stages were reused from an earlier run. Only the stages downstream of a changed input are recomputed.")
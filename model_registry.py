@@ -0,0 +1,125 @@
+"""Process-wide registry for the trained Random Forest models.
+
+Streamlit re-executes dashMain.py on every interaction, but imported modules
+stay alive for the whole server process. Keeping the loaded forests here means
+each joblib file is read once and then shared by every session. Models are only
+loaded the first time a page asks for them.
+"""
+import json
+import multiprocessing
+import os
+import threading
+import time
+
+import joblib
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+MODEL_DIR = os.path.join(BASE_DIR, 'models')
+
+MODEL_FILES = {
+    'automation': 'RFC_Automation.joblib',
+    'growth': 'RFC_GrowthPrediction.joblib',
+    'salary': 'RFC_Salary.joblib',
+    'salary2nd': 'RFC_Salary2nd.joblib',
+}
+
+METADATA_PATH = os.path.join(MODEL_DIR, 'metadata.json')
+
+_models = {}
+_stats = {}
+_metadata = {}
+_lock = threading.Lock()
+
+
+def model_path(name):
+    return os.path.join(MODEL_DIR, MODEL_FILES[name])
+
+
+def model_version(name):
+    # The file's mtime and size are enough to notice a retrained model
+    stat = os.stat(model_path(name))
+    return f"{stat.st_mtime_ns:x}-{stat.st_size:x}"
+
+
+def forest_nbytes(clf):
+    # Size of the node and value arrays held by every tree in the forest
+    total = 0
+    for estimator in clf.estimators_:
+        state = estimator.tree_.__getstate__()
+        total += state['nodes'].nbytes + state['values'].nbytes
+    return total
+
+
+def get_model(name):
+    """Return the shared model for ``name``, loading it on first use.
+
+    The model is reloaded if its file changed on disk since it was loaded.
+    Callers must treat the returned estimator as read-only.
+    """
+    version = model_version(name)
+    entry = _models.get(name)
+    if entry is not None and entry[0] == version:
+        return entry[1]
+
+    with _lock:
+        entry = _models.get(name)
+        if entry is not None and entry[0] == version:
+            return entry[1]
+
+        start = time.perf_counter()
+        clf = joblib.load(model_path(name))
+        load_seconds = time.perf_counter() - start
+
+        _models[name] = (version, clf)
+        _stats[name] = {
+            'Model': name,
+            'File': MODEL_FILES[name],
+            'Version': version,
+            'Trees': len(clf.estimators_),
+            'Load Time (s)': round(load_seconds, 4),
+            'Memory (MB)': round(forest_nbytes(clf) / 1024 ** 2, 2),
+            'File Size (MB)': round(os.path.getsize(model_path(name)) / 1024 ** 2, 2),
+        }
+        return clf
+
+
+def pool_context(names):
+    """Multiprocessing context for a pool of workers that use the models ``names``.
+
+    Where processes fork, the models are loaded here first and the workers
+    share their pages copy-on-write. That is the only sharing: spawned workers,
+    and joblib memory-mapping too (sklearn's trees copy their node arrays on
+    unpickling), each end up with a private copy of every forest.
+    """
+    if 'fork' in multiprocessing.get_all_start_methods():
+        for name in names:
+            get_model(name)
+        return multiprocessing.get_context('fork')
+    return multiprocessing.get_context('spawn')
+
+
+def loaded_models():
+    return [name for name in MODEL_FILES if name in _models]
+
+
+def model_stats():
+    """Load time and memory footprint of every model loaded so far."""
+    return [_stats[name] for name in loaded_models()]
+
+
+def load_metadata():
+    """Training metadata written by train.py, or an empty dict if there is none yet."""
+    if not os.path.exists(METADATA_PATH):
+        return {}
+    stat = os.stat(METADATA_PATH)
+    key = (stat.st_mtime_ns, stat.st_size)
+    if key not in _metadata:
+        with open(METADATA_PATH) as f:
+            models = json.load(f).get('models', {})
+        _metadata.clear()
+        _metadata[key] = models
+    return _metadata[key]
+
+
+def model_metadata(name):
+    return load_metadata().get(name)
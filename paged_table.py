@@ -0,0 +1,163 @@
+"""Paged table for showing large frames in Streamlit.
+
+st.dataframe serializes and sends the whole frame on every rerun. The paged
+table filters and sorts on the server and only sends the visible page, so the
+cost of a rerun depends on the page size rather than on the number of rows.
+
+Sorting only orders as many rows as the current page needs (np.argpartition
+followed by a sort of that prefix), and filters are applied as a single
+vectorized mask over the column. Ties are broken by row position, so every
+page is a slice of the same total order and paging through all pages shows
+each row exactly once; ``python paged_table.py`` checks this on the dataset.
+"""
+import sys
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+PAGE_SIZES = (25, 50, 100, 500)
+NO_COLUMN = '(none)'
+
+
+def sort_keys(column):
+    """Float keys that order ``column``, with missing values as NaN."""
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        codes = column.cat.codes.to_numpy().astype(np.float64)
+    elif pd.api.types.is_numeric_dtype(column) or pd.api.types.is_bool_dtype(column):
+        return column.to_numpy(dtype=np.float64, na_value=np.nan)
+    else:
+        codes = pd.factorize(column, sort=True)[0].astype(np.float64)
+    codes[codes < 0] = np.nan
+    return codes
+
+
+def top_positions(keys, stop, ascending=True):
+    """Positions of the first ``stop`` rows in sort order; missing values go last.
+
+    Rows with equal keys are ordered by position, so the order is total.
+    """
+    keys = keys if ascending else -keys
+    candidates = np.arange(len(keys))
+    if stop < len(keys):
+        # Only the rows up to the end of the page need to be fully ordered:
+        # those before the stop-th key, plus every row tied with it
+        boundary = keys[np.argpartition(keys, stop - 1)[stop - 1]]
+        if not np.isnan(boundary):
+            candidates = np.flatnonzero(keys <= boundary)
+    return candidates[np.lexsort((candidates, keys[candidates]))][:stop]
+
+
+def filter_mask(column, values=None, low=None, high=None):
+    """Boolean mask of the rows of ``column`` passing the filter."""
+    mask = np.ones(len(column), dtype=bool)
+    if values:
+        mask &= column.isin(values).to_numpy()
+    if low is not None:
+        mask &= (column >= low).to_numpy()
+    if high is not None:
+        mask &= (column <= high).to_numpy()
+    return mask
+
+
+def page_slice(df, page, page_size, sort_by=None, ascending=True, mask=None):
+    """The rows of ``page`` (0-based) after filtering and sorting, and the total row count."""
+    positions = None if mask is None else np.flatnonzero(mask)
+    total = len(df) if positions is None else len(positions)
+    start = page * page_size
+    stop = min(start + page_size, total)
+    if start >= stop:
+        return df.iloc[0:0], total
+
+    if sort_by is None:
+        window = np.arange(start, stop) if positions is None else positions[start:stop]
+    else:
+        column = df[sort_by] if positions is None else df[sort_by].iloc[positions]
+        order = top_positions(sort_keys(column), stop, ascending)[start:stop]
+        window = order if positions is None else positions[order]
+    return df.iloc[window], total
+
+
+def _filter_controls(df, key):
+    columns = st.columns((1, 2))
+    filter_by = columns[0].selectbox('Filter column', [NO_COLUMN] + list(df.columns), key=f"{key}_filter_by")
+    if filter_by == NO_COLUMN:
+        return None
+
+    column = df[filter_by]
+    if pd.api.types.is_numeric_dtype(column) and not pd.api.types.is_bool_dtype(column):
+        low, high = float(column.min()), float(column.max())
+        if not low < high:
+            # A slider needs min < max; there is nothing to narrow down anyway
+            columns[1].caption(f"{filter_by} has no values to filter on." if np.isnan(low) else f"Every row has {filter_by} = {low:g}.")
+            return None
+        low, high = columns[1].slider('Range', low, high, (low, high), key=f"{key}_filter_range_{filter_by}")
+        return filter_mask(column, low=low, high=high)
+
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        options = list(column.cat.categories)
+    else:
+        options = sorted(column.dropna().unique().tolist(), key=str)
+    values = columns[1].multiselect('Values', options, key=f"{key}_filter_values_{filter_by}")
+    return filter_mask(column, values=values) if values else None
+
+
+def paged_dataframe(data, key, page_size=100, filterable=True, sortable=True, hide_index=None):
+    """Show ``data`` one page at a time with server-side sorting and filtering.
+
+    ``key`` must be unique on the page; it prefixes the keys of the controls.
+    By default the index is shown unless it is a plain RangeIndex.
+    """
+    df = data.to_frame() if isinstance(data, pd.Series) else data
+    if hide_index is None:
+        hide_index = isinstance(df.index, pd.RangeIndex)
+
+    with st.container():
+        mask = _filter_controls(df, key) if filterable else None
+
+        controls = st.columns((2, 1, 1, 1))
+        sort_by, ascending = None, True
+        if sortable:
+            sort_column = controls[0].selectbox('Sort by', [NO_COLUMN] + list(df.columns), key=f"{key}_sort_by")
+            if sort_column != NO_COLUMN:
+                sort_by = sort_column
+                ascending = controls[1].radio('Order', ('Ascending', 'Descending'), key=f"{key}_order", horizontal=True) == 'Ascending'
+        page_size = controls[2].selectbox('Rows per page', PAGE_SIZES, index=PAGE_SIZES.index(page_size) if page_size in PAGE_SIZES else 0, key=f"{key}_page_size")
+
+        total = len(df) if mask is None else int(mask.sum())
+        pages = max(1, -(-total // page_size))
+        # The page lives only in the session state: it starts at 1, and a narrower
+        # filter or larger page size can leave it out of range
+        page_key = f"{key}_page"
+        if page_key not in st.session_state:
+            st.session_state[page_key] = 1
+        elif st.session_state[page_key] > pages:
+            st.session_state[page_key] = pages
+        page = int(controls[3].number_input('Page', min_value=1, max_value=pages, step=1, key=page_key)) - 1
+
+        window, total = page_slice(df, page, page_size, sort_by, ascending, mask)
+        st.dataframe(window, use_container_width=True, hide_index=hide_index)
+        first = page * page_size + 1 if total else 0
+        st.caption(f"Rows {first:,}–{page * page_size + len(window):,} of {total:,} (page {page + 1} of {pages})")
+
+
+def check_pages(df, page_size, sort_by=None, ascending=True, mask=None):
+    """Raise ValueError unless the pages of ``df`` together show every filtered row exactly once."""
+    total = len(df) if mask is None else int(mask.sum())
+    shown = [page_slice(df, page, page_size, sort_by, ascending, mask)[0] for page in range(-(-total // page_size))]
+    positions = np.sort(np.concatenate([df.index.get_indexer(window.index) for window in shown])) if shown else np.empty(0, dtype=np.intp)
+    expected = np.arange(len(df)) if mask is None else np.flatnonzero(mask)
+    if not np.array_equal(positions, expected):
+        raise ValueError(f"Pages of {sort_by!r} ({'ascending' if ascending else 'descending'}, {page_size} rows) are not a permutation of the rows")
+
+
+if __name__ == '__main__':
+    import data_store
+
+    dataset = data_store.load_dataset(sys.argv[1] if len(sys.argv) > 1 else data_store.CSV_PATH)
+    for column in [None] + list(dataset.columns):
+        for ascending in (True, False):
+            for page_size in PAGE_SIZES:
+                check_pages(dataset, page_size, column, ascending)
+                check_pages(dataset, page_size, column, ascending, mask=np.arange(len(dataset)) % 3 != 0)
+    print(f"Paging is consistent for all {len(dataset.columns)} columns")
@@ -0,0 +1,141 @@
+"""A small DAG of named stages whose outputs are cached on disk.
+
+Every stage has a key: the SHA-256 of its name, the source of its function,
+its parameters, the keys of the stages it reads and the pipeline's code
+version. The source of a stage function does not cover the helpers it calls,
+so the owner of a pipeline passes a ``version`` that does, usually
+code_version() of the modules the stages use plus the versions of the
+libraries whose output they store. A key therefore changes whenever something
+upstream of the stage, or any of that code, changed. Outputs are written with
+joblib to CACHE_DIR/<stage>-<key>.joblib and also kept in memory for the life
+of the process, so on a Streamlit rerun nothing is recomputed or even re-read.
+
+Asking for a stage only loads or computes what is missing: a stage whose
+output is cached is returned without touching its inputs, and after a change
+only the stages downstream of it run again. Every lookup is recorded with how
+it was served and how long it took.
+"""
+import hashlib
+import inspect
+import json
+import os
+import threading
+import time
+
+import joblib
+
+import atomic_io
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(BASE_DIR, 'data', 'pipeline')
+
+_values = {}
+_lock = threading.RLock()
+
+
+class Stage:
+    """One named step: ``func(*input values, **params)``."""
+
+    def __init__(self, name, func, inputs=(), params=None):
+        self.name = name
+        self.func = func
+        self.inputs = tuple(inputs)
+        self.params = dict(params or {})
+
+
+def code_version(modules, extra=()):
+    """A hash of the source files of ``modules`` and the strings in ``extra``."""
+    digest = hashlib.sha256()
+    for module in modules:
+        with open(module.__file__, 'rb') as f:
+            digest.update(f.read())
+    for value in extra:
+        digest.update(str(value).encode())
+    return digest.hexdigest()[:16]
+
+
+class Pipeline:
+    """A set of stages that refer to each other by name."""
+
+    def __init__(self, stages, cache_dir=CACHE_DIR, version=None):
+        self.stages = {stage.name: stage for stage in stages}
+        self.cache_dir = cache_dir
+        self.version = version
+        self.timings = []
+        self._keys = {}
+
+    def key(self, name):
+        key = self._keys.get(name)
+        if key is None:
+            stage = self.stages[name]
+            payload = json.dumps({
+                'name': name,
+                'source': inspect.getsource(stage.func),
+                'params': stage.params,
+                'inputs': [self.key(input_name) for input_name in stage.inputs],
+                'version': self.version,
+            }, sort_keys=True, default=str)
+            key = hashlib.sha256(payload.encode()).hexdigest()[:16]
+            self._keys[name] = key
+        return key
+
+    def path(self, name):
+        return os.path.join(self.cache_dir, f"{name}-{self.key(name)}.joblib")
+
+    def get(self, name):
+        """Return the output of stage ``name``, computing it and its missing inputs if needed."""
+        key = self.key(name)
+        start = time.perf_counter()
+        with _lock:
+            entry = _values.get(name)
+            if entry is not None and entry[0] == key:
+                self._record(name, 'memory', start)
+                return entry[1]
+
+            path = self.path(name)
+            if os.path.exists(path):
+                value = joblib.load(path)
+                self._record(name, 'disk', start)
+            else:
+                stage = self.stages[name]
+                inputs = [self.get(input_name) for input_name in stage.inputs]
+                start = time.perf_counter()
+                value = stage.func(*inputs, **stage.params)
+                self._record(name, 'computed', start)
+                self._store(name, value)
+            _values[name] = (key, value)
+            return value
+
+    def run(self, names=None):
+        """Outputs of ``names`` (default: every stage) as a dict."""
+        return {name: self.get(name) for name in (names or self.stages)}
+
+    def timing_summary(self):
+        """One row per stage looked up: how it was first served and the total time spent on it."""
+        rows = {}
+        for row in self.timings:
+            entry = rows.setdefault(row['Stage'], {'Stage': row['Stage'], 'Source': row['Source'], 'Lookups': 0, 'Time (ms)': 0.0})
+            entry['Lookups'] += 1
+            entry['Time (ms)'] = round(entry['Time (ms)'] + row['Time (ms)'], 2)
+        return list(rows.values())
+
+    def _store(self, name, value):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self.path(name)
+        with atomic_io.atomic_path(path) as tmp_path:
+            joblib.dump(value, tmp_path)
+
+        # Drop outputs of this stage computed from older inputs
+        prefix = f"{name}-"
+        for file_name in os.listdir(self.cache_dir):
+            old = os.path.join(self.cache_dir, file_name)
+            if file_name.startswith(prefix) and file_name.endswith('.joblib') and old != path and file_name[len(prefix):-len('.joblib')].isalnum():
+                os.remove(old)
+
+    def _record(self, name, source, start):
+        self.timings.append({'Stage': name, 'Source': source, 'Time (ms)': round((time.perf_counter() - start) * 1000, 2)})
+
+
+def clear_memory():
+    with _lock:
+        _values.clear()
@@ -0,0 +1,141 @@
+"""Process-wide LRU cache for single-row predictions.
+
+Users of the Prediction page keep re-scoring the same few combinations of
+inputs, so results are memoized across all sessions. The key is the model
+name, the model file's version and the encoded, unscaled input vector.
+Salary_USD is rounded to a bucket first so nearby salaries share an entry; the
+model is evaluated on the rounded salary, so a cached answer is always the one
+a fresh prediction would give.
+
+Every model encodes the inputs with the classes of its own stored
+preprocessor, so a model keeps getting the codes it was trained on even after
+another model was retrained on different data. Inputs encodes each column once
+per distinct class list, so models fitted on the same vocabulary share the
+work. Each model applies its own stored scaling. predict_all() scores the three
+Prediction page models for one set of inputs at once, evaluating the models
+concurrently in a small thread pool.
+
+The size and the salary bucket can be set with the PREDICTION_CACHE_SIZE and
+PREDICTION_CACHE_SALARY_BUCKET environment variables.
+"""
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+import model_registry
+import preprocessing
+import scoring
+
+CACHE_SIZE = int(os.environ.get('PREDICTION_CACHE_SIZE', 4096))
+SALARY_BUCKET_USD = float(os.environ.get('PREDICTION_CACHE_SALARY_BUCKET', 1000))
+
+# Models scored by predict_all, in the order the Prediction page shows them
+PREDICT_ALL_MODELS = ('automation', 'growth', 'salary2nd')
+
+_pool = ThreadPoolExecutor(max_workers=len(PREDICT_ALL_MODELS), thread_name_prefix='predict')
+
+
+class PredictionCache:
+    """A thread-safe LRU mapping with hit and miss counters."""
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, key, compute):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        value = compute()
+
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'Hits': self.hits,
+                'Misses': self.misses,
+                'Hit Ratio': round(self.hits / lookups, 3) if lookups else 0.0,
+                'Entries': len(self._entries),
+                'Max Entries': self.maxsize,
+                'Salary Bucket (USD)': SALARY_BUCKET_USD,
+            }
+
+
+cache = PredictionCache(CACHE_SIZE)
+
+
+def quantize_salary(salary, bucket=SALARY_BUCKET_USD):
+    if not bucket:
+        return float(salary)
+    return float(round(salary / bucket) * bucket)
+
+
+class Inputs:
+    """One set of raw inputs (source column -> value), encoded on demand for each model."""
+
+    def __init__(self, values):
+        self.values = dict(values)
+        self._codes = {}
+
+    def feature_row(self, preprocessor):
+        """The unscaled features of ``preprocessor``'s model, encoded with its own classes."""
+        row = []
+        for source in preprocessor.source_columns:
+            value = self.values[source]
+            if source != 'Salary_USD':
+                # Equal class lists are one object (preprocessing.shared_classes)
+                key = (source, id(preprocessor.classes[source]))
+                code = self._codes.get(key)
+                if code is None:
+                    code = self._codes[key] = preprocessor.vocab.encode_value(source, value)
+                value = code
+            row.append(value)
+        return row
+
+
+def predict(name, inputs):
+    """Class code and class probabilities of model ``name`` for one set of Inputs."""
+    preprocessor = preprocessing.get_preprocessor(name)
+    # Quantize and key on the unscaled features; scaling is applied only to compute
+    row = [quantize_salary(value) if feature == 'Salary_USD' else value for feature, value in zip(preprocessor.features, inputs.feature_row(preprocessor))]
+    key = (name, model_registry.model_version(name), tuple(row))
+
+    def compute():
+        engine = scoring.scoring_engine(name, 1)
+        proba = engine.predict_proba(np.asarray([preprocessor.scale_row(row)], dtype=np.float64))[0]
+        return int(engine.classes_[proba.argmax()]), tuple(float(p) for p in proba)
+
+    return cache.get_or_compute(key, compute)
+
+
+def predict_all(inputs, models=PREDICT_ALL_MODELS):
+    """Predict every model in ``models`` for one set of Inputs.
+
+    Returns a dict of model name -> (class code, class probabilities). The
+    models are evaluated concurrently; repeated inputs are served from the cache.
+    """
+    futures = {name: _pool.submit(predict, name, inputs) for name in models}
+    return {name: future.result() for name, future in futures.items()}
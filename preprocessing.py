@@ -0,0 +1,161 @@
+"""One fitted preprocessing step per model: encoding, scaling and column selection.
+
+A Preprocessor turns rows in the AI.csv schema into a model's feature matrix.
+It label-encodes the categorical source columns against fixed class lists,
+optionally min-max scales the result and selects the model's features in
+order; it also encodes the model's target. Everything it needs is learned by
+fit() once, at training time, and stored with the model:
+
+- train.py writes each dashboard model's preprocessor into models/metadata.json,
+  and scoring and the Prediction page read it back with get_preprocessor();
+- main.py's analysis keeps it as a pipeline stage next to the model it feeds.
+
+Serving only ever applies it (transform(), or its vocab and scale_row() for
+single rows), so nothing is refitted at request time.
+The scaling arithmetic is the same as sklearn's MinMaxScaler, so scaled
+features are bit-for-bit what fit_transform would have produced.
+"""
+import threading
+
+import numpy as np
+import pandas as pd
+
+import model_registry
+import vocabularies
+
+PREPROCESSOR_FORMAT_VERSION = 1
+
+_loaded = {}
+_lock = threading.Lock()
+
+# Class lists by value, so preprocessors fitted on the same vocabulary share one list object
+_class_lists = {}
+
+
+def shared_classes(values):
+    key = tuple(values)
+    return _class_lists.setdefault(key, list(key))
+
+
+def fit_classes(values):
+    # The classes LabelEncoder would learn: the sorted distinct values
+    return sorted(str(value) for value in pd.Series(values).dropna().unique())
+
+
+class Preprocessor:
+    """Fitted encoding, min-max scaling and feature selection for one model."""
+
+    def __init__(self, features, classes, target=None, target_classes=None, label=None, scale=None):
+        self.features = list(features)
+        self.classes = {col: shared_classes(values) for col, values in classes.items()}
+        self.target = target
+        self.target_classes = list(target_classes) if target_classes is not None else None
+        self.label = label or (vocabularies.ENCODED_COLUMNS.get(target) if target else None)
+        # Feature -> [min, max] seen at fit time, or None for unscaled features
+        self.scale = {feature: list(bounds) for feature, bounds in scale.items()} if scale else None
+        self.vocab = vocabularies.Vocabularies({**self.classes, **({target: self.target_classes} if target else {})})
+
+    @classmethod
+    def fit(cls, df, features, target=None, target_classes=None, label=None, vocab=None, scale=False):
+        """Learn the encoding (and min-max bounds if ``scale``) from ``df``.
+
+        With ``vocab`` the stored vocabularies are used instead of the classes
+        present in ``df``, so codes match every other model trained on them.
+        """
+        classes = {}
+        for feature in features:
+            source = vocabularies.SOURCE_COLUMNS[feature]
+            if source != 'Salary_USD':
+                classes[source] = vocab.classes[source] if vocab is not None else fit_classes(df[source])
+        if target is not None and target_classes is None:
+            target_classes = vocab.classes[target] if vocab is not None else fit_classes(df[target])
+
+        preprocessor = cls(features, classes, target, target_classes, label)
+        if scale:
+            X = preprocessor.encode(df)
+            preprocessor.scale = {feature: [float(X[feature].min()), float(X[feature].max())] for feature in features}
+        return preprocessor
+
+    @property
+    def source_columns(self):
+        return [vocabularies.SOURCE_COLUMNS[feature] for feature in self.features]
+
+    def encode(self, df, strict=True):
+        """The model's features from ``df``, encoded but not scaled.
+
+        With ``strict=False`` values outside the fitted classes become -1.
+        """
+        X = pd.DataFrame(index=df.index)
+        for feature, source in zip(self.features, self.source_columns):
+            if source == 'Salary_USD':
+                X[feature] = df[source]
+            else:
+                X[feature] = self.vocab.encode_column(source, df[source], strict=strict)
+        return X
+
+    def _scale_params(self):
+        # MinMaxScaler(feature_range=(0, 1)): constant columns keep a range of 1
+        bounds = np.asarray([self.scale[feature] for feature in self.features], dtype=np.float64)
+        data_range = bounds[:, 1] - bounds[:, 0]
+        data_range[data_range == 0.0] = 1.0
+        scale = 1.0 / data_range
+        return scale, 0.0 - bounds[:, 0] * scale
+
+    def scale_encoded(self, X):
+        """Apply the fitted min-max scaling to the output of encode()."""
+        if self.scale is None:
+            return X
+        scale, offset = self._scale_params()
+        values = X.to_numpy(dtype=np.float64)
+        values *= scale
+        values += offset
+        return pd.DataFrame(values, index=X.index, columns=self.features)
+
+    def transform(self, df, strict=True):
+        """The model's feature matrix for ``df``: encoded, scaled and in feature order."""
+        return self.scale_encoded(self.encode(df, strict))
+
+    def scale_row(self, row):
+        """Apply the fitted min-max scaling to one encoded row in feature order."""
+        if self.scale is None:
+            return list(row)
+        scale, offset = self._scale_params()
+        return list(np.asarray(row, dtype=np.float64) * scale + offset)
+
+    def encode_target(self, df):
+        return pd.Series(self.vocab.encode_column(self.target, df[self.target]), index=df.index, name=self.label)
+
+    def to_dict(self):
+        return {
+            'format_version': PREPROCESSOR_FORMAT_VERSION,
+            'features': self.features,
+            'classes': self.classes,
+            'target': self.target,
+            'target_classes': self.target_classes,
+            'label': self.label,
+            'scale': self.scale,
+        }
+
+    @classmethod
+    def from_dict(cls, payload):
+        if payload.get('format_version') != PREPROCESSOR_FORMAT_VERSION:
+            raise ValueError(f"Unsupported preprocessor format: {payload.get('format_version')}")
+        return cls(payload['features'], payload['classes'], payload['target'], payload['target_classes'], payload['label'], payload['scale'])
+
+
+def get_preprocessor(name):
+    """The preprocessor stored with model ``name``, loaded once per metadata version."""
+    metadata = model_registry.model_metadata(name)
+    payload = (metadata or {}).get('preprocessing')
+    if payload is None:
+        raise FileNotFoundError(f"No preprocessing stored for model {name!r}; run `python train.py {name}`")
+
+    # Keyed by the cached metadata entry itself, which is replaced when the file changes
+    entry = _loaded.get(name)
+    if entry is None or entry[0] is not payload:
+        with _lock:
+            entry = _loaded.get(name)
+            if entry is None or entry[0] is not payload:
+                entry = (payload, Preprocessor.from_dict(payload))
+                _loaded[name] = entry
+    return entry[1]
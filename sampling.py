@@ -0,0 +1,62 @@
+"""Stratified per-class resampling for the balanced experiments.
+
+stratified_sample() replaces the loop of ``df[df[target] == value].sample(n)``
+plus ``pd.concat`` that main.py, the Data Cleaning page and train.py each used
+to rebalance a target. Rows are grouped by class with one stable argsort, the
+rows to keep are drawn per class, and the result is built with a single take(),
+so the frame is copied once however many classes there are.
+
+Each class draws from its own ``RandomState(random_state)``, exactly as
+``DataFrame.sample(n, random_state=...)`` does on the filtered class, so a
+sample is row-for-row the one the old loop produced. Classes come out in
+``value_counts()`` order, as before.
+
+The target count can be one number for every class, a dict of class -> count,
+or None for the size of the smallest class (plain down-sampling). A class with
+fewer rows than its target is over-sampled with replacement.
+"""
+import numpy as np
+import pandas as pd
+
+
+def class_targets(counts, per_class=None):
+    """Class -> number of rows to draw, for the non-empty classes in ``counts``."""
+    counts = counts[counts > 0]
+    if per_class is None:
+        per_class = int(counts.min())
+    if isinstance(per_class, dict):
+        return {label: int(per_class[label]) for label in counts.index}
+    return {label: int(per_class) for label in counts.index}
+
+
+def stratified_sample(df, target, per_class=None, classes=None, random_state=42, replace=None):
+    """Rows of ``df`` resampled to ``per_class`` rows of each class of ``target``.
+
+    Only ``classes`` are kept if given. With ``replace=None`` a class is
+    sampled with replacement only when it has fewer rows than its target;
+    True or False forces one or the other. The result has a fresh RangeIndex.
+    """
+    values = df[target]
+    if classes is not None:
+        keep = values.isin(classes).to_numpy()
+        df = df[keep]
+        values = values[keep]
+
+    counts = values.value_counts()
+    targets = class_targets(counts, per_class)
+
+    # Positions of every row grouped by class, original order kept within a class
+    codes = pd.Categorical(values, categories=list(targets)).codes
+    order = np.argsort(codes, kind='stable')
+    starts = np.searchsorted(codes[order], np.arange(len(targets)))
+
+    positions = []
+    for code, (label, n) in enumerate(targets.items()):
+        size = int(counts[label])
+        members = order[starts[code]:starts[code] + size]
+        with_replacement = size < n if replace is None else replace
+        rng = np.random.RandomState(random_state)
+        positions.append(members[rng.choice(size, size=n, replace=with_replacement)])
+
+    positions = np.concatenate(positions) if positions else np.empty(0, dtype=np.intp)
+    return df.take(positions).reset_index(drop=True)
@@ -0,0 +1,121 @@
+"""Vectorized batch scoring of job postings in the AI.csv schema.
+
+Every row of a chunk is transformed by each model's stored preprocessor (see
+preprocessing.py) and scored by the Automation Risk, Growth Projection and
+Salary Category models in a single predict_proba call per model. Large files are read and scored chunk by chunk.
+"""
+import numpy as np
+import pandas as pd
+
+import flat_forest
+import lookup_table
+import model_registry
+import preprocessing
+import train
+import vocabularies
+
+CHUNK_ROWS = 50000
+
+# Batches up to this size go through the flat NumPy forests, larger ones through sklearn
+FLAT_MAX_ROWS = 256
+
+# Model name -> (column holding the predicted label, column holding its probability)
+PREDICTION_COLUMNS = {
+    'automation': ('Predicted_Automation_Risk', 'Automation_Risk_Probability'),
+    'growth': ('Predicted_Job_Growth_Projection', 'Job_Growth_Projection_Probability'),
+    'salary2nd': ('Predicted_Salary_Category', 'Salary_Category_Probability'),
+}
+
+
+def required_columns(models=tuple(PREDICTION_COLUMNS)):
+    columns = []
+    for name in models:
+        for feature in train.MODEL_SPECS[name]['features']:
+            if vocabularies.SOURCE_COLUMNS[feature] not in columns:
+                columns.append(vocabularies.SOURCE_COLUMNS[feature])
+    return columns
+
+
+def class_labels(name):
+    metadata = model_registry.model_metadata(name)
+    if metadata is not None:
+        return metadata['classes']
+    spec = train.MODEL_SPECS[name]
+    return spec.get('classes', vocabularies.load_vocabularies().classes[spec['target']])
+
+
+def scoring_engine(name, n_rows):
+    """The fastest exact predict_proba implementation for ``n_rows`` rows."""
+    # Fully categorical models are a table lookup; otherwise pick by batch size
+    engine = lookup_table.get_lookup_table(name)
+    if engine is None:
+        if n_rows <= FLAT_MAX_ROWS:
+            engine = flat_forest.get_flat_forest(name)
+        else:
+            engine = model_registry.get_model(name)
+    return engine
+
+
+def predict_frame(name, df):
+    """Labels and class probabilities for rows in the AI.csv schema.
+
+    Rows with a value the model's preprocessor has never seen get no prediction.
+    """
+    preprocessor = preprocessing.get_preprocessor(name)
+    encoded = preprocessor.encode(df, strict=False)
+    valid = (encoded.drop(columns=['Salary_USD'], errors='ignore') >= 0).all(axis=1) & encoded.notna().all(axis=1)
+
+    forest = scoring_engine(name, int(valid.sum()))
+    classes = np.asarray(class_labels(name), dtype=object)[forest.classes_]
+    labels = pd.Series(None, index=df.index, dtype=object)
+    proba = pd.DataFrame(np.nan, index=df.index, columns=classes)
+    if valid.any():
+        valid_proba = forest.predict_proba(preprocessor.scale_encoded(encoded[valid]))
+        labels[valid] = classes[valid_proba.argmax(axis=1)]
+        proba.loc[valid] = valid_proba
+    return labels, proba
+
+
+def score_frame(df, models=tuple(PREDICTION_COLUMNS), probabilities=False):
+    """Return ``df`` with a predicted label and probability column per model.
+
+    With ``probabilities`` the probability of every class is added as well.
+    """
+    missing = [col for col in required_columns(models) if col not in df.columns]
+    if missing:
+        raise ValueError(f"Missing columns: {', '.join(missing)}")
+
+    scored = df.copy()
+    for name in models:
+        label_col, proba_col = PREDICTION_COLUMNS[name]
+        labels, proba = predict_frame(name, df)
+        scored[label_col] = labels
+        scored[proba_col] = proba.max(axis=1)
+        if probabilities:
+            for label in proba.columns:
+                scored[f"{proba_col}_{label.replace(' ', '_')}"] = proba[label]
+    return scored
+
+
+def score_chunks(chunks, models=tuple(PREDICTION_COLUMNS), probabilities=False):
+    for chunk in chunks:
+        yield score_frame(chunk, models, probabilities=probabilities)
+
+
+def read_chunks(source, chunksize=CHUNK_ROWS):
+    return pd.read_csv(source, chunksize=chunksize)
+
+
+def score_csv(source, chunksize=CHUNK_ROWS, models=tuple(PREDICTION_COLUMNS), progress=None):
+    """Score a whole CSV file or buffer chunk by chunk and return one frame.
+
+    ``progress`` is called with the number of rows scored so far.
+    """
+    scored = []
+    rows = 0
+    for chunk in score_chunks(read_chunks(source, chunksize), models):
+        scored.append(chunk)
+        rows += len(chunk)
+        if progress is not None:
+            progress(rows)
+    return pd.concat(scored, ignore_index=True) if scored else pd.DataFrame()
@@ -0,0 +1,85 @@
+"""Multi-resolution tile pyramids for the large forest images.
+
+An image is stored as a stack of zoom levels, each half the size of the next,
+down to a level that fits in a single tile. Every level is cut into
+TILE_SIZE x TILE_SIZE WebP tiles under <dir>/<level>/<row>_<col>.webp with a
+meta.json describing the levels, so a viewer only has to read the tiles that
+are on screen at its zoom level.
+"""
+import json
+import math
+import os
+
+from PIL import Image
+
+import atomic_io
+
+TILE_SIZE = 256
+TILE_FORMAT = 'WEBP'
+TILE_QUALITY = 80
+TILE_FORMAT_VERSION = 1
+
+
+def level_count(width, height, tile_size=TILE_SIZE):
+    return max(1, math.ceil(math.log2(max(width, height) / tile_size)) + 1)
+
+
+def write_pyramid(image, path, extra_meta=None):
+    """Cut ``image`` into a tile pyramid at ``path``, replacing any previous one."""
+    image = image.convert('RGB')
+    levels = level_count(*image.size)
+    sizes = []
+
+    with atomic_io.atomic_directory(path) as tmp_path:
+        for level in range(levels):
+            scale = 2 ** (levels - 1 - level)
+            width, height = math.ceil(image.width / scale), math.ceil(image.height / scale)
+            level_image = image if scale == 1 else image.resize((width, height), Image.LANCZOS)
+            sizes.append([width, height])
+
+            level_dir = os.path.join(tmp_path, str(level))
+            os.makedirs(level_dir)
+            for row in range(math.ceil(height / TILE_SIZE)):
+                for col in range(math.ceil(width / TILE_SIZE)):
+                    box = (col * TILE_SIZE, row * TILE_SIZE, min((col + 1) * TILE_SIZE, width), min((row + 1) * TILE_SIZE, height))
+                    level_image.crop(box).save(os.path.join(level_dir, f"{row}_{col}.webp"), format=TILE_FORMAT, quality=TILE_QUALITY)
+
+        meta = {
+            'format_version': TILE_FORMAT_VERSION,
+            'tile_size': TILE_SIZE,
+            'levels': levels,
+            'sizes': sizes,
+        }
+        meta.update(extra_meta or {})
+        with open(os.path.join(tmp_path, 'meta.json'), 'w') as f:
+            json.dump(meta, f, indent=2)
+
+    return meta
+
+
+def read_meta(path):
+    """The pyramid's meta.json, or None if there is no usable pyramid at ``path``."""
+    try:
+        with open(os.path.join(path, 'meta.json')) as f:
+            meta = json.load(f)
+    except FileNotFoundError:
+        return None
+    return meta if meta.get('format_version') == TILE_FORMAT_VERSION else None
+
+
+def level_grid(meta, level):
+    """(rows, cols) of tiles at ``level``."""
+    width, height = meta['sizes'][level]
+    return math.ceil(height / meta['tile_size']), math.ceil(width / meta['tile_size'])
+
+
+def tile_size(meta, level, row, col):
+    """Pixel (width, height) of one tile; tiles on the right and bottom edges can be smaller."""
+    width, height = meta['sizes'][level]
+    size = meta['tile_size']
+    return min(size, width - col * size), min(size, height - row * size)
+
+
+def read_tile(path, level, row, col):
+    with open(os.path.join(path, str(level), f"{row}_{col}.webp"), 'rb') as f:
+        return f.read()
@@ -0,0 +1,154 @@
+"""Offline training for the dashboard's Random Forest models.
+
+Rebuilds the four models from data/AI.csv the same way the Data Cleaning page
+used to, writes them to models/ and records their features, class labels,
+metrics, feature importances, training time, forest size (see
+forest_stats.py) and fitted preprocessing (see preprocessing.py) in
+models/metadata.json.
+The dashboard only reads these files; it never fits a model itself.
+
+    python train.py                   # retrain all four models
+    python train.py salary2nd         # retrain only the listed models
+    python train.py --evaluate-only   # refresh metadata for the current model files
+"""
+import argparse
+import time
+from datetime import datetime, timezone
+
+import joblib
+import sklearn
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.model_selection import train_test_split
+
+import atomic_io
+import data_store
+import forest_stats
+import model_registry
+import preprocessing
+import sampling
+import vocabularies
+
+METADATA_FORMAT_VERSION = 1
+RANDOM_STATE = 42
+
+MODEL_SPECS = {
+    'automation': {
+        'features': ['Job_encoded', 'Industry_encoded', 'Size_encoded', 'Location_encoded', 'AI_Adoption_encoded', 'Skills_encoded', 'Remote_encoded', 'Salary_USD', 'Growth_encoded'],
+        'target': 'Automation_Risk',
+        'test_size': 0.1,
+    },
+    'growth': {
+        'features': ['Job_encoded', 'Industry_encoded', 'Size_encoded', 'Location_encoded', 'AI_Adoption_encoded', 'Skills_encoded', 'Remote_encoded', 'Salary_USD', 'Automation_encoded'],
+        'target': 'Job_Growth_Projection',
+        'test_size': 0.1,
+    },
+    'salary': {
+        'features': ['Job_encoded', 'Industry_encoded', 'Size_encoded', 'Location_encoded', 'AI_Adoption_encoded', 'Skills_encoded', 'Remote_encoded', 'Automation_encoded', 'Growth_encoded'],
+        'target': 'Salary_Category',
+        'test_size': 0.3,
+    },
+    # Trained on a balanced subset without the rare Entry Level category
+    'salary2nd': {
+        'features': ['Job_encoded', 'Industry_encoded', 'Location_encoded', 'Skills_encoded'],
+        'target': 'Salary_Category',
+        'test_size': 0.3,
+        'classes': ['Mid Level', 'Senior Level'],
+        'sample_per_class': 172,
+    },
+}
+
+
+def balanced_subset(dataset, target, classes, n):
+    # Keep only the given classes and sample n rows of each, in value_counts order
+    return sampling.stratified_sample(dataset, target, n, classes, RANDOM_STATE)
+
+
+def training_data(name, dataset, vocab):
+    """Feature matrix, encoded target and fitted preprocessor for one model."""
+    spec = MODEL_SPECS[name]
+    target = spec['target']
+
+    if 'sample_per_class' in spec:
+        dataset = balanced_subset(dataset, target, spec['classes'], spec['sample_per_class'])
+
+    preprocessor = preprocessing.Preprocessor.fit(dataset, spec['features'], target, spec.get('classes'), vocab=vocab)
+    return preprocessor.transform(dataset), preprocessor.encode_target(dataset), preprocessor
+
+
+def evaluate(name, clf, dataset, vocab):
+    spec = MODEL_SPECS[name]
+    X, y, preprocessor = training_data(name, dataset, vocab)
+    X_train, X_test, Y_train, Y_test = train_test_split(X, y, test_size=spec['test_size'], random_state=RANDOM_STATE)
+
+    training_seconds = None
+    if clf is None:
+        clf = RandomForestClassifier(random_state=RANDOM_STATE)
+        start = time.perf_counter()
+        clf.fit(X_train, Y_train)
+        training_seconds = round(time.perf_counter() - start, 4)
+
+    importances = sorted(zip(spec['features'], clf.feature_importances_), key=lambda item: item[1], reverse=True)
+    metadata = {
+        'file': model_registry.MODEL_FILES[name],
+        'features': spec['features'],
+        'target': spec['target'],
+        'classes': preprocessor.target_classes,
+        'test_size': spec['test_size'],
+        'random_state': RANDOM_STATE,
+        'n_estimators': len(clf.estimators_),
+        'rows_train': len(X_train),
+        'rows_test': len(X_test),
+        'train_accuracy': clf.score(X_train, Y_train),
+        'test_accuracy': clf.score(X_test, Y_test),
+        'feature_importances': [{'Feature': feature, 'Importance': float(value)} for feature, value in importances],
+        'forest_stats': forest_stats.compute_stats(clf)['summary'],
+        'preprocessing': preprocessor.to_dict(),
+        'training_seconds': training_seconds,
+        'trained_at': datetime.now(timezone.utc).isoformat(timespec='seconds') if training_seconds is not None else None,
+        'data_version': data_store.data_version(),
+        'sklearn_version': sklearn.__version__,
+    }
+    return clf, metadata
+
+
+def write_metadata(models):
+    payload = {'format_version': METADATA_FORMAT_VERSION, 'models': models}
+    atomic_io.write_json(model_registry.METADATA_PATH, payload, indent=2)
+
+
+def train(names, evaluate_only=False):
+    dataset = data_store.load_dataset()
+    vocab = vocabularies.build_vocabularies()
+
+    models = dict(model_registry.load_metadata())
+    for name in names:
+        current = model_registry.get_model(name) if evaluate_only else None
+        clf, metadata = evaluate(name, current, dataset, vocab)
+
+        if not evaluate_only:
+            path = model_registry.model_path(name)
+            with atomic_io.atomic_path(path) as tmp_path:
+                joblib.dump(clf, tmp_path)
+
+        previous = models.get(name, {}).get('forest_stats')
+        models[name] = metadata
+        print(f"{name}: train {metadata['train_accuracy'] * 100:.2f}%  test {metadata['test_accuracy'] * 100:.2f}%"
+              + (f"  ({metadata['training_seconds']:.2f}s)" if metadata['training_seconds'] is not None else ''))
+        if previous is not None:
+            current_stats = metadata['forest_stats']
+            print(f"  forest: {current_stats['nodes']} nodes ({current_stats['nodes'] - previous['nodes']:+d}), "
+                  f"{current_stats['bytes'] / 1024 ** 2:.2f} MB ({(current_stats['bytes'] - previous['bytes']) / 1024 ** 2:+.2f}), "
+                  f"mean depth {current_stats['mean_depth']} ({current_stats['mean_depth'] - previous['mean_depth']:+.2f})")
+
+    write_metadata({name: models[name] for name in model_registry.MODEL_FILES if name in models})
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('models', nargs='*', help=f"models to train: {', '.join(model_registry.MODEL_FILES)} (default: all)")
+    parser.add_argument('--evaluate-only', action='store_true', help='score the existing model files instead of refitting them')
+    args = parser.parse_args()
+    unknown = [name for name in args.models if name not in model_registry.MODEL_FILES]
+    if unknown:
+        parser.error(f"unknown model: {', '.join(unknown)}")
+    train(args.models or list(model_registry.MODEL_FILES), args.evaluate_only)
@@ -0,0 +1,114 @@
+"""Render single trees of the Random Forest models as SVG, off the page thread.
+
+The Machine Learning page lets users pick any estimator of a forest. Trees are
+drawn with sklearn's plot_tree on a background worker and the SVG is kept in
+a process-wide LRU cache keyed by model version, tree index and depth limit,
+so a retrained model never shows a stale drawing and a tree is only drawn once.
+
+Drawing uses matplotlib's object-oriented API (no pyplot state). A single
+worker serializes drawings, because matplotlib's text layout is not safe to
+run from several threads at once.
+"""
+import io
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from sklearn.tree import plot_tree
+
+import model_registry
+import scoring
+
+CACHE_SIZE = int(os.environ.get('TREE_RENDER_CACHE_SIZE', 64))
+
+# Depth limits offered by the viewer; None draws the whole tree
+DEPTH_LIMITS = (2, 3, 4, 5, None)
+
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='tree-render')
+_svgs = OrderedDict()
+_pending = {}
+_lock = threading.Lock()
+
+
+def _visible_leaves(tree, max_depth):
+    # Number of boxes on the bottom row of the drawing, which sets its width
+    depth = np.zeros(tree.node_count, dtype=np.int64)
+    for node in range(tree.node_count):
+        for child in (tree.children_left[node], tree.children_right[node]):
+            if child != -1:
+                depth[child] = depth[node] + 1
+    leaf = tree.children_left == -1
+    if max_depth is None:
+        return int(leaf.sum()), int(depth.max())
+    shown = depth <= max_depth
+    return int((shown & (leaf | (depth == max_depth))).sum()), int(min(depth.max(), max_depth))
+
+
+def render_svg(name, index, max_depth=None):
+    """Draw tree ``index`` of model ``name`` and return it as an SVG string."""
+    clf = model_registry.get_model(name)
+    estimator = clf.estimators_[index]
+    leaves, depth = _visible_leaves(estimator.tree_, max_depth)
+
+    labels = np.asarray(scoring.class_labels(name), dtype=object)
+    figure = Figure(figsize=(max(8, 1.6 * leaves), max(4, 1.8 * (depth + 1))))
+    FigureCanvasAgg(figure)
+    ax = figure.add_subplot()
+    plot_tree(
+        estimator,
+        max_depth=max_depth,
+        feature_names=list(clf.feature_names_in_),
+        class_names=[str(label) for label in labels[clf.classes_]],
+        filled=True,
+        rounded=True,
+        ax=ax,
+    )
+    buffer = io.StringIO()
+    figure.savefig(buffer, format='svg', bbox_inches='tight')
+    return buffer.getvalue()
+
+
+def cache_key(name, index, max_depth=None):
+    return (name, model_registry.model_version(name), int(index), max_depth)
+
+
+def _store(key, future):
+    with _lock:
+        _pending.pop(key, None)
+        if future.exception() is None:
+            _svgs[key] = future.result()
+            _svgs.move_to_end(key)
+            while len(_svgs) > CACHE_SIZE:
+                _svgs.popitem(last=False)
+
+
+def request_svg(name, index, max_depth=None):
+    """Return a Future for the SVG of a tree, starting a drawing only if needed."""
+    key = cache_key(name, index, max_depth)
+    with _lock:
+        svg = _svgs.get(key)
+        if svg is not None:
+            _svgs.move_to_end(key)
+            future = Future()
+            future.set_result(svg)
+            return future
+        future = _pending.get(key)
+        if future is None:
+            future = _executor.submit(render_svg, name, index, max_depth)
+            _pending[key] = future
+            future.add_done_callback(lambda done: _store(key, done))
+        return future
+
+
+def stats():
+    with _lock:
+        return {
+            'Cached Trees': len(_svgs),
+            'Rendering': len(_pending),
+            'Max Cached': CACHE_SIZE,
+            'Size (KB)': round(sum(len(svg) for svg in _svgs.values()) / 1024, 1),
+        }
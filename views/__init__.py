@@ -0,0 +1,5 @@
+"""Pages of the Streamlit dashboard.
+
+Each page is a module with a ``render()`` function. dashMain.py imports only
+the selected page, so a page pays just for the libraries and data it uses.
+"""
@@ -0,0 +1,19 @@
+"""About page of the dashboard."""
+import streamlit as st
+
+
+def render():
+    st.header("ℹ️ About")
+
+    # Your content for the ABOUT page goes here
+    st.markdown(""" 
+    A Streamlit web application that performs **Exploratory Data Analysis (EDA)**, **Data Preprocessing**, and **Supervised Machine Learning** to classify **Salary_USD**, **Automation_Risk**, and **Job_Growth_Projection** from the AI-Powered Job Market Insights dataset using **Random Forest Classifier**.
+
+    #### Pages
+    1. `Dataset` - Brief description of the AI-Powered Job Market Insights dataset used in this dashboard.
+    2. `EDA` - Exploratory Data Analysis of the AI-Powered Job Market Insights dataset, highlighting the distribution of **Salary_USD**, **Automation_Risk**, and **Job_Growth_Projection**. This section includes graphs such as Pie Charts and Bar Charts.
+    3. `Data Cleaning / Pre-processing` - Overview of data cleaning and pre-processing steps, including encoding for **Salary_USD**, **Automation_Risk**, and **Job_Growth_Projection** columns, as well as splitting the dataset into training and testing sets.
+    4. `Machine Learning` - Training a supervised classification model using the **Random Forest Classifier**. This section covers model evaluation, feature importance, and tree plotting.
+    5. `Prediction` - A prediction page where users can input values to predict **Salary**, **Automation Risk**, and **Job Growth Projection** using the trained models.
+    6. `Conclusion` - A summary of the insights and observations from the EDA and model training.
+""")
@@ -0,0 +1,30 @@
+"""Helpers shared by the Data Cleaning and Machine Learning pages."""
+import pandas as pd
+import streamlit as st
+
+import model_registry
+
+
+# Stored training results (written offline by train.py)
+
+def stored_importance_df(name):
+    metadata = model_registry.model_metadata(name)
+    if metadata is None:
+        st.info("No stored training results yet. Run `python train.py` to train the models.")
+        return None
+    return pd.DataFrame(metadata['feature_importances'])
+
+def show_training_results(name):
+    metadata = model_registry.model_metadata(name)
+    if metadata is None:
+        st.info("No stored training results yet. Run `python train.py` to train the models.")
+        return
+
+    st.write(f"""
+
+    **Train Accuracy:** {metadata['train_accuracy'] * 100:.2f}%\n
+    **Test Accuracy:** {metadata['test_accuracy'] * 100:.2f}%
+             
+    """)
+    if metadata['training_seconds'] is not None:
+        st.caption(f"Trained offline with `python train.py` in {metadata['training_seconds']:.2f}s on {metadata['trained_at']}.")
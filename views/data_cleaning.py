@@ -0,0 +1,406 @@
+"""Data Cleaning / Pre-processing page of the dashboard."""
+import streamlit as st
+import pandas as pd
+from io import StringIO
+from sklearn.model_selection import train_test_split
+
+import data_store
+import paged_table
+import preprocessing
+import sampling
+import train
+import vocabularies
+from views.common import show_training_results
+
+
+def render():
+    dataset = data_store.load_dataset()
+    df_data = vocabularies.encoded_frame()
+
+    st.header("🧼 Data Cleaning and Data Pre-processing")
+
+    # Your content for the DATA CLEANING / PREPROCESSING page goes here
+    
+    st.subheader("DataFrame Information")
+    st.code("dataset.info()")
+    
+    buffer = StringIO()  
+    dataset.info(buf=buffer)  
+    info = buffer.getvalue()  
+    st.text(info)
+
+    st.info("As we can see from the DataFrame information (dataset.info()), there are no null values in any of the data types. Based on this, we can conclude that there are no data columns that need to be dropped.")
+
+    st.subheader("Null Values of each Attributes")
+    st.code("dataset.isna().sum()")
+    st.write(dataset.isna().sum())
+    
+    st.info("There are no null values found on the dataframe.")
+    
+    st.subheader("Duplicate Rows")
+    st.code( """ duplicates = dataset[dataset.duplicated(keep=False)]
+    st.dataframe(duplicates) """)
+    duplicates = dataset[dataset.duplicated(keep=False)]
+    st.dataframe(duplicates)
+    st.code( """ dataset.duplicated().sum()  
+    """ )
+    st.write(f"### Number of duplicate rows: {dataset.duplicated().sum()}")  
+    st.info("There are no duplicate rows found on the dataframe.")
+    
+    st.header("Column Classification")
+
+    col = st.columns((2, 2), gap='small')
+
+    # Categorical columns
+    with col[0]:
+        cat_col = [col for col in dataset.columns if dataset[col].dtype in ('object', 'category')]
+        st.subheader('Categorical Columns')
+        st.write(cat_col)
+
+    # Numerical columns
+    with col[1]:
+        num_col = [col for col in dataset.columns if dataset[col].dtype not in ('object', 'category')]
+        st.subheader('Numerical Columns')
+        st.write(num_col)
+
+    # Divider for better visual separation
+    st.markdown("---")
+
+    # Display unique value counts in Categorical and Numerical columns
+    st.header("Unique Value Counts")
+
+    col = st.columns((2, 2), gap='small')
+
+    with col[0]:
+        st.subheader('Categorical Columns Unique Counts')
+        st.code("dataset[cat_col].nunique()")
+        cat_unique_counts = dataset[cat_col].nunique().reset_index()
+        cat_unique_counts.columns = ['Column', 'Unique Counts']
+        st.dataframe(cat_unique_counts)
+
+    with col[1]:
+        st.subheader('Numerical Columns Unique Counts')
+        st.code("dataset[num_col].nunique()")
+        num_unique_counts = dataset[num_col].nunique().reset_index()
+        num_unique_counts.columns = ['Column', 'Unique Counts']
+        st.dataframe(num_unique_counts)
+
+    # Divider for separation
+    st.markdown("---")
+
+    # Display unique values for each categorical column in a grid
+    st.header("Unique Values in Categorical Columns")
+
+    # Adjust to display in a grid of five columns
+    col1 = st.columns((2, 2, 2, 2, 2), gap='small')
+
+    for i, col in enumerate(cat_col):
+        with col1[i % 5]:  # Distribute items cyclically across five columns
+            st.subheader(f'{col}')
+            st.write(dataset[col].unique())
+
+    # Divider for separation
+    st.markdown("---")
+
+    # Display unique values for numerical columns
+    st.header("Unique Values in Numerical Columns")
+
+    for col in num_col:
+        st.subheader(f'{col}')
+        st.write(dataset[col].unique())
+
+    # Observation section for insights
+    st.info("""
+                - We used `df[cat_col].nunique()` to identify the number of unique values in each categorical column. 
+                - The analysis shows that the dataset's categorical columns are properly initialized, confirmed using the `.unique()` method. 
+                - There is only one numerical column (e.g., `Salary_USD`), which was included in the analysis.
+                """)
+    st.markdown("---")
+    
+    st.subheader('Encoding Process:')
+   
+    st.code("""
+    job_encoder = LabelEncoder() 
+    industry_encoder = LabelEncoder()
+    size_encoder = LabelEncoder()
+    location_encoder = LabelEncoder()
+    ai_adoption_encoder = LabelEncoder()
+    automation_encoder = LabelEncoder()
+    skills_encoder = LabelEncoder()
+    remote_encoder = LabelEncoder()
+    growth_encoder = LabelEncoder()
+
+    df_data['Job_encoded'] = job_encoder.fit_transform(df['Job_Title'])
+    df_data['Industry_encoded'] = industry_encoder.fit_transform(df['Industry'])
+    df_data['Size_encoded'] = size_encoder.fit_transform(df['Company_Size'])
+    df_data['Location_encoded'] = location_encoder.fit_transform(df['Location'])
+    df_data['AI_Adoption_encoded'] = ai_adoption_encoder.fit_transform(df['AI_Adoption_Level'])
+    df_data['Automation_encoded'] = automation_encoder.fit_transform(df['Automation_Risk'])
+    df_data['Skills_encoded'] = skills_encoder.fit_transform(df['Required_Skills'])
+    df_data['Remote_encoded'] = remote_encoder.fit_transform(df['Remote_Friendly'])
+    df_data['Growth_encoded'] = growth_encoder.fit_transform(df['Job_Growth_Projection'])
+    df_data['Salary_encoded'] = salary_encoder.fit_transform(df['Salary_Category'])
+    df_data['Salary_USD'] = df['Salary_USD']
+    """)
+    
+    st.subheader("Mapping of the Attributes for Prediction")
+    
+    col = st.columns((3, 4, 5), gap='large')
+
+    with col[0]:
+        automation_mapping_df = pd.DataFrame({
+            'Original Automation Risk': dataset['Automation_Risk'],
+            'Encoded Automation Risk': df_data['Automation_encoded']
+            })
+
+            # Display the DataFrame in Streamlit
+        st.write(automation_mapping_df)
+    
+    with col[1]:
+        jobGrowth_mapping_df = pd.DataFrame({
+            'Original Job Growth Projection': dataset['Job_Growth_Projection'],
+            'Encoded Job Growth Projection': df_data['Growth_encoded']
+            })
+
+            # Display the DataFrame in Streamlit
+        st.write(jobGrowth_mapping_df)
+        
+    with col[2]:
+        salary_mapping_df = pd.DataFrame({
+            'Original Salary Category': dataset['Salary_Category'],
+            'Encoded Salary Category': df_data['Salary_encoded']
+            })
+
+            # Display the DataFrame in Streamlit
+        st.write(salary_mapping_df)
+    
+    st.info("We encoded the columns of the dataset so that it can be properly use for our machine learning model, which is Random Forest Classifier. ")
+    st.markdown("---")
+    
+    #Train-Test split
+    
+    st.subheader("Train-Test Split")
+    
+    st.write("### For Automation Risk: ")
+    
+    features = ['Job_encoded', 'Industry_encoded', 'Size_encoded', 'Location_encoded', 'AI_Adoption_encoded','Skills_encoded', 'Remote_encoded', 'Salary_USD', 'Growth_encoded']
+    X1 = df_data[features]
+    Y1 = df_data['Automation_encoded']
+    
+    st.code(""" features = ['Job_encoded', 'Industry_encoded', 'Size_encoded', 'Location_encoded', 'AI_Adoption_encoded','Skills_encoded', 'Remote_encoded', 'Salary_USD', 'Growth_encoded']
+    X1 = df_data[features]
+    Y1 = df_data['Automation_encoded']""")
+    
+    X1_train, X1_test, Y1_train, Y1_test = train_test_split(X1, Y1, test_size=0.1, random_state=42)
+
+    st.code("""X1_train, X1_test, Y1_train, Y1_test = train_test_split(X1, Y1, test_size=0.1, random_state=42)""")
+    
+    st.write('Training Features (X1_train):')
+    paged_table.paged_dataframe(X1_train, key='X1_train')
+    
+    st.session_state['X1_train'] = X1_train
+
+    st.write('Testing Features (X1_test):')
+    paged_table.paged_dataframe(X1_test, key='X1_test')
+
+    st.write('Training Target Variable (Y1_train):')
+    paged_table.paged_dataframe(Y1_train, key='Y1_train')
+
+    st.write('Testing Target Variable (Y1_test):')
+    paged_table.paged_dataframe(Y1_test, key='Y1_test')
+    
+    st.info("""
+    *  We used `.head()` to give us a preview of the `X1_test` and `X1_train` data.
+    *  We used `.shape` to give us the dimensions of the `X1_test` and `X1_train` data.
+    *  To enhance the accuracy of our machine learning model given our limited dataset, we allocated 90% of the data for training and 10% for testing.
+    *  Same case with the Y1_train and Y1_test.
+
+    As you can see, the test shape has a lower number than the training shape. Since we should always allot more data to training for the machine learning model to practice.
+    """)
+    
+    # Models are trained offline by train.py; only the stored results are shown here
+    show_training_results('automation')
+    
+    st.markdown("---")
+    
+    st.write("### For Growth Projection")
+    
+    features = ['Job_encoded', 'Industry_encoded', 'Size_encoded', 'Location_encoded', 'AI_Adoption_encoded','Skills_encoded', 'Remote_encoded', 'Salary_USD', 'Automation_encoded']
+    X2 = df_data[features]
+    Y2 = df_data['Growth_encoded']
+    
+    st.code("""features = ['Job_encoded', 'Industry_encoded', 'Size_encoded', 'Location_encoded', 'AI_Adoption_encoded','Skills_encoded', 'Remote_encoded', 'Salary_USD', 'Automation_encoded']
+    X2 = df_data[features]
+    Y2 = df_data['Growth_encoded']""")
+    
+    X2_train, X2_test, Y2_train, Y2_test = train_test_split(X2, Y2, test_size=0.1, random_state=42)
+
+    st.code("""X2_train, X2_test, Y2_train, Y2_test = train_test_split(X2, Y2, test_size=0.1, random_state=42)""")
+    
+    st.write('Training Features (X2_train):')
+    paged_table.paged_dataframe(X2_train, key='X2_train')
+
+    st.write('Testing Features (X2_test):')
+    paged_table.paged_dataframe(X2_test, key='X2_test')
+
+    st.write('Training Target Variable (Y2_train):')
+    paged_table.paged_dataframe(Y2_train, key='Y2_train')
+
+    st.write('Testing Target Variable (Y2_test):')
+    paged_table.paged_dataframe(Y2_test, key='Y2_test')
+
+    st.info("""
+    *  We used `.head()` to give us a preview of the `X2_test` and `X2_train` data.
+    *  We used `.shape` to give us the dimensions of the `X2_test` and `X2_train` data.
+    *  To enhance the accuracy of our machine learning model given our limited dataset, we allocated 90% of the data for training and 10% for testing.
+    * Same case with the Y2_train and Y2_test.
+
+    As you can see, the test shape has a lower number than the training shape. Since we should always allot more data to training for the machine learning model to practice.
+    """)
+    
+    # Models are trained offline by train.py; only the stored results are shown here
+    show_training_results('growth')
+     
+    st.markdown("---")
+    
+    st.write("### For Salary Category")
+    
+    features = ['Job_encoded', 'Industry_encoded', 'Size_encoded', 'Location_encoded', 'AI_Adoption_encoded','Skills_encoded', 'Remote_encoded', 'Automation_encoded', 'Growth_encoded']
+    X4 = df_data[features]
+    Y4 = df_data['Salary_encoded']
+    
+    st.code("""features = ['Job_encoded', 'Industry_encoded', 'Size_encoded', 'Location_encoded', 'AI_Adoption_encoded','Skills_encoded', 'Remote_encoded', 'Automation_encoded', 'Growth_encoded']
+    X4 = df_data[features]
+    Y4 = df_data['Salary_encoded']""")
+    
+    X4_train, X4_test, Y4_train, Y4_test = train_test_split(X4, Y4, test_size=0.3, random_state=42)
+    st.code("""X4_train, X4_test, Y4_train, Y4_test = train_test_split(X4, Y4, test_size=0.3, random_state=42)""")
+
+    st.write('Training Features (X4_train):')
+    paged_table.paged_dataframe(X4_train, key='X4_train')
+
+    st.write('Testing Features (X4_test):')
+    paged_table.paged_dataframe(X4_test, key='X4_test')
+
+    st.write('Training Target Variable (Y4_train):')
+    paged_table.paged_dataframe(Y4_train, key='Y4_train')
+
+    st.write('Testing Target Variable (Y4_test):')
+    paged_table.paged_dataframe(Y4_test, key='Y4_test')
+    
+    # Models are trained offline by train.py; only the stored results are shown here
+    show_training_results('salary')
+
+    st.subheader("Creating a new data set for the 2nd training.")
+    st.code("""new_df = dataset""")
+    new_df = dataset
+    st.info("Creating a copy of the original dataset for further processing.")
+
+    #st.write(new_df.head())
+    new_df.head()
+    #st.info("Displayed the first few rows of the dataset to verify its structure and contents.")
+
+    st.code( """ salaryCategory_counts = new_df['Salary_Category'].value_counts() """ )
+    salaryCategory_counts = new_df['Salary_Category'].value_counts()
+    st.write(salaryCategory_counts)
+    st.info(""" 
+    - The count of each salary category is displayed, providing an overview of the dataset distribution by salary level.
+    - Seeing as the 'Entry Level' only contains 18 counts, we would then include only the 'Mid Level' and 'Senior Level' salary categories.""")
+
+    # Assuming your DataFrame is named 'weather_df_new'
+    selected_salaryCategory = ["Mid Level", "Senior Level"]
+
+    # Filter the DataFrame to keep only the desired summaries
+    new_df_filtered = new_df[new_df['Salary_Category'].isin(selected_salaryCategory)]
+
+    # Reset the index if needed
+    new_df_filtered = new_df_filtered.reset_index(drop=True)
+    new_df_filtered['Salary_Category'] = new_df_filtered['Salary_Category'].cat.remove_unused_categories()
+    new_df_filtered.head()
+    #st.write(new_df_filtered.head())
+    #st.info("Reset the index of the filtered DataFrame and displayed the first few rows to ensure only selected categories are present.")
+
+    st.code( """ salaryCategory_counts = new_df_filtered['Salary_Category'].value_counts() """ )
+    salaryCategory_counts = new_df_filtered['Salary_Category'].value_counts()
+    st.write(salaryCategory_counts)
+    st.info("Displayed the count of salary categories within the new filtered dataset.")
+
+    # Sample the same number of rows of each category in one pass (the salary2nd model's training sample)
+    salary_spec = train.MODEL_SPECS['salary2nd']
+    balanced_new_df = sampling.stratified_sample(new_df_filtered, 'Salary_Category', salary_spec['sample_per_class'], random_state=train.RANDOM_STATE)
+
+    # Now, 'balanced_weather_df' contains the balanced rows
+    st.code( """ balanced_new_df['Salary_Category'].value_counts() """)
+    st.write(balanced_new_df['Salary_Category'].value_counts())
+    st.info("Balanced the dataset by sampling each salary category equally and reset the index for better organization.")
+
+    # Encoded with the preprocessing stored with the salary2nd model, as train.py does; nothing is fitted here
+    salary_preprocessor = preprocessing.get_preprocessor('salary2nd')
+    st.code( """ balanced_new_df['Salary_encoded'] = growth_encoder.fit_transform(balanced_new_df['Salary_Category']) """)
+    balanced_new_df['Salary_encoded'] = salary_preprocessor.encode_target(balanced_new_df)
+    st.write(balanced_new_df.head())
+    st.info("Encoded the 'Salary_Category' column into numerical values for machine learning compatibility.")
+    
+    st.write(balanced_new_df['Salary_Category'].unique())
+    st.write(balanced_new_df['Salary_encoded'].unique())
+    st.info("Displayed unique values of both the original and encoded salary categories for verification.")
+
+    st.code("""
+    # Mapping of the Summary and their encoded equivalent
+    balanced_unique_salaryCategory = balanced_new_df['Salary_Category'].unique()
+    balanced_unique_salaryCategory_encoded = balanced_new_df['Salary_encoded'].unique()
+    
+    # Create a new DataFrame
+    balanced_salaryCategory_mapping_df = pd.DataFrame({'Summary': balanced_unique_salaryCategory, 'Summary_Encoded': balanced_unique_salaryCategory_encoded})
+    """)
+
+    balanced_unique_salaryCategory = balanced_new_df['Salary_Category'].unique()
+    balanced_unique_salaryCategory_encoded = balanced_new_df['Salary_encoded'].unique()
+
+    balanced_salaryCategory_mapping_df = pd.DataFrame({'Summary': balanced_unique_salaryCategory, 'Summary_Encoded': balanced_unique_salaryCategory_encoded})
+    # Display the DataFrame
+    st.write(balanced_salaryCategory_mapping_df)
+    st.info("""
+    - Mapped each unique salary category to its corresponding encoded value for reference.
+    - Encoded categorical features into numerical values for compatibility with machine learning models. """)
+
+    # Select features and target variable
+    X5 = salary_preprocessor.transform(balanced_new_df)
+    Y5 = balanced_new_df['Salary_encoded']
+
+    st.code("""features = ['Job_encoded', 'Industry_encoded', 'Location_encoded', 'Skills_encoded']
+    X5 = df_data[features]
+    Y5 = df_data['Salary_encoded']""")
+    #st.info("Defined the feature set and target variable for model training.")
+    
+    X5_train, X5_test, Y5_train, Y5_test = train_test_split(X5, Y5, test_size=salary_spec['test_size'], random_state=train.RANDOM_STATE)
+    st.code("""X5_train, X5_test, Y5_train, Y5_test = train_test_split(X5, Y5, test_size=0.1, random_state=42)""")
+    #st.info("Split the dataset into training and testing sets, with 70% for training to enhance model learning.")
+
+    st.write('Training Features (X5_train):')
+    paged_table.paged_dataframe(X5_train, key='X5_train')
+
+    st.write('Testing Features (X5_test):')
+    paged_table.paged_dataframe(X5_test, key='X5_test')
+
+    st.write('Training Target Variable (Y5_train):')
+    paged_table.paged_dataframe(Y5_train, key='Y5_train')
+
+    st.write('Testing Target Variable (Y5_test):')
+    paged_table.paged_dataframe(Y5_test, key='Y5_test')
+    
+    # Models are trained offline by train.py; only the stored results are shown here
+    show_training_results('salary2nd')
+    st.info("""
+    - Displayed the training and testing sets for both features and target variables.
+    - The model is trained on the training data offline with `python train.py`.
+    - To enhance the accuracy of our machine learning model given our limited dataset, we allocated 70% of the data for training and 30% for testing.
+    - The stored accuracy above comes from predictions on the test data.""")
+    
+    st.info("""Displayed the training (99.17%) and test accuracy (61.54%) to assess model performance.""")
+    st.info("""
+    - The initial test accuracy for the Salary Category is 58% but by removing the Entry Level due to its low count, we managed to improve the accuracy to 61.54%.
+    - The accuracy could be further improved with more data.""")
+    
+
+    # Machine Learning Page
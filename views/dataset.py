@@ -0,0 +1,51 @@
+"""Dataset page of the dashboard."""
+import streamlit as st
+
+import data_store
+import paged_table
+
+
+def render():
+    dataset = data_store.load_dataset()
+
+    st.header("📊 Dataset")
+
+    st.write("AI-Powered Job Market Insights Dataset")
+    st.markdown("""
+
+    The AI-Powered Job Market Insights dataset was introduced by Laksika Tharmalingam, it is a dataset provides a synthetic but realistic snapshot of the modern job market, particularly focusing on the role of artificial intelligence (AI) and automation across various industries. This dataset includes 500 unique job listings, each characterized by different factors like industry, company size, AI adoption level, automation risk, required skills, and job growth projections. It is designed to be a valuable resource for researchers, data scientists, and policymakers exploring the impact of AI on employment, job market trends, and the future of work.
+
+    Content
+    The dataset has 500 rows. The columns are as follows: Job_Title, Industry, Company_Size, Location, AI_Adoption_Level, Automation_Risk, Required_Skills, Salary_USD, Remote_Friendly, and Job_Growth_Projection.
+
+    `Link:` https://www.kaggle.com/datasets/uom190346a/ai-powered-job-market-insights?fbclid=IwZXh0bgNhZW0CMTEAAR3rYnERo-UcWo7EcLpdyvZhk4s4CwVmkCm3QA-ifo347G-H57xxj-r3onA_aem_pLURKK0jybKoBp3Oxe8vpA
+
+    """)
+
+    # Your content for your DATASET page goes here
+    
+    st.subheader("Dataset displayed as a Data Frame")
+    paged_table.paged_dataframe(dataset, key='dataset', hide_index=True)
+    
+    #Column Description
+    st.subheader("Column Descriptions")
+    column_descriptions = {
+        "Job_Title": "The title of the job position.",
+        "Industry": "The type of industry that is hiring.",
+        "Company_Size": "The company size of the job.",
+        "Location": "The location of the job.",
+        "AI_Adoption_Level": "The level to which the company has integrated AI into its operations.",
+        "Automation_Risk": "The probability that the job will be automated during the next years.",
+        "Required_Skills": "The primary skills required for the job role.",
+        "Salary_USD": "The job offers an annual pay in USD.",
+        "Remote_Friendly": "Determines whether the job may be completed remotely.",
+        "Job_Growth_Projection": "The expected growth or drop in the job position over the following five years.",
+        "Salary_Category": "The categorized version of Salary_USD."
+    }
+    for column, description in column_descriptions.items():
+        st.markdown(f"**{column}:** {description}")  
+    
+    st.subheader("Descriptive Statistics")
+    st.code("dataset.describe()")
+    st.dataframe(dataset.describe(), use_container_width=True)
+    st.info("The dataset includes 500 salary data points with an average salary of USD 91,222.39. Salaries range from a minimum of USD 31,969.53 to a maximum of USD 155,209.82. The standard deviation is USD 20,504.29, indicating moderate variability. The median salary is USD 91,998.20, with 25% of salaries below USD 78,511.51 and 75% below USD 103,971.28.")
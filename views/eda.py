@@ -0,0 +1,260 @@
+"""EDA page of the dashboard."""
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+
+import crosstabs
+import data_store
+import figure_cache
+
+
+def crosstab_heatmap(target, column, width, height, key, percent=False):
+    # One cell per (category, class) pair, precomputed per data version
+    st.plotly_chart(
+        figure_cache.get_figure('crosstab_percent' if percent else 'crosstab', column, target, data_store.data_version(),
+                                lambda: build_crosstab_heatmap(target, column, width, height, percent)),
+        use_container_width=True,
+        key=f"crosstab_heatmap_{key}",
+    )
+
+
+def build_crosstab_heatmap(target, column, width, height, percent):
+    table = crosstabs.crosstab(target, column, percent)
+
+    heatmap = px.imshow(
+        table,
+        text_auto='.0f',
+        aspect='auto',
+        color_continuous_scale='Blues',
+        labels={'color': '% of row' if percent else 'Rows'},
+    )
+
+    # Adjust the height and width, leaving room for every category
+    heatmap.update_layout(
+        width=width,  # Set the width
+        height=max(height, 30 * len(table) + 80),  # Set the height
+        coloraxis_showscale=False,
+        margin=dict(l=0, r=0, t=10, b=0),
+    )
+    return heatmap
+
+
+def render():
+    dataset = data_store.load_dataset()
+
+    # Figures are rebuilt only when the data changes
+    data_version = data_store.data_version()
+
+    st.header("📈 Exploratory Data Analysis (EDA)")
+    
+    # Display the legend in an expander above the columns
+    with st.expander('Legend', expanded=True):
+        st.write('''
+            - **Data**: [AI-Powered Job Market Insights Dataset](https://www.kaggle.com/datasets/uom190346a/ai-powered-job-market-insights?fbclid=IwZXh0bgNhZW0CMTEAAR1Un4XKwOuQJwrrf3URa1_izEZDgxCqn7Xy8HCJASGhkOS5tUUrGG2BcSM_aem_TiYvlOVatXZWnYpMmYcdVA).
+            - :green[Pie Chart]: Distribution of the Automation_Risk in the dataset.
+            - :green[Bar Chart]: Distribution of the Job_Growth_Projection in the dataset.
+            - :green[Line Chart]: Distribution of the Salary_Category in the dataset.
+            - :green[Heatmaps]: Number of rows for every combination of a column's categories with each target's classes. Salary_USD is grouped into bands.
+        ''')
+        percent = st.radio('Heatmap values', ('Counts', 'Percent of row'), horizontal=True, key='eda_heatmap_values') == 'Percent of row'
+
+    col = st.columns((3, 2, 2, 2), gap='small')
+
+    # Automation Risk Distribution Pie Chart
+    with col[0]:
+            st.markdown('##### Automation Risk Distribution')
+            def pie_chart_AutomationRisk():
+                #Pie Chart Automation Risk
+                automationRisk_list = dataset['Automation_Risk'].unique().tolist()
+                automationRisk_counts = dataset['Automation_Risk'].value_counts()
+                automationRisk_counts_list = automationRisk_counts.tolist()
+
+                fig = px.pie(
+            names=automationRisk_list,
+            values=automationRisk_counts_list,
+            title='Pie Chart of Automation Risk',
+            hole=0.0, 
+            height=600
+                )
+                return fig
+            st.plotly_chart(figure_cache.get_figure('pie', 'Automation_Risk', None, data_version, pie_chart_AutomationRisk))
+    
+    with col[1]:
+        
+        st.markdown('###### Job Title by Automation Risk')
+        crosstab_heatmap("Automation_Risk", "Job_Title", 400, 200, "auto_1", percent)
+        
+        st.markdown('###### Industry by Automation Risk')
+        crosstab_heatmap("Automation_Risk", "Industry", 400, 200, "auto_2", percent)
+
+        st.markdown('###### Company_Size by Automation Risk')
+        crosstab_heatmap("Automation_Risk", "Company_Size", 400, 200, "auto_3", percent)
+        
+        
+        
+    with col[2]:
+        
+        st.markdown('###### Location by Automation Risk')
+        crosstab_heatmap("Automation_Risk", "Location", 400, 200, "auto_4", percent)
+        
+        st.markdown('###### AI Adoption Level by Automation Risk')
+        crosstab_heatmap("Automation_Risk", "AI_Adoption_Level", 400, 200, "auto_5", percent)
+        
+        st.markdown('###### Required Skills by Automation Risk')
+        crosstab_heatmap("Automation_Risk", "Required_Skills", 400, 200, "auto_6", percent)
+        
+        
+        
+    with col[3]:   
+        
+        st.markdown('###### Remote Friendly by Automation Risk')
+        crosstab_heatmap("Automation_Risk", "Remote_Friendly", 400, 200, "auto_7", percent)
+        
+        st.markdown('###### Job Growth Projection by Automation Risk')
+        crosstab_heatmap("Automation_Risk", "Job_Growth_Projection", 400, 200, "auto_8", percent)
+        
+        st.markdown('###### Salary by Automation Risk')
+        crosstab_heatmap("Automation_Risk", "Salary_USD", 400, 200, "auto_9", percent)
+        
+    st.header("💡 Insights")
+    st.info("""
+            
+            - A fair assessment of automation risk across the dataset's different job attributes is given by the charts. An equitable distribution can be seen in the pie chart: 31.6% of jobs are medium risk, 34.6% are high risk, and 33.8% are low risk. This implies that a wide variety of employment are impacted by automation, with no specific category being impacted more than others.
+
+            - Automation risk seems to be evenly distributed for particular job titles (such as Operations Manager, Product Manager) and locations (such as Toronto, Paris, and Tokyo), suggesting that neither factor significantly affects risk levels. Similarly, there are no significant differences in remote-friendly occupations, industry type, or company size, indicating that these variables do not significantly connect with automation risk.
+
+            - AI adoption levels, job growth projections, and required skills like Communication, Machine Learning, and UX/UI Design also display an even distribution of automation risk, implying no specific skills or adoption levels are more susceptible to automation. Salary categories, too, are spread across all risk levels, showing that higher or lower salaries do not predict automation risk.
+
+            - In conclusion, the data shows that automation risk is widely distributed across several job attributes, impacting a wide range of occupations, industries, and skill levels nearly equally. This wide-ranging effect emphasizes how crucial flexible approaches are as technology affects different kinds of jobs in different sectors.""")
+        
+    col = st.columns((3, 2, 2, 2), gap='small')
+    
+    with col[0]:
+           
+        st.markdown('##### Job Growth Distribution')
+        def bar_chart_Growth():
+                #Bar Chart Job Growth Projection
+                jobGrowth_list = dataset['Job_Growth_Projection'].unique().tolist()
+                jobGrowth_counts = dataset['Job_Growth_Projection'].value_counts()
+                jobGrowth_counts_list = jobGrowth_counts.tolist()
+
+                fig = px.bar(
+        x=jobGrowth_list,  
+        y=jobGrowth_counts_list,  
+        title='Bar Chart of Job Growth Projection',
+        labels={'x': 'Job Growth Category', 'y': 'Count'}, 
+        color=jobGrowth_list,  
+        color_discrete_sequence=px.colors.qualitative.Set3,
+        height=600
+    )
+                return fig
+
+        st.plotly_chart(figure_cache.get_figure('bar', 'Job_Growth_Projection', None, data_version, bar_chart_Growth))
+          
+    
+    with col[1]:
+        
+        st.markdown('###### Job Title by Job Growth Projection')
+        crosstab_heatmap("Job_Growth_Projection", "Job_Title", 400, 200, "growth_1", percent)
+        
+        st.markdown('###### Industry by Job Growth Projection')
+        crosstab_heatmap("Job_Growth_Projection", "Industry", 400, 200, "growth_2", percent)
+
+        st.markdown('###### Company_Size by Job Growth Projection')
+        crosstab_heatmap("Job_Growth_Projection", "Company_Size", 400, 200, "growth_3", percent)  
+        
+    with col[2]:
+        
+        st.markdown('###### Location by Job Growth Projection')
+        crosstab_heatmap("Job_Growth_Projection", "Location", 400, 200, "growth_4", percent)
+        
+        st.markdown('###### AI Adoption Level by Job Growth Projection')
+        crosstab_heatmap("Job_Growth_Projection", "AI_Adoption_Level", 400, 200, "growth_5", percent)
+        
+        st.markdown('###### Required Skills by Job Growth Projection')
+        crosstab_heatmap("Job_Growth_Projection", "Required_Skills", 400, 200, "growth_6", percent) 
+        
+    with col[3]:   
+        
+        st.markdown('###### Remote Friendly by Job Growth Projection')
+        crosstab_heatmap("Job_Growth_Projection", "Remote_Friendly", 400, 200, "growth_7", percent)
+        
+        st.markdown('###### Automation Risk by Job Growth Projection')
+        crosstab_heatmap("Job_Growth_Projection", "Automation_Risk", 400, 200, "growth_8", percent)
+        
+        st.markdown('###### Salary by Job Growth Projection')
+        crosstab_heatmap("Job_Growth_Projection", "Salary_USD", 400, 200, "growth_9", percent)
+
+    st.header("💡 Insights")
+    st.info("""
+            
+            - A balanced perspective of job growth estimates across the dataset's many job qualities is given by the charts. Jobs are nearly equally likely to increase, decrease, or stay the same, according to the bar chart, suggesting a balanced outlook. All growth categories have specific job titles, such as operations manager, product manager, sales manager, and cybersecurity analyst, indicating that a job's title does not significantly influence its potential for growth.Furthermore, businesses like energy, telecommunications, education, and entertainment, as well as jobs that are conducive to remote work, exhibit an even distribution across growth, decline, and stability, indicating that these elements do not significantly affect the potential for job growth.
+
+            - A comparable distribution is shown across all employment growth estimates for variables such as the degree of AI deployment, automation risk, company size, necessary skills, and pay levels. With abilities like communication, machine learning, JavaScript, and UX/UI design applicable across the board, this distribution suggests that these attributes have little bearing on the likelihood of job growth or decline. In general, the potential for job development is widely dispersed, indicating a diverse labor market with growth opportunities not restricted to certain positions, regions, or sectors. This emphasizes how crucial adaptability and flexibility are in a changing labor market.""")
+        
+    
+    col = st.columns((3, 2, 2, 2), gap='small')
+    
+    with col[0]:
+        
+        st.markdown('##### Salary Category Distribution')
+        def line_chart_SalaryCategory():
+                #Line Chart Salary Category
+                salaryCategory_list = dataset['Salary_Category'].unique().tolist()
+                salaryCategory_counts = dataset['Salary_Category'].value_counts()
+                salaryCategory_counts_list = salaryCategory_counts.tolist()
+
+                fig = px.line(
+                    x=salaryCategory_list, 
+                    y=salaryCategory_counts_list, 
+                    title=' Line Chart of Salary Category',
+                    labels={'x': 'Salary Category','y': 'Count'}, 
+                    markers=True, 
+                    height=600
+                )
+                return fig
+        st.plotly_chart(figure_cache.get_figure('line', 'Salary_Category', None, data_version, line_chart_SalaryCategory))
+    
+    with col[1]:
+        
+        st.markdown('###### Job Title by Salary Category')
+        crosstab_heatmap("Salary_Category", "Job_Title", 400, 200, "salary_1", percent)
+        
+        st.markdown('###### Industry by Salary Category')
+        crosstab_heatmap("Salary_Category", "Industry", 400, 200, "salary_2", percent)
+
+        st.markdown('###### Company_Size by Salary Category')
+        crosstab_heatmap("Salary_Category", "Company_Size", 400, 200, "salary_3", percent)  
+        
+    with col[2]:
+        
+        st.markdown('###### Location by Salary Category')
+        crosstab_heatmap("Salary_Category", "Location", 400, 200, "salary_4", percent)
+        
+        st.markdown('###### AI Adoption Level by Salary Category')
+        crosstab_heatmap("Salary_Category", "AI_Adoption_Level", 400, 200, "salary_5", percent)
+        
+        st.markdown('###### Required Skills by Salary Category')
+        crosstab_heatmap("Salary_Category", "Required_Skills", 400, 200, "salary_6", percent) 
+        
+    with col[3]:   
+        
+        st.markdown('###### Remote Friendly by Salary Category')
+        crosstab_heatmap("Salary_Category", "Remote_Friendly", 400, 200, "salary_7", percent)
+        
+        st.markdown('###### Automation Risk by Salary Category')
+        crosstab_heatmap("Salary_Category", "Automation_Risk", 400, 200, "salary_8", percent)
+        
+        st.markdown('###### Job Growth Projection by Salary Category')
+        crosstab_heatmap("Salary_Category", "Job_Growth_Projection", 400, 200, "salary_9", percent)
+
+    st.header("💡 Insights")
+    st.info("""
+            
+            - According to the salary category distribution, senior-level positions are the least common, while entry-level roles make up the majority of the dataset. There is room for career progression in positions with titles like operations manager, product manager, sales manager, and cybersecurity analyst, which are available at all pay levels. Similarly, entry-, mid-, and senior-level jobs are offered in places like Toronto, Paris, Tokyo, and Dubai, indicating that there are plenty of career opportunities with different pay scales available abroad. Remote work flexibility is available at various career levels, as evidenced by the fact that both remote-friendly and non-remote roles are distributed throughout all wage categories.
+
+            - Jobs in all pay ranges can be found in industries like energy, telecommunications, education, and entertainment, indicating that advancement from entry-level to senior positions is feasible in these fields. As occupations with different levels of automation risk and AI usage offer a range of incomes, the data indicates that automation risk and AI adoption levels (high, medium, and low) do not significantly effect salary. There seem to be prospects for advancement at every income level, regardless of the size of the company—small, medium, or large. Every career level benefits from having abilities like communication, machine learning, JavaScript, and UX/UI design, which are in demand throughout entry, mid, and senior income categories.""")
+
+    with st.expander('Figure Cache'):
+        st.dataframe(pd.DataFrame([figure_cache.stats()]), use_container_width=True, hide_index=True)
+        st.caption("Charts are built once per data version and shared across all sessions.")
@@ -0,0 +1,583 @@
+"""Machine Learning page of the dashboard."""
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+from PIL import Image
+
+import figure_cache
+import forest_stats
+import model_registry
+import tree_render
+from views.common import show_training_results, stored_importance_df
+from views.viewers import draws_deferred_trees, forest_viewer, tree_viewer
+
+
+MODEL_TITLES = {
+    'automation': 'Automation Risk',
+    'growth': 'Job Growth Projection',
+    'salary': 'Salary Category',
+    'salary2nd': 'Salary Category 2nd Training',
+}
+
+
+@st.fragment
+def forest_structure():
+    summaries = forest_stats.summaries()
+    summaries.insert(0, 'Model', summaries.pop('model').map(MODEL_TITLES))
+    st.dataframe(summaries, use_container_width=True, hide_index=True)
+
+    name = st.selectbox('Model', list(MODEL_TITLES), format_func=MODEL_TITLES.get, key='forest_structure_model')
+    stats = forest_stats.forest_stats(name)
+    version = model_registry.model_version(name)
+
+    def build_depth_figure():
+        fig = px.bar(stats['leaf_depths'], x='Depth', y='Leaves', title=f'Leaf Depths - {MODEL_TITLES[name]}')
+        fig.update_layout(height=400)
+        return fig
+
+    def build_usage_figure():
+        fig = px.bar(stats['feature_usage'], x='Splits', y='Feature', orientation='h', title=f'Split Feature Usage - {MODEL_TITLES[name]}')
+        fig.update_layout(height=400, yaxis={'categoryorder': 'total ascending'})
+        return fig
+
+    col_depth, col_usage = st.columns(2)
+    with col_depth:
+        st.plotly_chart(figure_cache.get_figure('leaf_depths', 'Depth', name, version, build_depth_figure), use_container_width=True, key=f"forest_structure_depths_{name}")
+    with col_usage:
+        st.plotly_chart(figure_cache.get_figure('split_usage', 'Feature', name, version, build_usage_figure), use_container_width=True, key=f"forest_structure_usage_{name}")
+
+    with st.expander('Per-tree statistics'):
+        st.dataframe(stats['trees'], use_container_width=True, hide_index=True)
+
+
+@draws_deferred_trees
+def render():
+    
+    st.header("🤖 Machine Learning")
+
+    clf_automation = model_registry.get_model('automation')
+    clf_growthPrediction = model_registry.get_model('growth')
+    clf_salary = model_registry.get_model('salary')
+    clf_salary2nd = model_registry.get_model('salary2nd')
+
+    # Your content for the MACHINE LEARNING page goes here
+    st.subheader("Random Tree Classifier")
+    st.markdown("""
+
+    Mostly used for classification tasks, the Scikit-learn library's **Decision Tree Classifier** is one of many machine learning methods. The main aim of this method is Data Point Classification. This will be is accomplished by dividing the data into ever smaller subsets according to questions. This will result in a "Tree" structure, where each of the node in the tree stands for a question or a decision point based on the data feature. Depending on the response, the data travels down a branch of the tree to a new node that poses a new query or choice.
+
+    `Reference:` https://miro.medium.com/v2/resize:fit:1100/format:webp/1*i69vGs4AfhdhDUOlaPVLSA.png         
+                
+    """)
+    
+      # Columns to center the Decision Tree Parts image
+    col_dt_fig = st.columns((2, 4, 2), gap='medium')
+
+    with col_dt_fig[0]:
+        st.write(' ')
+
+    with col_dt_fig[1]:
+        decision_tree_parts_image = Image.open('assets/RFC.png')
+        st.image(decision_tree_parts_image, caption='Random Forest Classifier parts')
+
+    with col_dt_fig[2]:
+        st.write(' ')
+        
+    st.subheader("Training the Random Forest Classifier model for Automation Risk")
+    
+    st.code("""
+    * clf_automation = joblib.load('models/RFC_Automation.joblib')
+    * clf_automation.fit(X1_train, Y1_train)
+    
+    * y_pred = clf_automation.predict(X1_test)
+    """)
+    
+    st.subheader("Model Evaluation")
+    
+    st.code("""
+
+    train_accuracy = clf_automation.score(X1_train, Y1_train) #train daTa
+    test_accuracy = clf_automation.score(X1_test, Y1_test) #test daTa
+
+    print(f'Train Accuracy: {train_accuracy * 100:.2f}%')
+    print(f'Test Accuracy: {test_accuracy * 100:.2f}%')
+            
+    """)
+    show_training_results('automation')
+    st.info("""We’re using a Random Forest Classifier to predict automation risk. The model achieves 100% accuracy on the training data, indicating it has learned those patterns very well. However, it only reaches 46% accuracy on the test data, suggesting it may be overfitting, performing well on the data it has seen but not generalizing effectively to new data.""")
+    
+    st.subheader("Feature Importance")
+    
+    st.code("""
+
+    feature_importance = clf.feature_importances_
+    importance_df = importance_df.sort_values(by='Importance', ascending=False).reset_index(drop=True)
+    
+    """)
+    rfc_feature_importance_df = stored_importance_df('automation')
+    if rfc_feature_importance_df is not None:
+        st.dataframe(rfc_feature_importance_df, use_container_width=True, hide_index=True)
+
+    
+    
+    def feature_importance_plot1(feature_importance_df, width=500, height=500, key='default'):
+        def build_figure():
+            # Generate a bar plot for feature importances
+            feature_importance_fig = px.bar(
+                feature_importance_df,
+                x='Importance',
+                y='Feature',
+                labels={'Importance': 'Importance Score', 'Feature': 'Feature'},
+                orientation='h'  
+            )
+
+            feature_importance_fig.update_layout(
+                width=width,  
+                height=height  
+            )
+            return feature_importance_fig
+
+        # Display the plot in Streamlit (rebuilt only when the model changes)
+        feature_importance_fig = figure_cache.get_figure('feature_importance', 'Feature', 'automation', model_registry.model_version('automation'), build_figure)
+        st.plotly_chart(feature_importance_fig, use_container_width=True, key=f"feature_importance_plot1_{key}")
+
+    # Call the function with appropriate arguments
+    if rfc_feature_importance_df is not None:
+        feature_importance_plot1(rfc_feature_importance_df, width=500, height=500, key='2')
+    
+    st.info("""
+    Upon running . `feature_importances` in the `Random Forest Classifier Model` to check how each Growth Prediction's features influence the training of our model, it is clear that Salary_USD holds the most influence in our model's decisions having 0.2235 or 22% importance. This is followed by Location_encoded, and Industry_encoded which is closely behind of Salary_USD having 0.17 or 17% importance followed closely by Skills_encoded with 0.14 or 14%.
+    """)
+    
+    st.subheader(f"Number of Trees: {len(clf_automation.estimators_)}")
+    st.code("""
+
+    print(f"Number of trees made: {len(clf_automation.estimators_)}")
+     
+    """)
+    
+    st.subheader("Plotting the Forest")
+    
+    st.code("""
+    
+    # Show all trees made
+
+    # Set up the dimensions for the plot grid (e.g., 10x10 grid for 100 trees)
+    n_estimators = 100
+    n_rows = 10
+    n_cols = 10
+
+    # Create a figure large enough to hold the grid of subplots
+    fig, axes = plt.subplots(n_rows, n_cols, figsize=(20, 20), dpi=50)
+
+    # Loop through each estimator and plot it
+    X1_train = st.session_state['X1_train']
+    
+    for i, tree in enumerate(clf_automation.estimators_[:n_estimators]):
+        row = i // n_cols
+        col = i % n_cols
+        ax = axes[row, col]
+        plot_tree(tree, feature_names=X1_train.columns, filled=True, rounded=True, ax=ax)
+        ax.set_title(f"Tree {i+1}", fontsize=6)
+        ax.axis('off')  # Turn off axis to reduce clutter
+
+    plt.tight_layout()
+    st.pyplot(plt) """)
+    
+    forest_viewer('automation', 'Automation Risk')
+    
+    st.info("This graph shows **all of the decision trees** made by our **Random Forest Classifier** model for the Automation Risk which then forms a **Forest**.")
+    
+    st.subheader("Single Tree")
+    st.code("""
+            # Extract a single tree from the Random Forest
+            single_tree = clf_automation.estimators_[0]
+
+            # Plot the tree
+            plt.figure(figsize=(20, 10))
+            plot_tree(single_tree, feature_names=X1_train.columns, filled=True, rounded=True)
+            plt.show()
+            """)
+    
+    tree_viewer('automation', 'Automation Risk')
+    st.info("This graph shows **a single tree ** made by our **Random Forest Classifier** model. Pick any of its trees and how many levels to draw; each drawing is made from the current model file.")
+    
+    st.markdown("---")
+    
+    st.subheader("Training the Random Forest Classifier model for Growth Prediction")
+    
+    st.code("""
+    * clf_growthPrediction = joblib.load('models/RFC_GrowthPrediction.joblib')
+    * clf_growthPrediction.fit(X2_train, Y2_train)
+    
+    * y_pred = clf_growthPrediction.predict(X2_test)
+    """)
+    
+    st.subheader("Model Evaluation")
+    
+    st.code("""
+
+    train_accuracy = clf_growthPrediction.score(X2_train, Y2_train) #train daTa
+    test_accuracy = clf_growthPrediction.score(X2_test, Y2_test) #test daTa
+
+    print(f'Train Accuracy: {train_accuracy * 100:.2f}%')
+    print(f'Test Accuracy: {test_accuracy * 100:.2f}%')
+            
+    """)
+    show_training_results('growth')
+    st.info(""" We’re using a Random Forest Classifier to predict growth. The model achieves 100% accuracy on the training data, showing that it learned those patterns well. However, it only reaches 42% accuracy on the test data, suggesting potential overfitting, meaning it performs well on known data but struggles to generalize to new, unseen data.""")
+    
+    st.subheader("Feature Importance")
+    
+    st.code("""
+
+    feature_importance = clf_growthPrediction.feature_importances_
+    st.session_state['importance_df_Growth'] = importance_df_Growth.sort_values(by='Importance_Growth', ascending=False).reset_index(drop=True)
+    
+    """)
+    
+    rfc_feature_importance_df = stored_importance_df('growth')
+    if rfc_feature_importance_df is not None:
+        st.dataframe(rfc_feature_importance_df, use_container_width=True, hide_index=True)
+
+    
+    
+    def feature_importance_plot2(feature_importance_df, width=500, height=500, key='default'):
+        def build_figure():
+            # Generate a bar plot for feature importances
+            feature_importance_fig = px.bar(
+                feature_importance_df,
+                x='Importance',
+                y='Feature',
+                labels={'Importance': 'Importance Score', 'Feature': 'Feature'},
+                orientation='h'  # Horizontal bar plot
+            )
+
+            # Adjust the height and width
+            feature_importance_fig.update_layout(
+                width=width,  # Set the width
+                height=height  # Set the height
+            )
+            return feature_importance_fig
+
+        # Display the plot in Streamlit (rebuilt only when the model changes)
+        feature_importance_fig = figure_cache.get_figure('feature_importance', 'Feature', 'growth', model_registry.model_version('growth'), build_figure)
+        st.plotly_chart(feature_importance_fig, use_container_width=True, key=f"feature_importance_plot2_{key}")
+
+    # Call the function with appropriate arguments
+    if rfc_feature_importance_df is not None:
+        feature_importance_plot2(rfc_feature_importance_df, width=500, height=500, key='2')
+    
+    st.info("""
+    Upon running . `feature_importances` in the `Random Forest Classifier Model` to check how each Job Growth Projection's features influence the training of our model, it is clear that Salary_USD holds the most influence in our model's decisions having 0.2253 or 22% importance. This is followed by Location_encoded, and Skills_encoded which is closely behind of Salary_USD having 0.1388 or 13% importance followed closely by Skills_encoded with 0.14 or 14%.
+    """)
+    
+    st.subheader(f"Number of Trees: {len(clf_growthPrediction.estimators_)}")
+    st.code("""
+
+    print(f"Number of trees made: {len(clf_growthPrediction.estimators_)}")
+     
+    """)
+    
+    st.subheader("Plotting the Forest")
+    
+    st.code("""
+    
+    # Show all trees made
+
+    # Set up the dimensions for the plot grid (e.g., 10x10 grid for 100 trees)
+    n_estimators = 100
+    n_rows = 10
+    n_cols = 10
+
+    # Create a figure large enough to hold the grid of subplots
+    fig, axes = plt.subplots(n_rows, n_cols, figsize=(20, 20), dpi=50)
+
+    # Loop through each estimator and plot it
+    X2_train = st.session_state['X2_train']
+    
+    for i, tree in enumerate(clf_growthPrediction.estimators_[:n_estimators]):
+        row = i // n_cols
+        col = i % n_cols
+        ax = axes[row, col]
+        plot_tree(tree, feature_names=X2_train.columns, filled=True, rounded=True, ax=ax)
+        ax.set_title(f"Tree {i+1}", fontsize=6)
+        ax.axis('off')  # Turn off axis to reduce clutter
+
+    plt.tight_layout()
+    st.pyplot(plt) """)
+    
+    forest_viewer('growth', 'Job Growth Projection')
+    
+    st.info("This graph shows **all of the decision trees** made by our **Random Forest Classifier** model for the Job Growth Projection which then forms a **Forest**.")
+    
+    st.subheader("Single Tree")
+    st.code("""
+            # Extract a single tree from the Random Forest
+            single_tree = clf_growthPrediction.estimators_[0]
+
+            # Plot the tree
+            plt.figure(figsize=(20, 10))
+            plot_tree(single_tree, feature_names=X2_train.columns, filled=True, rounded=True)
+            plt.show()
+            """)
+    
+    tree_viewer('growth', 'Growth Prediction')
+    st.info("This graph shows **a single tree ** made by our **Random Forest Classifier** model. Pick any of its trees and how many levels to draw; each drawing is made from the current model file.")
+    
+    st.markdown("---")
+    
+    st.subheader("Training the Random Forest Classifier model for Salary Category")
+    
+    st.code("""
+    * clf_salary = joblib.load('models/RFC_Salary.joblib')
+    * clf_salary.fit(X4_train, Y4_train)
+    
+    * y_pred = clf_salary.predict(X4_test)
+    """)
+    
+    st.subheader("Model Evaluation")
+    
+    st.code("""
+
+    train_accuracy = clf_salary.score(X4_train, Y4_train) #train daTa
+    test_accuracy = clf_salary.score(X4_test, Y4_test) #test daTa
+
+    print(f'Train Accuracy: {train_accuracy * 100:.2f}%')
+    print(f'Test Accuracy: {test_accuracy * 100:.2f}%')
+            
+    """)
+    show_training_results('salary')
+    st.info("""We’re using a Random Forest Classifier to predict salary categories. The model achieves 100% accuracy on the training data, indicating it has learned those patterns thoroughly. However, with only 58% accuracy on the test data, it may be overfitting—doing well on familiar data but not generalizing effectively to new data. """)
+    
+    st.subheader("Feature Importance")
+    
+    st.code("""
+
+    feature_importance = clf_salary.feature_importances_
+    st.session_state['importance_df_Salary'] = importance_df_Salary.sort_values(by='Importance_Salary', ascending=False).reset_index(drop=True)
+    
+    """)
+    
+    rfc_feature_importance_df = stored_importance_df('salary')
+    if rfc_feature_importance_df is not None:
+        st.dataframe(rfc_feature_importance_df, use_container_width=True, hide_index=True)
+
+    
+    
+    def feature_importance_plot3(feature_importance_df, width=500, height=500, key='default'):
+        def build_figure():
+            # Generate a bar plot for feature importances
+            feature_importance_fig = px.bar(
+                feature_importance_df,
+                x='Importance',
+                y='Feature',
+                labels={'Importance': 'Importance Score', 'Feature': 'Feature'},
+                orientation='h'  # Horizontal bar plot
+            )
+
+            # Adjust the height and width
+            feature_importance_fig.update_layout(
+                width=width,  # Set the width
+                height=height  # Set the height
+            )
+            return feature_importance_fig
+
+        # Display the plot in Streamlit (rebuilt only when the model changes)
+        feature_importance_fig = figure_cache.get_figure('feature_importance', 'Feature', 'salary', model_registry.model_version('salary'), build_figure)
+        st.plotly_chart(feature_importance_fig, use_container_width=True, key=f"feature_importance_plot3_{key}")
+
+    # Call the function with appropriate arguments
+    if rfc_feature_importance_df is not None:
+        feature_importance_plot3(rfc_feature_importance_df, width=500, height=500, key='2')
+    
+    st.info("""
+    Upon running . `feature_importances` in the `Random Forest Classifier Model` to check how each Salary Category's features influence the training of our model, it is clear that Salary_USD holds the most influence in our model's decisions having 0.2253 or 22% importance. This is followed by Location_encoded, and Skills_encoded which is closely behind of Salary_USD having 0.1388 or 13% importance followed closely by Skills_encoded with 0.14 or 14%.
+    """)
+    
+    st.subheader(f"Number of Trees: {len(clf_salary.estimators_)}")
+    st.code("""
+
+    print(f"Number of trees made: {len(clf_salary.estimators_)}")
+     
+    """)
+    
+    st.subheader("Plotting the Forest")
+    
+    st.code("""
+    
+    # Show all trees made
+
+    # Set up the dimensions for the plot grid (e.g., 10x10 grid for 100 trees)
+    n_estimators = 100
+    n_rows = 10
+    n_cols = 10
+
+    # Create a figure large enough to hold the grid of subplots
+    fig, axes = plt.subplots(n_rows, n_cols, figsize=(20, 20), dpi=50)
+
+    # Loop through each estimator and plot it
+    X4_train = st.session_state['X4_train']
+    
+    for i, tree in enumerate(clf_salary.estimators_[:n_estimators]):
+        row = i // n_cols
+        col = i % n_cols
+        ax = axes[row, col]
+        plot_tree(tree, feature_names=X4_train.columns, filled=True, rounded=True, ax=ax)
+        ax.set_title(f"Tree {i+1}", fontsize=6)
+        ax.axis('off')  # Turn off axis to reduce clutter
+
+    plt.tight_layout()
+    st.pyplot(plt) """)
+    
+    forest_viewer('salary', 'Salary Category')
+    
+    st.info("This graph shows **all of the decision trees** made by our **Random Forest Classifier** model for the Salary Category which then forms a **Forest**.")
+    
+    st.subheader("Single Tree")
+    st.code("""
+            # Extract a single tree from the Random Forest
+            single_tree = clf_salary.estimators_[0]
+
+            # Plot the tree
+            plt.figure(figsize=(20, 10))
+            plot_tree(single_tree, feature_names=X4_train.columns, filled=True, rounded=True)
+            plt.show()
+            """)
+    
+    tree_viewer('salary', 'Salary Category')
+    st.info("This graph shows **a single tree ** made by our **Random Forest Classifier** model. Pick any of its trees and how many levels to draw; each drawing is made from the current model file.")
+
+    st.subheader("Training the 2nd Random Forest Classifier model for Salary Category")
+    
+    st.code("""
+    * clf_salary2nd = joblib.load('models/RFC_salary2nd.joblib')
+    * clf_salary2nd.fit(X5_train, Y5_train)
+    
+    * y_pred = clf_salary2nd.predict(X5_test)
+    """)
+    
+    st.subheader("Model Evaluation")
+    
+    st.code("""
+
+    train_accuracy = clf_salary2nd.score(X5_train, Y5_train) #train daTa
+    test_accuracy = clf_salary2nd.score(X5_test, Y5_test) #test daTa
+
+    print(f'Train Accuracy: {train_accuracy * 100:.2f}%')
+    print(f'Test Accuracy: {test_accuracy * 100:.2f}%')
+            
+    """)
+    show_training_results('salary2nd')
+    st.info(""" We’re training a second Random Forest Classifier to predict salary categories. The model achieves 99.17% accuracy on the training data, showing it has learned the patterns well. However, with 61.54% accuracy on the test data, it may still be somewhat overfitting, performing well on known data but less effectively on new data.""")
+    
+    st.subheader("Feature Importance")
+    
+    st.code("""
+
+    feature_importance = clf_salary2nd.feature_importances_
+    st.session_state['importance_df_Salary2nd'] = importance_df_Salary2nd.sort_values(by='Importance_Salary2nd', ascending=False).reset_index(drop=True)
+    
+    """)
+    
+    rfc_feature_importance_df = stored_importance_df('salary2nd')
+    if rfc_feature_importance_df is not None:
+        st.dataframe(rfc_feature_importance_df, use_container_width=True, hide_index=True)
+    
+    def feature_importance_plot4(feature_importance_df, width=500, height=500, key='default'):
+        def build_figure():
+            # Generate a bar plot for feature importances
+            feature_importance_fig = px.bar(
+                feature_importance_df,
+                x='Importance',
+                y='Feature',
+                labels={'Importance': 'Importance Score', 'Feature': 'Feature'},
+                orientation='h'  # Horizontal bar plot
+            )
+
+            # Adjust the height and width
+            feature_importance_fig.update_layout(
+                width=width,  # Set the width
+                height=height  # Set the height
+            )
+            return feature_importance_fig
+
+        # Display the plot in Streamlit (rebuilt only when the model changes)
+        feature_importance_fig = figure_cache.get_figure('feature_importance', 'Feature', 'salary2nd', model_registry.model_version('salary2nd'), build_figure)
+        st.plotly_chart(feature_importance_fig, use_container_width=True, key=f"feature_importance_plot4_{key}")
+
+    # Call the function with appropriate arguments
+    if rfc_feature_importance_df is not None:
+        feature_importance_plot4(rfc_feature_importance_df, width=500, height=500, key='2')
+    
+    st.info("""
+    Upon running . `feature_importances` in the `Random Forest Classifier Model` to check how each Salary Category's features influence the training of our model, it is clear that Salary_USD holds the most influence in our model's decisions having 0.2253 or 22% importance. This is followed by Location_encoded, and Skills_encoded which is closely behind of Salary_USD having 0.1388 or 13% importance followed closely by Skills_encoded with 0.14 or 14%.
+    """)
+
+    st.subheader(f"Number of Trees: {len(clf_salary2nd.estimators_)}")
+    st.code("""
+
+    print(f"Number of trees made: {len(clf_salary2nd.estimators_)}")
+     
+    """)
+    
+    st.subheader("Plotting the Forest")
+    
+    st.code("""
+    
+    # Show all trees made
+
+    # Set up the dimensions for the plot grid (e.g., 10x10 grid for 100 trees)
+    n_estimators = 100
+    n_rows = 10
+    n_cols = 10
+
+    # Create a figure large enough to hold the grid of subplots
+    fig, axes = plt.subplots(n_rows, n_cols, figsize=(20, 20), dpi=50)
+
+    # Loop through each estimator and plot it
+    X4_train = st.session_state['X5_train']
+    
+    for i, tree in enumerate(clf_salary2nd.estimators_[:n_estimators]):
+        row = i // n_cols
+        col = i % n_cols
+        ax = axes[row, col]
+        plot_tree(tree, feature_names=X5_train.columns, filled=True, rounded=True, ax=ax)
+        ax.set_title(f"Tree {i+1}", fontsize=6)
+        ax.axis('off')  # Turn off axis to reduce clutter
+
+    plt.tight_layout()
+    st.pyplot(plt) """)
+    
+    forest_viewer('salary2nd', 'Salary Category 2nd Training')
+    
+    st.info("This graph shows **all of the decision trees** made by our **Random Forest Classifier** model for the Salary Category 2nd Training which then forms a **Forest**.")
+    
+    st.subheader("Single Tree")
+    st.code("""
+            # Extract a single tree from the Random Forest
+            single_tree = clf_salary2nd.estimators_[0]
+
+            # Plot the tree
+            plt.figure(figsize=(20, 10))
+            plot_tree(single_tree, feature_names=X5_train.columns, filled=True, rounded=True)
+            plt.show()
+            """)
+    
+    tree_viewer('salary2nd', 'Salary Category 2nd Training')
+    st.info("This graph shows **a single tree ** made by our **Random Forest Classifier** model. Pick any of its trees and how many levels to draw; each drawing is made from the current model file.")
+    
+    st.markdown("---")
+
+    st.subheader("Forest Structure")
+    forest_structure()
+    st.info("Computed from the node arrays of every tree of the current model files: tree sizes and depths, how deep the leaves sit, memory per tree and how often each feature is used for a split. `train.py` stores the same summary in `models/metadata.json` so forests can be compared across retrains.")
+
+    st.subheader("Loaded Models")
+    st.dataframe(pd.DataFrame(model_registry.model_stats()), use_container_width=True, hide_index=True)
+    st.info("Each model is loaded once per server process and shared across all sessions. The table shows how long each one took to load and how much memory its trees use.")
+
+    st.subheader("Figure Cache")
+    st.dataframe(pd.DataFrame([figure_cache.stats()]), use_container_width=True, hide_index=True)
+    st.dataframe(pd.DataFrame([tree_render.stats()]), use_container_width=True, hide_index=True)
+    st.info("Charts are stored once per data or model version and shared across all sessions. Revisiting a page reuses them instead of rebuilding every figure. Tree drawings are cached the same way, per model version, tree and depth limit.")
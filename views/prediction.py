@@ -0,0 +1,290 @@
+"""Prediction page of the dashboard."""
+import time
+
+import streamlit as st
+import pandas as pd
+
+import data_store
+import model_registry
+import paged_table
+import prediction_cache
+import scoring
+
+
+def button_label(text, name):
+    # The stored test accuracy of model ``name``, as train.py last measured it
+    metadata = model_registry.model_metadata(name)
+    if metadata is None:
+        return text
+    return f"{text} (Accuracy: {metadata['test_accuracy'] * 100:.2f}%)"
+
+
+def render():
+    dataset = data_store.load_dataset()
+
+    st.markdown("<h1 style='text-align: center;'>🎲 Random Forest Classifier</h1>", unsafe_allow_html=True)
+
+    st.header("👀 Prediction")
+
+    # Your content for the PREDICTION page goes here
+    col_pred = st.columns((1, 3), gap='medium')
+    
+    # Initialize session state for clearing results
+    if 'clear' not in st.session_state:
+        st.session_state.clear = False
+    
+    
+    with col_pred[0]:
+        with st.expander('Options', expanded=True):
+            show_dataset = st.checkbox('Show Dataset')
+            show_classes = st.checkbox('Show All Prediction Classes')
+            
+            st.write("#### Automation Risk")
+            show_HighAutomationRisk = st.checkbox('Show High')
+            show_MediumAutomationRisk = st.checkbox('Show Medium')
+            show_LowAutomationRisk = st.checkbox('Show Low')
+            
+            st.write("#### Growth Prediction")
+            show_Growth = st.checkbox('Show Growth')
+            show_Decline = st.checkbox('Show Decline')
+            show_Stable = st.checkbox('Show Stable')
+            
+            st.write("#### Salary Category")
+            show_Entry = st.checkbox('Show Entry Level')
+            show_Mid = st.checkbox('Show Mid Level')
+            show_Senior = st.checkbox('Show Senior Level')
+
+            clear_results = st.button('Clear Results', key='clear_results')
+
+            if clear_results:
+                st.session_state.clear = True
+
+    
+    with col_pred[1]:
+        prediction_panel()
+
+    # Rows of each class come from data_store's category index, built once per data version
+
+    if show_dataset:
+        # Display the dataset
+        st.subheader("Dataset")
+        paged_table.paged_dataframe(dataset, key='prediction_dataset', hide_index=True)
+
+    if show_classes:
+        st.subheader("High Automation Risk")
+        st.dataframe(data_store.class_rows('Automation_Risk', 'High', 5), use_container_width=True, hide_index=True)
+        st.subheader("Medium Automation Risk")
+        st.dataframe(data_store.class_rows('Automation_Risk', 'Medium', 5), use_container_width=True, hide_index=True)
+        st.subheader("Low Automation Risk")
+        st.dataframe(data_store.class_rows('Automation_Risk', 'Low', 5), use_container_width=True, hide_index=True)
+        st.subheader("Growth Projection: Growth")
+        st.dataframe(data_store.class_rows('Job_Growth_Projection', 'Growth', 5), use_container_width=True, hide_index=True)
+        st.subheader("Growth Projection: Stable")
+        st.dataframe(data_store.class_rows('Job_Growth_Projection', 'Stable', 5), use_container_width=True, hide_index=True)
+        st.subheader("Growth Projection: Decline")
+        st.dataframe(data_store.class_rows('Job_Growth_Projection', 'Decline', 5), use_container_width=True, hide_index=True)
+        st.subheader("Entry Level Salary")
+        st.dataframe(data_store.class_rows('Salary_Category', 'Entry Level', 5), use_container_width=True, hide_index=True)
+        st.subheader("Mid Level Salary")
+        st.dataframe(data_store.class_rows('Salary_Category', 'Mid Level', 5), use_container_width=True, hide_index=True) 
+        st.subheader("Senior Level Salary")
+        st.dataframe(data_store.class_rows('Salary_Category', 'Senior Level', 5), use_container_width=True, hide_index=True)
+        
+    #Automation Risk
+
+    if show_HighAutomationRisk:
+        st.subheader("High Automation Risk")
+        paged_table.paged_dataframe(data_store.class_rows('Automation_Risk', 'High'), key='class_Automation_Risk_High', hide_index=True)
+    
+    if show_MediumAutomationRisk:
+        st.subheader("Medium Automation Risk")
+        paged_table.paged_dataframe(data_store.class_rows('Automation_Risk', 'Medium'), key='class_Automation_Risk_Medium', hide_index=True)
+        
+    if show_LowAutomationRisk:
+        st.subheader("Low Automation Risk")
+        paged_table.paged_dataframe(data_store.class_rows('Automation_Risk', 'Low'), key='class_Automation_Risk_Low', hide_index=True)
+        
+    #JobGrowth Projection
+
+    if show_Growth:
+        st.subheader("Growth Projection: Growth")
+        paged_table.paged_dataframe(data_store.class_rows('Job_Growth_Projection', 'Growth'), key='class_Job_Growth_Projection_Growth', hide_index=True)
+    
+    if show_Stable:
+        st.subheader("Growth Projection: Stable")
+        paged_table.paged_dataframe(data_store.class_rows('Job_Growth_Projection', 'Stable'), key='class_Job_Growth_Projection_Stable', hide_index=True)
+        
+    if show_Decline:
+        st.subheader("Growth Projection: Decline")
+        paged_table.paged_dataframe(data_store.class_rows('Job_Growth_Projection', 'Decline'), key='class_Job_Growth_Projection_Decline', hide_index=True)
+        
+    #Salary Category
+
+    if show_Entry:
+        st.subheader("Entry Level Salary")
+        paged_table.paged_dataframe(data_store.class_rows('Salary_Category', 'Entry Level'), key='class_Salary_Category_Entry_Level', hide_index=True)
+    
+    if show_Mid:
+        st.subheader("Mid Level Salary")
+        paged_table.paged_dataframe(data_store.class_rows('Salary_Category', 'Mid Level'), key='class_Salary_Category_Mid_Level', hide_index=True)
+        
+    if show_Senior:
+        st.subheader("Senior Level Salary")
+        paged_table.paged_dataframe(data_store.class_rows('Salary_Category', 'Senior Level'), key='class_Salary_Category_Senior_Level', hide_index=True)
+
+    #Batch Prediction
+
+    st.markdown("---")
+    st.subheader("Batch Prediction")
+    st.write(f"Upload a CSV of job postings with the same columns as the dataset to predict the Automation Risk, Growth Projection and Salary Category of every row at once. Required columns: {', '.join(scoring.required_columns())}.")
+
+    uploaded_file = st.file_uploader('Upload job postings (CSV)', type='csv', key='batch_upload')
+
+    if uploaded_file is not None:
+        # Score each uploaded file once per session, chunk by chunk
+        if st.session_state.get('batch_file_id') != uploaded_file.file_id:
+            batch_status = st.empty()
+            try:
+                batch_scored = scoring.score_csv(uploaded_file, progress=lambda rows: batch_status.text(f"Scored {rows:,} rows..."))
+            except (ValueError, pd.errors.ParserError) as e:
+                batch_status.empty()
+                st.error(f"Could not score the uploaded file: {e}")
+            else:
+                batch_status.empty()
+                st.session_state.batch_file_id = uploaded_file.file_id
+                st.session_state.batch_scored = batch_scored
+                st.session_state.batch_csv = batch_scored.to_csv(index=False).encode('utf-8')
+
+        if st.session_state.get('batch_file_id') == uploaded_file.file_id:
+            batch_scored = st.session_state.batch_scored
+            label_columns = [label_col for label_col, _ in scoring.PREDICTION_COLUMNS.values()]
+            unscored = batch_scored[label_columns].isna().any(axis=1).sum()
+
+            st.write(f"Scored **{len(batch_scored):,}** job postings.")
+            if unscored:
+                st.warning(f"{unscored:,} rows contain values the models have never seen and were left without some predictions.")
+            st.dataframe(batch_scored.head(100), use_container_width=True, hide_index=True)
+            st.download_button('Download Predictions (CSV)', data=st.session_state.batch_csv, file_name='job_postings_predictions.csv', mime='text/csv')
+
+
+@st.fragment
+def prediction_panel():
+    # Runs as a fragment: changing an input or pressing a prediction button
+    # re-executes only this function, not the rest of the page
+    start = time.perf_counter()
+    dataset = data_store.load_dataset()
+
+    col_input = st.columns((1, 1, 1), gap='medium')
+
+    with col_input[0]:
+       
+        
+        # Input boxes for the features
+        
+        #JobTitle
+        job_titles = dataset['Job_Title'].unique()
+        selected_job = st.radio('Select Job Title', options=job_titles)
+        #Industry
+        industry = dataset['Industry'].unique()
+        selected_industry = st.radio('Select Industry', options=industry)
+    with col_input[1]:
+        #Size
+        companySize = dataset['Company_Size'].unique()
+        selected_size = st.radio('Select Company Size', options=companySize)
+        #Location
+        location = dataset['Location'].unique()
+        selected_location = st.radio('Select Location', options=location)
+        #AI_Adoption
+        aiAdoption = dataset['AI_Adoption_Level'].unique()
+        selected_aiAdoption = st.radio('Select AI Adoption', options=aiAdoption)
+    with col_input[2]:
+        #Skills
+        skills = dataset['Required_Skills'].unique()
+        selected_skills = st.radio('Select Skills', options=skills)
+        #Remote
+        remote = dataset['Remote_Friendly'].unique()
+        selected_remote = st.radio('Remote Friendly?', options=remote)
+        #Growth
+        growth = dataset['Job_Growth_Projection'].unique()
+        selected_growth = st.radio('Select Growth Projection', options=growth)
+        #AutomationRisk
+        automationRisk = dataset['Automation_Risk'].unique()
+        selected_automationRisk = st.radio('Select Automation Risk', options=automationRisk)
+        
+        #Salary
+        dt_SalaryUSD = st.number_input('Input Salary USD', min_value=0.0, max_value=5000000.0, step=10000.00, key='dt_SalaryUSD', value=0.0 if st.session_state.clear else st.session_state.get('dt_SalaryUSD', 0.0))
+    
+    # Raw inputs; each model encodes and scales them with its own stored preprocessor
+    dt_inputs = {
+        'Job_Title': selected_job,
+        'Industry': selected_industry,
+        'Company_Size': selected_size,
+        'Location': selected_location,
+        'AI_Adoption_Level': selected_aiAdoption,
+        'Required_Skills': selected_skills,
+        'Remote_Friendly': selected_remote,
+        'Salary_USD': dt_SalaryUSD,
+        'Job_Growth_Projection': selected_growth,
+        'Automation_Risk': selected_automationRisk,
+    }
+    dt_encoded = prediction_cache.Inputs(dt_inputs)
+
+    with col_input[0]:    
+        #Automation Risk Detection
+        
+        automation_classes_list = ['High', 'Low', 'Medium']
+        with st.expander('Pick which to predict: ', expanded=True):
+            # Button to detect the Automation Risk
+            if st.button(button_label('Detect Automation Risk', 'automation'), key='dt_detectAutomation'):
+                # Predict the Automation (answers for repeated inputs come from the shared cache)
+                dt_prediction, dt_probabilities = prediction_cache.predict('automation', dt_encoded)
+                
+                # Display the prediction result
+                st.markdown(f'The predicted Automation Risk is: `{automation_classes_list[dt_prediction]}`')
+                
+            #Growth Projection Detection
+
+            growth_classes_list = ['Decline', 'Growth', 'Stable']
+            
+            # Button to detect the Growth Projection
+            if st.button(button_label('Detect Growth Projection', 'growth'), key='dt_detectGrowth'):
+                # Predict the Growth
+                dt_prediction, dt_probabilities = prediction_cache.predict('growth', dt_encoded)
+                
+                # Display the prediction result
+                st.markdown(f'The predicted Growth Projection is: `{growth_classes_list[dt_prediction]}`')
+                
+            #Salary Category Detection
+
+            salary_classes_list = [ 'Mid Level', 'Senior Level']
+            
+            # Button to detect the Salary Category
+            if st.button(button_label('Detect Salary Category', 'salary2nd'), key='dt_salaryCategory'):
+                # Predict the Salary (a single lookup in the precomputed probability table)
+                dt_prediction, dt_probabilities = prediction_cache.predict('salary2nd', dt_encoded)
+                
+                # Display the prediction result
+                st.markdown(f'The predicted Salary Category is: `{salary_classes_list[dt_prediction]}`')
+
+            # Button to predict all three targets from the same inputs at once
+            if st.button('Predict All', key='dt_predictAll'):
+                dt_results = prediction_cache.predict_all(dt_encoded)
+                dt_class_lists = {'automation': automation_classes_list, 'growth': growth_classes_list, 'salary2nd': salary_classes_list}
+                dt_targets = {'automation': 'Automation Risk', 'growth': 'Growth Projection', 'salary2nd': 'Salary Category'}
+
+                dt_all_df = pd.DataFrame([
+                    {
+                        'Target': dt_targets[name],
+                        'Prediction': dt_class_lists[name][code],
+                        'Confidence': f"{max(probabilities):.2%}",
+                    }
+                    for name, (code, probabilities) in dt_results.items()
+                ])
+                st.dataframe(dt_all_df, use_container_width=True, hide_index=True)
+
+        with st.expander('Prediction Cache'):
+            st.markdown(f'Predictions are cached across all sessions. Salary is rounded to the nearest {prediction_cache.SALARY_BUCKET_USD:,.0f} USD before predicting.')
+            st.dataframe(pd.DataFrame([prediction_cache.cache.stats()]), use_container_width=True, hide_index=True)
+
+    st.session_state.prediction_panel_ms = (time.perf_counter() - start) * 1000
+    st.caption(f"Inputs and predictions updated in {st.session_state.prediction_panel_ms:.1f} ms.")
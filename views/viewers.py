@@ -0,0 +1,113 @@
+"""Tree and forest viewers of the Machine Learning page.
+
+Kept out of views/common.py so the Data Cleaning page does not import the
+tree renderer, the asset builder or the tile reader.
+"""
+import base64
+import functools
+import threading
+
+import streamlit as st
+
+import build_assets
+import model_registry
+import tiles
+import tree_render
+
+# Trees requested during a full run of a page, drawn once the rest of it is shown
+_deferred = threading.local()
+
+# Tiles shown at once by the forest viewer, per side
+FOREST_VIEWPORT_TILES = 4
+
+
+# Tree viewer
+
+def draws_deferred_trees(render):
+    """Decorate a page's render() so tree viewers never hold up the rest of the page.
+
+    During a full run the viewers only reserve a placeholder; the trees are
+    waited for and drawn after the whole page has been sent.
+    """
+    @functools.wraps(render)
+    def wrapper():
+        _deferred.trees = []
+        try:
+            render()
+            for placeholder, future, caption in _deferred.trees:
+                show_tree(placeholder, future, caption)
+        finally:
+            _deferred.trees = None
+    return wrapper
+
+def show_tree(placeholder, future, caption):
+    try:
+        placeholder.image(future.result(), caption=caption, use_container_width=True)
+    except Exception as e:
+        placeholder.error(f"Could not draw the tree: {e}")
+
+@st.fragment
+def tree_viewer(name, title):
+    clf = model_registry.get_model(name)
+
+    controls = st.columns((1, 1))
+    index = controls[0].number_input('Tree', min_value=0, max_value=len(clf.estimators_) - 1, value=0, step=1, key=f"tree_viewer_{name}_index")
+    max_depth = controls[1].selectbox('Depth limit', tree_render.DEPTH_LIMITS, index=1, format_func=lambda depth: 'Full tree' if depth is None else str(depth), key=f"tree_viewer_{name}_depth")
+
+    future = tree_render.request_svg(name, int(index), max_depth)
+    caption = f'Random Forest classifier - {title} - Tree {int(index)} of {len(clf.estimators_)}'
+    placeholder = st.empty()
+    pending = getattr(_deferred, 'trees', None)
+    if future.done() or pending is None:
+        # Cached, or a rerun of just this viewer: nothing else is waiting on it
+        if not future.done():
+            placeholder.info(f"Drawing tree {int(index)}...")
+        show_tree(placeholder, future, caption)
+    else:
+        placeholder.info(f"Drawing tree {int(index)}...")
+        pending.append((placeholder, future, caption))
+
+
+# Forest viewer
+
+def _tile_img(path, level, row, col, width, height):
+    data = base64.b64encode(tiles.read_tile(path, level, row, col)).decode('ascii')
+    return f'<img src="data:image/webp;base64,{data}" width="{width}" height="{height}" style="display:block">'
+
+@st.fragment
+def forest_viewer(name, title):
+    """Show the forest grid of ``name`` from its tile pyramid, sending only the tiles in view."""
+    caption = f'Random Forest classifier - {title} - Tree Plot'
+    path = build_assets.tile_path(name)
+    meta = tiles.read_meta(path)
+    if meta is None:
+        # No tiles built yet: fall back to the single downscaled image
+        st.image(build_assets.asset_paths(name)['forest'], caption=caption)
+        return
+
+    # Start at the deepest level that fits in the viewport, i.e. the whole forest
+    levels = meta['levels']
+    fit = max([level for level in range(levels) if max(tiles.level_grid(meta, level)) <= FOREST_VIEWPORT_TILES] or [0])
+    controls = st.columns(3)
+    level = controls[0].select_slider('Zoom', options=list(range(fit, levels)), value=fit, format_func=lambda level: f"{2 ** (level - fit)}x", key=f"forest_viewer_{name}_zoom")
+
+    rows, cols = tiles.level_grid(meta, level)
+    top = left = 0
+    if rows > FOREST_VIEWPORT_TILES:
+        top = controls[1].slider('Pan down', 0, rows - FOREST_VIEWPORT_TILES, 0, key=f"forest_viewer_{name}_top_{level}")
+    if cols > FOREST_VIEWPORT_TILES:
+        left = controls[2].slider('Pan right', 0, cols - FOREST_VIEWPORT_TILES, 0, key=f"forest_viewer_{name}_left_{level}")
+
+    visible_rows = range(top, min(top + FOREST_VIEWPORT_TILES, rows))
+    visible_cols = range(left, min(left + FOREST_VIEWPORT_TILES, cols))
+    columns = ' '.join(f"{tiles.tile_size(meta, level, top, col)[0]}px" for col in visible_cols)
+    images = []
+    for row in visible_rows:
+        for col in visible_cols:
+            images.append(_tile_img(path, level, row, col, *tiles.tile_size(meta, level, row, col)))
+    html = ''.join(images)
+    st.markdown(
+        f'<div style="overflow:auto;max-width:100%"><div style="display:grid;grid-template-columns:{columns};width:max-content">{html}</div></div>',
+        unsafe_allow_html=True,
+    )
+    st.caption(f"{caption} - {len(images)} of {rows * cols} tiles at {meta['sizes'][level][0]}x{meta['sizes'][level][1]} px ({len(html) * 3 // 4 // 1024} KB)")
@@ -0,0 +1,172 @@
+"""Persisted categorical vocabularies for the encoded model features.
+
+Each vocabulary is the sorted list of classes a LabelEncoder would learn for
+that column, so the codes are identical to the ones the models were trained on.
+They are stored in models/vocabularies.json next to the models and loaded once
+per process. Encoding a single value is a dictionary lookup and encoding a
+column is one vectorized categorical lookup.
+
+Run ``python vocabularies.py`` to refit the vocabularies from data/AI.csv.
+"""
+import json
+import os
+import sys
+import threading
+
+import numpy as np
+import pandas as pd
+
+import atomic_io
+import data_store
+
+VOCAB_FORMAT_VERSION = 1
+VOCAB_PATH = os.path.join(data_store.BASE_DIR, 'models', 'vocabularies.json')
+
+# Source column -> encoded column, in the order df_data has always used
+ENCODED_COLUMNS = {
+    'Job_Title': 'Job_encoded',
+    'Industry': 'Industry_encoded',
+    'Company_Size': 'Size_encoded',
+    'Location': 'Location_encoded',
+    'AI_Adoption_Level': 'AI_Adoption_encoded',
+    'Automation_Risk': 'Automation_encoded',
+    'Required_Skills': 'Skills_encoded',
+    'Remote_Friendly': 'Remote_encoded',
+    'Job_Growth_Projection': 'Growth_encoded',
+    'Salary_Category': 'Salary_encoded',
+}
+
+# Model feature -> the source column it is computed from; Salary_USD is used as is
+SOURCE_COLUMNS = {encoded: col for col, encoded in ENCODED_COLUMNS.items()}
+SOURCE_COLUMNS['Salary_USD'] = 'Salary_USD'
+
+_loaded = {}
+_encoded_frames = {}
+_lock = threading.Lock()
+
+
+class Vocabularies:
+    """Fitted classes for every encoded column, with O(1) value lookups."""
+
+    def __init__(self, classes, data_version=None):
+        self.classes = {col: list(values) for col, values in classes.items()}
+        self.data_version = data_version
+        self._codes = {
+            col: {value: code for code, value in enumerate(values)}
+            for col, values in self.classes.items()
+        }
+
+    @classmethod
+    def fit(cls, df, data_version=None):
+        classes = {
+            col: sorted(str(value) for value in df[col].dropna().unique())
+            for col in ENCODED_COLUMNS
+        }
+        return cls(classes, data_version)
+
+    def encode_value(self, column, value):
+        try:
+            return self._codes[column][value]
+        except KeyError:
+            raise ValueError(f"Unknown {column} value: {value!r}") from None
+
+    def decode_value(self, column, code):
+        return self.classes[column][code]
+
+    def encode_column(self, column, values, strict=True):
+        # Categorical codes against the stored classes; unknown values become -1
+        codes = pd.Categorical(values, categories=self.classes[column]).codes.astype(np.int64)
+        if strict and (codes < 0).any():
+            unknown = sorted({str(v) for v, c in zip(values, codes) if c < 0})
+            raise ValueError(f"Unknown {column} values: {', '.join(unknown)}")
+        return codes
+
+    def to_dict(self):
+        return {
+            'format_version': VOCAB_FORMAT_VERSION,
+            'data_version': self.data_version,
+            'columns': {
+                col: {'encoded': ENCODED_COLUMNS[col], 'classes': self.classes[col]}
+                for col in ENCODED_COLUMNS
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, payload):
+        if payload.get('format_version') != VOCAB_FORMAT_VERSION:
+            raise ValueError(f"Unsupported vocabulary format: {payload.get('format_version')}")
+        classes = {col: spec['classes'] for col, spec in payload['columns'].items()}
+        return cls(classes, payload.get('data_version'))
+
+
+def save_vocabularies(vocab, path=VOCAB_PATH):
+    atomic_io.write_json(path, vocab.to_dict(), indent=2)
+
+
+def build_vocabularies(csv_path=data_store.CSV_PATH, path=VOCAB_PATH):
+    df = data_store.load_dataset(csv_path)
+    vocab = Vocabularies.fit(df, data_store.data_version(csv_path))
+    save_vocabularies(vocab, path)
+    return vocab
+
+
+def vocab_version(path=VOCAB_PATH):
+    # The file's mtime and size change whenever the vocabularies are rebuilt
+    stat = os.stat(path)
+    return (path, stat.st_mtime_ns, stat.st_size)
+
+
+def load_vocabularies(path=VOCAB_PATH):
+    """Return the stored vocabularies, loading them once per file version."""
+    if not os.path.exists(path):
+        with _lock:
+            if not os.path.exists(path):
+                build_vocabularies(path=path)
+
+    key = vocab_version(path)
+    vocab = _loaded.get(key)
+    if vocab is None:
+        with _lock:
+            vocab = _loaded.get(key)
+            if vocab is None:
+                with open(path) as f:
+                    vocab = Vocabularies.from_dict(json.load(f))
+                _loaded.clear()
+                _loaded[key] = vocab
+    return vocab
+
+
+def encode_frame(df, vocab=None, strict=True):
+    """Encode every vocabulary column present in ``df`` into a new frame."""
+    vocab = vocab or load_vocabularies()
+    encoded = pd.DataFrame(index=df.index)
+    for col, encoded_col in ENCODED_COLUMNS.items():
+        if col in df.columns:
+            encoded[encoded_col] = vocab.encode_column(col, df[col], strict=strict)
+    if 'Salary_USD' in df.columns:
+        encoded['Salary_USD'] = df['Salary_USD']
+    return encoded
+
+
+def encoded_frame(csv_path=data_store.CSV_PATH):
+    """The encoded dataset (df_data), built once per data and vocabulary version.
+
+    Shared across callers, so treat it as read-only.
+    """
+    vocab = load_vocabularies()
+    # Keyed by the file version like load_vocabularies; an object's id can be reused once it is dropped
+    key = (data_store.data_version(csv_path), vocab_version())
+    df_data = _encoded_frames.get(key)
+    if df_data is None:
+        df_data = encode_frame(data_store.load_dataset(csv_path), vocab)
+        _encoded_frames.clear()
+        _encoded_frames[key] = df_data
+    return df_data
+
+
+if __name__ == '__main__':
+    csv_path = sys.argv[1] if len(sys.argv) > 1 else data_store.CSV_PATH
+    vocab = build_vocabularies(csv_path)
+    for col, classes in vocab.classes.items():
+        print(f"{col}: {len(classes)} classes")
+    print(f"Saved to {VOCAB_PATH}")